@@ -85,6 +85,9 @@ except ImportError:
     ENHANCED_FEATURES = False
     print("Warning: Enhanced features not available. Using basic functionality.")
 
+# Instruction types that consult the branch predictor at issue
+_CONTROL_FLOW_TYPES = frozenset((InstructionType.BRANCH, InstructionType.JUMP))
+
 
 class SuperscalarSimulator:
     """
@@ -580,7 +583,8 @@ class SuperscalarSimulator:
         _is_enhanced_renaming = hasattr(self.register_renaming, "rob_size")
 
         # Enhanced simulation loop with cycle-accurate execution and multi-issue
-        total_instructions = len(getattr(self, "parsed_instructions", []))
+        program = getattr(self, "parsed_instructions", [])
+        total_instructions = len(program)
         program_done = False  # True when all instructions issued or syscall hit
         stall_cycles_count = 0  # Track consecutive cycles with no progress
 
@@ -628,18 +632,16 @@ class SuperscalarSimulator:
                     and pc < total_instructions
                     and not stall_this_cycle
                 ):
-                    instruction = self.parsed_instructions[pc]
+                    instruction = program[pc]
 
-                    # Detect syscall — end of program
-                    if instruction.opcode.upper() == "SYSCALL":
+                    # Detect syscall — end of program (opcodes are
+                    # normalized to upper case at construction)
+                    if instruction.opcode == "SYSCALL":
                         program_done = True
                         break
 
                     # Branch prediction: predict when encountering a branch/jump
-                    if instruction.instruction_type in [
-                        InstructionType.BRANCH,
-                        InstructionType.JUMP,
-                    ]:
+                    if instruction.instruction_type in _CONTROL_FLOW_TYPES:
                         self.branch_predictor.predict(instruction.address)
                         # Track for later update
                         branch_instructions[instruction_id] = instruction
@@ -807,11 +809,7 @@ class SuperscalarSimulator:
                 ipc_now = instructions_completed / cycles if cycles > 0 else 0
                 snapshot = PipelineSnapshot(
                     cycle=cycles,
-                    fetch=[
-                        f"PC={pc}"
-                        if pc < len(getattr(self, "parsed_instructions", []))
-                        else ""
-                    ],
+                    fetch=[f"PC={pc}" if pc < total_instructions else ""],
                     decode=[],
                     issue=[],
                     execute=[
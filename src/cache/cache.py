@@ -7,9 +7,10 @@ including instruction cache, data cache, and main memory.
 
 from __future__ import annotations
 
+from array import array
 from collections import OrderedDict
 import logging
-from typing import Any, List, Optional
+from typing import Any, Iterable, List, Optional
 
 
 class CacheBlock:
@@ -68,12 +69,19 @@ class Cache:
         self.num_sets = self.num_blocks // associativity
         self.index_bits = (self.num_sets - 1).bit_length()
         self.offset_bits = (block_size - 1).bit_length()
+        self._offset_mask = (1 << self.offset_bits) - 1
+        self._index_mask = (1 << self.index_bits) - 1
+        self._tag_shift = self.offset_bits + self.index_bits
 
         # Initialize cache structure
         self.cache: dict[int, list[CacheBlock | None]] = {}
         for i in range(self.num_sets):
             self.cache[i] = [None] * associativity
 
+        # Per-set tag -> way of the valid block holding it (the lowest way
+        # if several do), so lookups don't scan every way
+        self._tag_ways: list[dict[int, int]] = [{} for _ in range(self.num_sets)]
+
         # Statistics
         self.hits = 0
         self.misses = 0
@@ -87,18 +95,42 @@ class Cache:
 
     def _parse_address(self, address: int) -> tuple[int, int, int]:
         """Parse address into tag, index, and offset."""
-        offset = address & ((1 << self.offset_bits) - 1)
-        index = (address >> self.offset_bits) & ((1 << self.index_bits) - 1)
-        tag = address >> (self.offset_bits + self.index_bits)
+        offset = address & self._offset_mask
+        index = (address >> self.offset_bits) & self._index_mask
+        tag = address >> self._tag_shift
         return tag, index, offset
 
     def _find_block(self, tag: int, index: int) -> tuple[int, CacheBlock] | None:
         """Find block in cache set."""
+        way = self._tag_ways[index].get(tag)
+        if way is None:
+            return None
+        return way, self.cache[index][way]  # type: ignore[return-value]
+
+    def _install_block(self, index: int, way: int, block: CacheBlock) -> None:
+        """Place a valid block in a way, replacing whatever was there."""
         cache_set = self.cache[index]
-        for way, block in enumerate(cache_set):
+        old_block = cache_set[way]
+        cache_set[way] = block
+        if old_block is not None and old_block.valid:
+            self._unmap_block(index, way, old_block.tag)
+
+        tag_ways = self._tag_ways[index]
+        mapped = tag_ways.get(block.tag)
+        if mapped is None or way < mapped:
+            tag_ways[block.tag] = way
+
+    def _unmap_block(self, index: int, way: int, tag: int) -> None:
+        """Drop a way that no longer holds tag from the set's tag index."""
+        tag_ways = self._tag_ways[index]
+        if tag_ways.get(tag) != way:
+            return
+        del tag_ways[tag]
+        # Another valid copy of the tag (load_block can create one) takes over
+        for other_way, block in enumerate(self.cache[index]):
             if block and block.valid and block.tag == tag:
-                return way, block
-        return None
+                tag_ways[tag] = other_way
+                return
 
     def _find_replacement_way(self, index: int) -> int:
         """Find way to replace using replacement policy."""
@@ -213,9 +245,60 @@ class Cache:
         if self.write_policy == "write_back":
             new_block.dirty = True
 
-        self.cache[index][way] = new_block
+        self._install_block(index, way, new_block)
         return True
 
+    def write_many(self, addresses: Iterable[int], values: Iterable[Any]) -> int:
+        """
+        Write a sequence of values, one per address.
+
+        Equivalent to calling write() for each pair in order (same data,
+        statistics and replacement decisions), but a run of writes landing in
+        the same block reuses that block instead of splitting the address and
+        looking it up again, which makes bulk fills such as program preload
+        roughly one lookup per block.
+
+        Args:
+            addresses: Memory addresses to write
+            values: Data to write, paired with addresses
+
+        Returns:
+            Number of writes performed
+
+        Raises:
+            ValueError: If addresses and values differ in length (pairs
+                before the shorter one runs out are still written)
+        """
+        offset_mask = self._offset_mask
+        offset_bits = self.offset_bits
+        write_back = self.write_policy == "write_back"
+        block_addr = -1
+        block: CacheBlock | None = None
+        count = 0
+
+        for address, data in zip(addresses, values, strict=True):
+            count += 1
+            offset = address & offset_mask
+            if (
+                address >> offset_bits == block_addr and offset < len(block.data)  # type: ignore[union-attr]
+            ):
+                # Same block as the previous write: it was hit or just
+                # allocated, and nothing in between could have evicted it
+                block.access()  # type: ignore[union-attr]
+                block.data[offset] = data  # type: ignore[union-attr]
+                if write_back:
+                    block.dirty = True  # type: ignore[union-attr]
+                self.hits += 1
+                continue
+
+            self.write(address, data)
+            tag, index, _ = self._parse_address(address)
+            found = self._find_block(tag, index)
+            block = found[1] if found else None
+            block_addr = address >> offset_bits if block is not None else -1
+
+        return count
+
     def load_block(self, address: int, block_data: list[Any]) -> None:
         """Load a complete block into cache."""
         tag, index, offset = self._parse_address(address)
@@ -230,7 +313,7 @@ class Cache:
 
         # Load new block
         new_block = CacheBlock(tag, block_data[: self.block_size])
-        self.cache[index][way] = new_block
+        self._install_block(index, way, new_block)
 
     def invalidate(self, address: int) -> None:
         """Invalidate cache block containing address."""
@@ -239,6 +322,7 @@ class Cache:
         if result:
             way, block = result
             block.valid = False
+            self._unmap_block(index, way, tag)
 
     def flush(self) -> None:
         """Flush all dirty blocks and invalidate cache."""
@@ -249,6 +333,7 @@ class Cache:
                     self.writebacks += 1
                     # In real implementation, would write back to memory
                 self.cache[index][way] = None
+            self._tag_ways[index].clear()
 
     def get_hit_rate(self) -> float:
         """Get cache hit rate as percentage."""
@@ -376,6 +461,28 @@ class InstructionCache(Cache):
         if self.prefetch_enabled:
             self._prefetch(address)
 
+    def add_instructions(self, instructions: dict[int, dict[str, Any]]) -> None:
+        """
+        Add many instructions to the cache at once.
+
+        Leaves the cache in the same state as calling add_instruction() for
+        each entry in order, but fills the instruction storage with a single
+        update and the cache blocks through write_many().
+
+        Args:
+            instructions: Instruction data dictionaries keyed by address
+        """
+        if not instructions:
+            return
+
+        self.instruction_storage.update(instructions)
+        self.write_many(instructions.keys(), instructions.values())
+
+        # Prefetch has no effect on cache state, so only the last address
+        # of the load needs to look ahead
+        if self.prefetch_enabled:
+            self._prefetch(next(reversed(instructions)))
+
     def fetch_instructions(
         self, start_address: int, count: int
     ) -> list[dict[str, Any] | None]:
@@ -495,8 +602,11 @@ class DataCache(Cache):
         Returns:
             True if successful
         """
-        # Add to store buffer
-        if len(self.store_buffer) >= self.store_buffer_size:
+        # Add to store buffer; a repeated address becomes the newest entry
+        # instead of pushing out an unrelated older one
+        if address in self.store_buffer:
+            self.store_buffer.move_to_end(address)
+        elif len(self.store_buffer) >= self.store_buffer_size:
             # Remove oldest entry
             self.store_buffer.popitem(last=False)
 
@@ -561,6 +671,12 @@ class Memory:
     - Configurable access latency
     - Bandwidth limitations
     - Memory access statistics
+
+    Each address holds one value. Cells live in a signed 64-bit array, which
+    holds both signed and unsigned 32-bit register values without a boxed
+    int per address; the first write of a value that doesn't fit (a float,
+    an object, an integer wider than 64 bits) converts the backing store to
+    a plain list so any value can still be stored.
     """
 
     def __init__(
@@ -577,7 +693,7 @@ class Memory:
         self.size = size
         self.access_latency = access_latency
         self.bandwidth = bandwidth
-        self.data = [0] * size
+        self.data: array[int] | list[Any] = array("q", [0]) * size
 
         # Statistics
         self.read_count = 0
@@ -620,7 +736,7 @@ class Memory:
         if size == 1:
             return self.data[address]
         else:
-            return self.data[address : address + size]
+            return self._slice(address, address + size)
 
     def write(self, address: int, data: Any, size: int = None) -> None:  # type: ignore[assignment]
         """
@@ -637,7 +753,7 @@ class Memory:
                 raise MemoryAccessError(
                     f"Memory write out of range: {address + actual_size} > {self.size}"
                 )
-            self.data[address : address + actual_size] = data
+            self._store(address, data)
         else:
             actual_size = size or 4  # Default to 4 bytes
             if address + actual_size > self.size:
@@ -645,12 +761,8 @@ class Memory:
                     f"Memory write out of range: {address + actual_size} > {self.size}"
                 )
 
-            if actual_size == 1:
-                self.data[address] = data
-            else:
-                # For multi-byte writes, replicate the value
-                for i in range(actual_size):
-                    self.data[address + i] = data
+            # For multi-byte writes, replicate the value
+            self._store(address, [data] * actual_size)
 
         # Update statistics
         self.write_count += 1
@@ -659,6 +771,22 @@ class Memory:
         # Add to pending accesses
         self.pending_accesses.append(("write", address, actual_size))
 
+    def _slice(self, start: int, stop: int) -> list[Any]:
+        """Return cells [start, stop) as a list."""
+        cells = self.data[start:stop]
+        return cells.tolist() if isinstance(cells, array) else cells
+
+    def _store(self, address: int, values: list[Any]) -> None:
+        """Write consecutive cells, widening the backing store if needed."""
+        end = address + len(values)
+        if isinstance(self.data, array):
+            try:
+                self.data[address:end] = array("q", values)
+                return
+            except (TypeError, OverflowError):
+                self.data = self.data.tolist()
+        self.data[address:end] = values
+
     def read_block(self, address: int, block_size: int) -> list[Any]:
         """Read a complete cache block."""
         return self.read(address, block_size)
@@ -734,14 +862,14 @@ class Memory:
         if start_address + size > self.size:
             size = self.size - start_address
 
-        return self.data[start_address : start_address + size]
+        return self._slice(start_address, start_address + size)
 
     def load_program(self, program_data: list[Any], start_address: int = 0) -> None:
         """Load program data into memory."""
         if start_address + len(program_data) > self.size:
             raise MemoryAccessError("Program too large for memory")
 
-        self.data[start_address : start_address + len(program_data)] = program_data
+        self._store(start_address, program_data)
         logging.info(f"Loaded {len(program_data)} bytes at address {start_address:#x}")
 
 
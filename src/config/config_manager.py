@@ -7,11 +7,12 @@ including files, environment variables, and command-line arguments.
 
 from __future__ import annotations
 
+from functools import cache
 import os
 from pathlib import Path
-from typing import Any, Optional, Set, Tuple
+from typing import Any, Optional, Set, Tuple, get_args, get_origin
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 import yaml
 
 from .config_models import SimulatorConfig
@@ -27,6 +28,38 @@ except (ImportError, ValueError):
     from exceptions.simulator_exceptions import ConfigurationError
 
 
+_ENV_PREFIX = "SIMULATOR_"
+
+
+@cache
+def _env_override_names(
+    model: type[BaseModel], prefix: str = _ENV_PREFIX
+) -> tuple[str, ...]:
+    """
+    Environment variable names that can override a field of ``model``.
+
+    One name per leaf field, e.g. SIMULATOR_PIPELINE__FETCH_WIDTH; dict
+    fields of sub-models contribute one set per key in their default.
+    """
+    names: list[str] = []
+    for field_name, field_info in model.model_fields.items():
+        name = prefix + field_name.upper()
+        annotation = field_info.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            names.extend(_env_override_names(annotation, name + "__"))
+            continue
+        if get_origin(annotation) is dict:
+            value_type = get_args(annotation)[1]
+            if isinstance(value_type, type) and issubclass(value_type, BaseModel):
+                for key in field_info.get_default(call_default_factory=True):
+                    names.extend(
+                        _env_override_names(value_type, f"{name}__{key.upper()}__")
+                    )
+                continue
+        names.append(name)
+    return tuple(names)
+
+
 class ConfigManager:
     """Manages simulator configuration from multiple sources."""
 
@@ -34,6 +67,11 @@ class ConfigManager:
         """Initialize the configuration manager."""
         self._config: SimulatorConfig | None = None
         self._config_file: Path | None = None
+        # Values of the SIMULATOR_* override variables on the last lookup
+        # and their parsed form (key path, converted value), reused while
+        # those variables are unchanged
+        self._env_values: tuple[str | None, ...] = ()
+        self._env_overrides: list[tuple[list[str], Any]] = []
 
     def load_from_file(self, config_file: str | Path) -> SimulatorConfig:
         """
@@ -178,20 +216,27 @@ class ConfigManager:
             SIMULATOR_DEBUG__ENABLED=true
             SIMULATOR_SIMULATION__MAX_CYCLES=50000
         """
-        env_prefix = "SIMULATOR_"
-
-        for key, value in os.environ.items():
-            if not key.startswith(env_prefix):
-                continue
-
-            # Remove prefix and convert to nested dict path
-            config_key = key[len(env_prefix) :].lower()
-            key_parts = config_key.split("__")
-
-            # Convert string values to appropriate types
-            converted_value = self._convert_env_value(value)
-
-            # Apply to config data
+        # Only the variables that name a config field are looked up, rather
+        # than scanning the whole environment
+        names = _env_override_names(SimulatorConfig)
+        env_get = os.environ.get
+        env_values = tuple(env_get(name) for name in names)
+        if env_values != self._env_values:
+            overrides = []
+            for key, value in zip(names, env_values, strict=True):
+                if value is None:
+                    continue
+                # Remove prefix and convert to nested dict path
+                config_key = key[len(_ENV_PREFIX) :].lower()
+                key_parts = config_key.split("__")
+
+                # Convert string values to appropriate types
+                overrides.append((key_parts, self._convert_env_value(value)))
+            self._env_values = env_values
+            self._env_overrides = overrides
+
+        # Apply to config data
+        for key_parts, converted_value in self._env_overrides:
             self._set_nested_value(config_data, key_parts, converted_value)
 
         return config_data
@@ -252,17 +297,32 @@ class ConfigManager:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        errors = []
-
         try:
             config_path = Path(config_file)
 
             if not config_path.exists():
-                errors.append(f"Configuration file not found: {config_path}")
-                return False, errors
+                return False, [f"Configuration file not found: {config_path}"]
 
-            with open(config_path, encoding="utf-8") as f:
-                config_data = yaml.safe_load(f)
+            config_text = config_path.read_text(encoding="utf-8")
+        except Exception as e:
+            return False, [f"Unexpected error: {e}"]
+
+        return self.validate_config_string(config_text)
+
+    def validate_config_string(self, config_text: str) -> tuple[bool, list[str]]:
+        """
+        Validate configuration YAML given as text, without touching the disk.
+
+        Args:
+            config_text: Configuration file contents
+
+        Returns:
+            Tuple of (is_valid, list_of_errors)
+        """
+        errors = []
+
+        try:
+            config_data = yaml.safe_load(config_text)
 
             if config_data is None:
                 config_data = {}
@@ -5,6 +5,10 @@ This module provides data forwarding capabilities to reduce pipeline stalls
 caused by data hazards through bypassing mechanisms.
 """
 
-from .data_forwarding_unit import DataForwardingUnit
+from .data_forwarding_unit import (
+    ALL_INSTRUCTION_TYPES,
+    DataForwardingUnit,
+    instruction_type_mask,
+)
 
-__all__ = ["DataForwardingUnit"]
+__all__ = ["ALL_INSTRUCTION_TYPES", "DataForwardingUnit", "instruction_type_mask"]
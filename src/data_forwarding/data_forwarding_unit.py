@@ -7,35 +7,65 @@ to reduce data hazards in the pipeline.
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from bisect import insort
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 import logging
 from typing import Any, Dict, List, Optional
 
 # Handle imports for both package and direct execution
 try:
-    from ..utils.instruction import Instruction
+    from ..utils.instruction import Instruction, InstructionType
 except (ImportError, ValueError):
     import os
     import sys
 
     sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-    from utils.instruction import Instruction
+    from utils.instruction import Instruction, InstructionType
+
+_logger = logging.getLogger(__name__)
+
+# One bit per InstructionType, for ForwardingPath.type_mask
+_TYPE_BITS: dict[InstructionType, int] = {
+    itype: 1 << bit for bit, itype in enumerate(InstructionType)
+}
+ALL_INSTRUCTION_TYPES = (1 << len(_TYPE_BITS)) - 1
+
+
+def instruction_type_mask(*types: InstructionType) -> int:
+    """Build a ForwardingPath type mask accepting the given instruction types."""
+    mask = 0
+    for itype in types:
+        mask |= _TYPE_BITS[itype]
+    return mask
 
 
 @dataclass
 class ForwardingPath:
-    """Represents a data forwarding path between pipeline stages."""
+    """
+    Represents a data forwarding path between pipeline stages.
+
+    A path applies to an instruction when its type is in type_mask and, if
+    a condition is given, the condition accepts it. The mask test is a
+    single AND, so paths that only filter by instruction type should use
+    it instead of a condition callable.
+    """
 
     from_stage: str
     to_stage: str
-    condition: Callable[[Instruction], bool]
+    condition: Callable[[Instruction], bool] | None
     priority: int = 0  # Higher priority paths are checked first
+    type_mask: int = ALL_INSTRUCTION_TYPES
 
 
-@dataclass
+def _path_order(path: ForwardingPath) -> int:
+    """Sort key putting higher-priority paths first."""
+    return -path.priority
+
+
+@dataclass(slots=True, frozen=True)
 class ForwardedData:
-    """Container for forwarded data."""
+    """Container for forwarded data (one record per forward_data call)."""
 
     source_instruction: Instruction
     register: str
@@ -55,6 +85,8 @@ class DataForwardingUnit:
     def __init__(self) -> None:
         """Initialize the data forwarding unit."""
         self.forwarding_paths: List[ForwardingPath] = []
+        # Same paths grouped by destination stage, still in priority order
+        self._paths_by_stage: dict[str, List[ForwardingPath]] = {}
         self.forwarding_data: dict[str, List[ForwardedData]] = {}
 
         # Statistics
@@ -65,14 +97,15 @@ class DataForwardingUnit:
         # Forwarding bus data (current cycle)
         self.current_forwards: dict[str, Dict[str, Any]] = {}
 
-        logging.debug("Initialized Data Forwarding Unit")
+        _logger.debug("Initialized Data Forwarding Unit")
 
     def add_forwarding_path(
         self,
         from_stage: str,
         to_stage: str,
-        forwarding_condition: Callable[[Instruction], bool],
+        forwarding_condition: Callable[[Instruction], bool] | None = None,
         priority: int = 0,
+        type_mask: int = ALL_INSTRUCTION_TYPES,
     ) -> None:
         """
         Add a forwarding path between pipeline stages.
@@ -81,21 +114,29 @@ class DataForwardingUnit:
             from_stage: Source stage name
             to_stage: Destination stage name
             forwarding_condition: Function to check if forwarding applies
+                (None to accept every instruction the type mask allows; an
+                always-true callable only adds a Python call per check)
             priority: Priority of this path (higher = checked first)
+            type_mask: Instruction types the path applies to, built with
+                instruction_type_mask(); defaults to all types
         """
         path = ForwardingPath(
             from_stage=from_stage,
             to_stage=to_stage,
             condition=forwarding_condition,
             priority=priority,
+            type_mask=type_mask,
         )
-        self.forwarding_paths.append(path)
-
-        # Sort by priority (descending)
-        self.forwarding_paths.sort(key=lambda p: p.priority, reverse=True)
-
-        logging.info(
-            f"Added forwarding path: {from_stage} -> {to_stage} (priority {priority})"
+        # Keep both lists sorted by priority (descending); equal priorities
+        # stay in insertion order
+        insort(self.forwarding_paths, path, key=_path_order)
+        insort(self._paths_by_stage.setdefault(to_stage, []), path, key=_path_order)
+
+        _logger.info(
+            "Added forwarding path: %s -> %s (priority %s)",
+            from_stage,
+            to_stage,
+            priority,
         )
 
     def forward_data(self, instruction: Instruction, stage: str) -> None:
@@ -106,43 +147,59 @@ class DataForwardingUnit:
             instruction: Instruction producing data
             stage: Current stage of the instruction
         """
-        if not instruction or not hasattr(instruction, "result"):
-            return
-
-        # Check if this instruction produces forwardable data
-        if instruction.has_destination_register() and instruction.result is not None:
-            dest_reg = instruction.get_destination_register()
+        self.forward_data_batch(((instruction, stage),))
 
-            # Store forwarding data
-            forwarded = ForwardedData(
-                source_instruction=instruction,
-                register=dest_reg,
-                value=instruction.result,
-                from_stage=stage,
-                cycle=getattr(self, "current_cycle", 0),
-            )
-
-            # Add to current cycle's forwarding data
-            if stage not in self.current_forwards:
-                self.current_forwards[stage] = {}
+    def forward_data_batch(self, producers: Iterable[tuple[Instruction, str]]) -> int:
+        """
+        Make data from several producers available for forwarding.
 
-            self.current_forwards[stage][dest_reg] = instruction.result
+        Same effect as calling forward_data() for each (instruction, stage)
+        pair in order, with the per-call lookups done once for the batch.
 
-            # Store in forwarding history
-            if dest_reg not in self.forwarding_data:
-                self.forwarding_data[dest_reg] = []
+        Args:
+            producers: (instruction producing data, its current stage) pairs
 
-            self.forwarding_data[dest_reg].append(forwarded)
+        Returns:
+            Number of values made available
+        """
+        current_forwards = self.current_forwards
+        history = self.forwarding_data
+        cycle = getattr(self, "current_cycle", 0)
+        count = 0
 
-            # Keep only recent forwarding data (last 5 cycles)
-            self.forwarding_data[dest_reg] = self.forwarding_data[dest_reg][-5:]
+        for instruction, stage in producers:
+            if not instruction:
+                continue
 
-            self.forwards_count += 1
+            # Check if this instruction produces forwardable data
+            result = getattr(instruction, "result", None)
+            if result is None or not instruction.has_destination_register():
+                continue
+            dest_reg = instruction.get_destination_register()
 
-            logging.debug(
-                f"Forwarding available: {dest_reg} = {instruction.result} from {stage}"
+            # Add to current cycle's forwarding data
+            stage_data = current_forwards.get(stage)
+            if stage_data is None:
+                stage_data = current_forwards[stage] = {}
+            stage_data[dest_reg] = result
+
+            # Store in forwarding history, keeping only recent forwarding
+            # data (last 5 cycles)
+            records = history.get(dest_reg)
+            if records is None:
+                records = history[dest_reg] = []
+            records.append(ForwardedData(instruction, dest_reg, result, stage, cycle))
+            if len(records) > 5:
+                del records[0]
+
+            count += 1
+            _logger.debug(
+                "Forwarding available: %s = %s from %s", dest_reg, result, stage
             )
 
+        self.forwards_count += count
+        return count
+
     def get_forwarded_data(
         self, instruction: Instruction, stage: str
     ) -> Dict[str, Any] | None:
@@ -165,29 +222,41 @@ class DataForwardingUnit:
             return None
 
         forwarded_values = {}
+        wanted = len(set(source_registers))
+        current_forwards = self.current_forwards
+        itype = instruction.instruction_type
+        type_bit = _TYPE_BITS[itype] if itype is not None else ALL_INSTRUCTION_TYPES
+
+        # Check each forwarding path into this stage (sorted by priority);
+        # the type mask is tested before any condition callable
+        for path in self._paths_by_stage.get(stage, ()) if current_forwards else ():
+            if not path.type_mask & type_bit:
+                continue
 
-        # Check each forwarding path (already sorted by priority)
-        for path in self.forwarding_paths:
-            if path.to_stage != stage:
+            stage_data = current_forwards.get(path.from_stage)
+            if not stage_data:
                 continue
 
-            if not path.condition(instruction):
+            if path.condition is not None and not path.condition(instruction):
                 continue
 
-            # Check if data is available from the source stage
-            if path.from_stage in self.current_forwards:
-                stage_data = self.current_forwards[path.from_stage]
+            for src_reg in source_registers:
+                if src_reg in stage_data and src_reg not in forwarded_values:
+                    # Only use this value if we haven't already found a higher priority one
+                    forwarded_values[src_reg] = stage_data[src_reg]
+                    self.forward_hits += 1
 
-                for src_reg in source_registers:
-                    if src_reg in stage_data and src_reg not in forwarded_values:
-                        # Only use this value if we haven't already found a higher priority one
-                        forwarded_values[src_reg] = stage_data[src_reg]
-                        self.forward_hits += 1
+                    _logger.debug(
+                        "Forwarding hit: %s = %s from %s to %s (priority %s)",
+                        src_reg,
+                        stage_data[src_reg],
+                        path.from_stage,
+                        stage,
+                        path.priority,
+                    )
 
-                        logging.debug(
-                            f"Forwarding hit: {src_reg} = {stage_data[src_reg]} "
-                            f"from {path.from_stage} to {stage} (priority {path.priority})"
-                        )
+            if len(forwarded_values) == wanted:
+                break  # Every source found; lower-priority paths can't win
 
         # Track misses
         for src_reg in source_registers:
@@ -222,7 +291,7 @@ class DataForwardingUnit:
         if hasattr(instruction, "register_values"):
             instruction.register_values.update(forwarded_data)
 
-        logging.debug(f"Applied forwarding to {instruction}: {forwarded_data}")
+        _logger.debug("Applied forwarding to %s: %s", instruction, forwarded_data)
 
         return True
 
@@ -240,10 +309,7 @@ class DataForwardingUnit:
         if not producer.has_destination_register():
             return False
 
-        producer_dest = producer.get_destination_register()
-        consumer_sources = consumer.get_source_registers()
-
-        return producer_dest in consumer_sources
+        return consumer.reads_register(producer.get_destination_register())
 
     def get_operand_value(self, operand: str, stage: str = None) -> Any | None:  # type: ignore[assignment]
         """
@@ -300,7 +366,11 @@ class DataForwardingUnit:
         self.forward_hits = 0
         self.forward_misses = 0
 
-        logging.info("Data forwarding unit reset")
+        _logger.info("Data forwarding unit reset")
+
+
+# Later stages win forwarding conflicts between sources from the same cycle
+_CONFLICT_STAGE_PRIORITY = {"writeback": 3, "memory": 2, "execute": 1}
 
 
 class AdvancedDataForwardingUnit(DataForwardingUnit):
@@ -340,30 +410,32 @@ class AdvancedDataForwardingUnit(DataForwardingUnit):
         if not sources:
             return None  # type: ignore[return-value]
 
-        # Sort by priority:
+        if len(sources) == 1:
+            return sources[0]
+
+        # Pick by priority (ties go to the earliest source in the list):
         # 1. Most recent instruction (highest cycle)
         # 2. Latest pipeline stage
         # 3. Instruction order
+        stage_priority = _CONFLICT_STAGE_PRIORITY
 
-        stage_priority = {"writeback": 3, "memory": 2, "execute": 1}
-
-        def priority_key(fwd: ForwardedData):
+        def priority_key(fwd: ForwardedData) -> tuple[int, int, int]:
             return (
                 fwd.cycle,
                 stage_priority.get(fwd.from_stage, 0),
                 -getattr(fwd.source_instruction, "address", 0),
             )
 
-        sources.sort(key=priority_key, reverse=True)
+        selected = max(sources, key=priority_key)
 
-        if len(sources) > 1:
-            self.conflicts += 1
-            logging.debug(
-                f"Forwarding conflict for {register}, "
-                f"selected from {sources[0].from_stage}"
-            )
+        self.conflicts += 1
+        _logger.debug(
+            "Forwarding conflict for %s, selected from %s",
+            register,
+            selected.from_stage,
+        )
 
-        return sources[0]
+        return selected
 
     def get_forwarding_latency(self, from_stage: str, to_stage: str) -> int:
         """
@@ -19,6 +19,25 @@ from pathlib import Path
 import time
 from typing import Any, Dict, List, Tuple, Type
 
+# Opcode -> PerformanceMetrics counter it adds to in the instruction mix
+_MIX_COUNTERS: dict[str, str] = {
+    **dict.fromkeys(
+        ("ADD", "SUB", "MUL", "DIV", "ADDI", "SUBI"), "arithmetic_instructions"
+    ),
+    **dict.fromkeys(
+        ("AND", "OR", "XOR", "SLT", "ANDI", "ORI", "XORI", "SLTI"),
+        "logical_instructions",
+    ),
+    **dict.fromkeys(("LW", "SW", "LB", "LH", "SB", "SH"), "memory_instructions"),
+    **dict.fromkeys(
+        ("BEQ", "BNE", "BLT", "BGE", "J", "JAL", "JR", "JALR"), "branch_instructions"
+    ),
+    **dict.fromkeys(("FADD", "FSUB", "FMUL", "FDIV"), "floating_point_instructions"),
+}
+
+# Latency samples kept per instruction (the most recent ones)
+_LATENCY_WINDOW = 1024
+
 
 @dataclass
 class PerformanceMetrics:
@@ -142,8 +161,11 @@ class PerformanceProfiler:
         self.branch_accuracy_history: deque = deque(maxlen=1000)
         self.cache_hit_history: deque = deque(maxlen=1000)
 
-        # Instruction tracking
-        self.instruction_latencies: dict[str, List[int]] = defaultdict(list)
+        # Instruction tracking; one latency sample is recorded per retired
+        # instruction, so only the most recent _LATENCY_WINDOW are kept
+        self.instruction_latencies: dict[str, deque[int]] = defaultdict(
+            lambda: deque(maxlen=_LATENCY_WINDOW)
+        )
         self.instruction_counts: dict[str, int] = defaultdict(int)
 
         # Bottleneck analysis
@@ -192,16 +214,9 @@ class PerformanceProfiler:
         """Update instruction type counters."""
         opcode = instruction.split(maxsplit=1)[0].upper() if instruction else ""
 
-        if opcode in ["ADD", "SUB", "MUL", "DIV", "ADDI", "SUBI"]:
-            self.metrics.arithmetic_instructions += 1
-        elif opcode in ["AND", "OR", "XOR", "SLT", "ANDI", "ORI", "XORI", "SLTI"]:
-            self.metrics.logical_instructions += 1
-        elif opcode in ["LW", "SW", "LB", "LH", "SB", "SH"]:
-            self.metrics.memory_instructions += 1
-        elif opcode in ["BEQ", "BNE", "BLT", "BGE", "J", "JAL", "JR", "JALR"]:
-            self.metrics.branch_instructions += 1
-        elif opcode in ["FADD", "FSUB", "FMUL", "FDIV"]:
-            self.metrics.floating_point_instructions += 1
+        counter = _MIX_COUNTERS.get(opcode)
+        if counter is not None:
+            setattr(self.metrics, counter, getattr(self.metrics, counter) + 1)
 
     def record_branch_prediction(
         self, instruction: str, predicted: bool, actual: bool
@@ -309,16 +324,15 @@ class PerformanceProfiler:
 
         for instruction, latencies in self.instruction_latencies.items():
             if latencies:
-                avg_latency = sum(latencies) / len(latencies)
                 max_latency = max(latencies)
 
                 if max_latency > 10:  # Threshold for critical
                     critical_instructions.append(
                         {
                             "instruction": instruction,
-                            "avg_latency": avg_latency,
+                            "avg_latency": sum(latencies) / len(latencies),
                             "max_latency": max_latency,
-                            "count": len(latencies),
+                            "count": self.instruction_counts[instruction],
                         }
                     )
 
@@ -22,6 +22,30 @@ except (ImportError, ValueError):
     from register_file.register_file import RegisterFile
     from utils.instruction import Instruction
 
+_logger = logging.getLogger(__name__)
+
+# MIPS ABI register names; numeric forms ($8, r8) are range-checked instead
+_NAMED_REGISTERS = frozenset(
+    (
+        "$zero",
+        "$at",
+        "$v0",
+        "$v1",
+        "$a0",
+        "$a1",
+        "$a2",
+        "$a3",
+        *(f"$t{i}" for i in range(10)),
+        *(f"$s{i}" for i in range(8)),
+        "$k0",
+        "$k1",
+        "$gp",
+        "$sp",
+        "$fp",
+        "$ra",
+    )
+)
+
 
 class DecodeStage:
     """
@@ -48,7 +72,7 @@ class DecodeStage:
         self.decoded_count = 0
         self.stall_cycles = 0
 
-        logging.debug("Initialized Decode Stage")
+        _logger.debug("Initialized Decode Stage")
 
     def decode(self, instructions: List[Instruction]) -> List[Instruction]:
         """
@@ -77,8 +101,8 @@ class DecodeStage:
                 if self.check_hazards(decoded_instruction, decoded_instructions):
                     # Stall if hazard detected
                     self.stall_cycles += 1
-                    logging.debug(
-                        f"Hazard detected for {decoded_instruction}, stalling"
+                    _logger.debug(
+                        "Hazard detected for %s, stalling", decoded_instruction
                     )
                     break  # Stop decoding further instructions this cycle
 
@@ -86,7 +110,7 @@ class DecodeStage:
                 self.decoded_count += 1
 
             except Exception as e:
-                logging.error(f"Error decoding instruction {instruction}: {e}")
+                _logger.error("Error decoding instruction %s: %s", instruction, e)
                 continue
 
         return decoded_instructions
@@ -107,15 +131,11 @@ class DecodeStage:
         # Ensure destination is properly set for instructions that write
         if instruction.has_destination_register() and not instruction.destination:
             # For R-type and I-type instructions, first operand is typically destination
-            if len(instruction.operands) > 0 and instruction.opcode.upper() not in [
-                "SW",
-                "SB",
-                "SH",
-            ]:
+            if len(instruction.operands) > 0 and not instruction.is_store():
                 instruction.destination = instruction.operands[0]
 
         # Log decoded instruction
-        logging.debug(f"Decoded: {instruction}")
+        _logger.debug("Decoded: %s", instruction)
 
         return instruction
 
@@ -139,7 +159,7 @@ class DecodeStage:
                     value = self.register_file.read_register(reg)
                     register_values[reg] = value
                 except Exception as e:
-                    logging.error(f"Error reading register {reg}: {e}")
+                    _logger.error("Error reading register %s: %s", reg, e)
                     register_values[reg] = 0  # Default value
 
         # Store register values for later use
@@ -147,7 +167,9 @@ class DecodeStage:
 
         # For debugging, log register reads
         if register_values:
-            logging.debug(f"Read registers for {instruction.opcode}: {register_values}")
+            _logger.debug(
+                "Read registers for %s: %s", instruction.opcode, register_values
+            )
 
     def is_register(self, operand: Union[str, int]) -> bool:
         """
@@ -171,41 +193,7 @@ class DecodeStage:
                 return 0 <= reg_num < self.register_file.num_registers
 
             # Check named registers
-            named_registers = {
-                "$zero": 0,
-                "$at": 1,
-                "$v0": 2,
-                "$v1": 3,
-                "$a0": 4,
-                "$a1": 5,
-                "$a2": 6,
-                "$a3": 7,
-                "$t0": 8,
-                "$t1": 9,
-                "$t2": 10,
-                "$t3": 11,
-                "$t4": 12,
-                "$t5": 13,
-                "$t6": 14,
-                "$t7": 15,
-                "$s0": 16,
-                "$s1": 17,
-                "$s2": 18,
-                "$s3": 19,
-                "$s4": 20,
-                "$s5": 21,
-                "$s6": 22,
-                "$s7": 23,
-                "$t8": 24,
-                "$t9": 25,
-                "$k0": 26,
-                "$k1": 27,
-                "$gp": 28,
-                "$sp": 29,
-                "$fp": 30,
-                "$ra": 31,
-            }
-            return operand in named_registers
+            return operand in _NAMED_REGISTERS
 
         # Alternative format: r0-r31
         if operand.startswith("r") and operand[1:].isdigit():
@@ -236,8 +224,10 @@ class DecodeStage:
                 dest_reg = prev_inst.get_destination_register()
                 if dest_reg in source_registers:
                     # RAW hazard detected
-                    logging.debug(
-                        f"RAW hazard: {instruction.opcode} depends on {prev_inst.opcode}"
+                    _logger.debug(
+                        "RAW hazard: %s depends on %s",
+                        instruction.opcode,
+                        prev_inst.opcode,
                     )
                     return True
 
@@ -248,8 +238,11 @@ class DecodeStage:
                 if prev_inst.has_destination_register():
                     if prev_inst.get_destination_register() == dest_reg:
                         # WAW hazard detected
-                        logging.debug(
-                            f"WAW hazard: both {instruction.opcode} and {prev_inst.opcode} write to {dest_reg}"
+                        _logger.debug(
+                            "WAW hazard: both %s and %s write to %s",
+                            instruction.opcode,
+                            prev_inst.opcode,
+                            dest_reg,
                         )
                         return True
 
@@ -26,6 +26,8 @@ except (ImportError, ValueError):
     from utils.functional_unit import ALU, FPU, LSU, FunctionalUnitStats
     from utils.instruction import Instruction
 
+_logger = logging.getLogger(__name__)
+
 
 class ExecuteStage:
     """
@@ -82,9 +84,11 @@ class ExecuteStage:
         self.stats = FunctionalUnitStats()
         self.executed_count = 0
 
-        logging.info(
-            f"Initialized Execute Stage with {num_alu_units} ALUs, "
-            f"{num_fpu_units} FPUs, {num_lsu_units} LSUs"
+        _logger.info(
+            "Initialized Execute Stage with %d ALUs, %d FPUs, %d LSUs",
+            num_alu_units,
+            num_fpu_units,
+            num_lsu_units,
         )
 
     def execute(
@@ -123,16 +127,16 @@ class ExecuteStage:
                     self.stats.record_execution(functional_unit.id, instruction.opcode)
                     scheduled_count += 1
 
-                    logging.debug(f"Scheduled {instruction} on {functional_unit.id}")
+                    _logger.debug("Scheduled %s on %s", instruction, functional_unit.id)
 
                 except Exception as e:
-                    logging.error(f"Error executing instruction {instruction}: {e}")
+                    _logger.error("Error executing instruction %s: %s", instruction, e)
                     # Continue with other instructions
             else:
                 # No free functional unit available - structural hazard
                 self.stats.record_stall()
-                logging.debug(
-                    f"Structural hazard: No free unit for {instruction.opcode}"
+                _logger.debug(
+                    "Structural hazard: No free unit for %s", instruction.opcode
                 )
                 # Don't break - other instructions might find free units
 
@@ -146,8 +150,8 @@ class ExecuteStage:
                 executed_instructions.append((instruction, result))
                 self.executed_count += 1
 
-                logging.debug(
-                    f"Completed execution of {instruction} with result {result}"
+                _logger.debug(
+                    "Completed execution of %s with result %s", instruction, result
                 )
 
         # Update cycle counter for statistics
@@ -187,7 +191,7 @@ class ExecuteStage:
 
         # Log completed instructions
         for instruction, result in completed_instructions:
-            logging.debug(f"Functional unit completed: {instruction} -> {result}")
+            _logger.debug("Functional unit completed: %s -> %s", instruction, result)
 
     def get_unit_status(self) -> List[Dict[str, Any]]:
         """
@@ -253,7 +257,7 @@ class ExecuteStage:
             unit.current_instruction = None
             unit.result = None
 
-        logging.info("Execute stage reset")
+        _logger.info("Execute stage reset")
 
 
 class OutOfOrderExecuteStage(ExecuteStage):
@@ -285,9 +289,10 @@ class OutOfOrderExecuteStage(ExecuteStage):
         # Stall if window is full - do not drop instructions
         if len(self.instruction_window) >= self.window_size:
             self.stall_cycles += 1
-            logging.debug(
-                f"OoO window full ({self.window_size}), stalling. "
-                f"New instructions will be accepted after window drains."
+            _logger.debug(
+                "OoO window full (%d), stalling. "
+                "New instructions will be accepted after window drains.",
+                self.window_size,
             )
             # Still check for completed instructions even while stalled
             return self._check_completions()
@@ -323,10 +328,10 @@ class OutOfOrderExecuteStage(ExecuteStage):
                     scheduled_instructions.append(instruction)
 
                     self.stats.record_execution(unit.id, instruction.opcode)
-                    logging.debug(f"OoO scheduled {instruction} on {unit.id}")
+                    _logger.debug("OoO scheduled %s on %s", instruction, unit.id)
 
                 except Exception as e:
-                    logging.error(f"Error in OoO execution: {e}")
+                    _logger.error("Error in OoO execution: %s", e)
                     remaining_instructions.append(instruction)
             else:
                 remaining_instructions.append(instruction)
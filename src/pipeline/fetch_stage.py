@@ -10,6 +10,8 @@ except (ImportError, ValueError):
     from utils.instruction import Instruction
 import logging
 
+_logger = logging.getLogger(__name__)
+
 
 class FetchStage:
     def __init__(self, instruction_cache, branch_predictor, memory):
@@ -23,46 +25,56 @@ class FetchStage:
             with open(program_file) as file:
                 instructions = file.readlines()
 
+            program = {}
             for i, instruction_str in enumerate(instructions):
                 instruction_data = self.parse_instruction_data(instruction_str)
                 if instruction_data is not None:
-                    self.instruction_cache.add_instruction(i * 4, instruction_data)
+                    program[i * 4] = instruction_data
+            self.instruction_cache.add_instructions(program)
         except FileNotFoundError:
-            logging.error(f"Program file '{program_file}' not found.")
+            _logger.error("Program file '%s' not found.", program_file)
             raise
 
     def fetch(self):
         instructions = []
-
-        for _ in range(self.instruction_cache.fetch_bandwidth):
-            if self.pc >= self.memory.size:
+        append = instructions.append
+
+        # Loop invariants hoisted out of the per-slot loop; a wide fetch
+        # builds one Instruction per slot so the lookups add up.
+        icache = self.instruction_cache
+        has_instruction = icache.has_instruction
+        get_instruction = icache.get_instruction
+        predict = self.branch_predictor.predict
+        parse_instruction = self.parse_instruction
+        memory_size = self.memory.size
+        pc = self.pc
+
+        for _ in range(icache.fetch_bandwidth):
+            if pc >= memory_size:
                 break
 
-            if self.instruction_cache.has_instruction(self.pc):
-                instruction_data = self.instruction_cache.get_instruction(self.pc)
-                if isinstance(instruction_data, dict):
-                    instruction = self.parse_instruction(instruction_data)
-                    if instruction is not None:
-                        instructions.append(instruction)
-                        predicted_pc = self.branch_predictor.predict(instruction)
-                        if predicted_pc is not None:
-                            self.pc = predicted_pc
-                        else:
-                            self.pc += 4
-                    else:
-                        logging.warning(
-                            f"Skipping invalid instruction data at PC: {self.pc}"
-                        )
-                        self.pc += 4
-                else:
-                    logging.warning(
-                        f"Instruction data is not a dictionary at PC: {self.pc}"
-                    )
-                    self.pc += 4
-            else:
-                logging.debug(f"Instruction cache miss at PC: {self.pc}")
-                self.pc += 4
+            if not has_instruction(pc):
+                _logger.debug("Instruction cache miss at PC: %d", pc)
+                pc += 4
+                continue
+
+            instruction_data = get_instruction(pc)
+            if not isinstance(instruction_data, dict):
+                _logger.warning("Instruction data is not a dictionary at PC: %d", pc)
+                pc += 4
+                continue
+
+            instruction = parse_instruction(instruction_data, pc)
+            if instruction is None:
+                _logger.warning("Skipping invalid instruction data at PC: %d", pc)
+                pc += 4
+                continue
+
+            append(instruction)
+            predicted_pc = predict(instruction)
+            pc = predicted_pc if predicted_pc is not None else pc + 4
 
+        self.pc = pc
         return instructions
 
     def parse_instruction_data(self, instruction_str):
@@ -82,23 +94,23 @@ class FetchStage:
 
         return instruction_dict
 
-    def parse_instruction(self, instruction_data):
+    def parse_instruction(self, instruction_data, pc=None):
         if instruction_data is None:
-            logging.error("Instruction data is None")
+            _logger.error("Instruction data is None")
             return None
 
         if not isinstance(instruction_data, dict):
-            logging.error("Instruction data is not a dictionary")
+            _logger.error("Instruction data is not a dictionary")
             return None
 
         opcode = instruction_data.get("opcode")
         operands = instruction_data.get("operands", [])
 
         if opcode is None:
-            logging.error("Invalid instruction data format")
+            _logger.error("Invalid instruction data format")
             return None
 
-        instruction = Instruction(self.pc, opcode, operands)
+        instruction = Instruction(self.pc if pc is None else pc, opcode, operands)
         return instruction
 
     def update_pc(self, new_pc):
@@ -14,12 +14,14 @@ from typing import Any, List, Optional
 # Handle imports for both package and direct execution
 try:
     from ..utils.instruction import Instruction, InstructionType
+    from ..utils.instruction_parser import parse_register
 except (ImportError, ValueError):
     import os
     import sys
 
     sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
     from utils.instruction import Instruction, InstructionType
+    from utils.instruction_parser import parse_register
 
 
 class HazardType(Enum):
@@ -54,6 +56,40 @@ class PipelineStage(Enum):
     WRITEBACK = "writeback"
 
 
+# Stage an instruction moves to when it advances; WRITEBACK is the last
+_NEXT_STAGE = {
+    PipelineStage.FETCH: PipelineStage.DECODE,
+    PipelineStage.DECODE: PipelineStage.ISSUE,
+    PipelineStage.ISSUE: PipelineStage.EXECUTE,
+    PipelineStage.EXECUTE: PipelineStage.MEMORY,
+    PipelineStage.MEMORY: PipelineStage.WRITEBACK,
+}
+
+# Stages in which a branch/jump has not resolved yet
+_UNRESOLVED_BRANCH_STAGES = frozenset(
+    (PipelineStage.FETCH, PipelineStage.DECODE, PipelineStage.EXECUTE)
+)
+
+# Stages in which a consumer has not read its operands yet
+_PRE_READ_STAGES = frozenset((PipelineStage.FETCH, PipelineStage.DECODE))
+
+_CONTROL_FLOW_TYPES = frozenset((InstructionType.BRANCH, InstructionType.JUMP))
+
+# Functional unit class needed by each instruction type; types not listed
+# (system, nop) don't occupy a unit
+_UNIT_FOR_TYPE = {
+    InstructionType.FLOATING_POINT: "FPU",
+    InstructionType.LOAD: "LSU",
+    InstructionType.STORE: "LSU",
+    InstructionType.MEMORY: "LSU",
+    InstructionType.BRANCH: "BRANCH",
+    InstructionType.JUMP: "BRANCH",
+    InstructionType.ARITHMETIC: "ALU",
+    InstructionType.LOGICAL: "ALU",
+    InstructionType.COMPARISON: "ALU",
+}
+
+
 class InstructionState:
     """Tracks instruction state through pipeline."""
 
@@ -124,7 +160,9 @@ class HazardController:
 
         # Register tracking for dependency analysis
         self.register_producers: dict[int, int] = {}  # reg -> instruction_id
-        self.register_consumers: dict[int, list[int]] = {}  # reg -> [instruction_ids]
+        # reg -> instruction ids reading it; an insertion-ordered dict used
+        # as a set so removal on completion/flush is O(1)
+        self.register_consumers: dict[int, dict[int, None]] = {}
 
         # Pipeline stage occupancy
         self.stage_occupancy: dict[PipelineStage, set[int]] = {
@@ -244,9 +282,9 @@ class HazardController:
                         if self.register_producers.get(reg) == instr_id:
                             del self.register_producers[reg]
                     for reg in completed_src:
-                        consumer_list = self.register_consumers.get(reg, [])
-                        if instr_id in consumer_list:
-                            consumer_list.remove(instr_id)
+                        consumers = self.register_consumers.get(reg)
+                        if consumers:
+                            consumers.pop(instr_id, None)
 
                     # Move to completed list
                     self.completed_instructions.append(instr_state)
@@ -283,9 +321,9 @@ class HazardController:
                     if self.register_producers.get(reg) == instr_id:
                         del self.register_producers[reg]
                 for reg in src_regs:
-                    consumers = self.register_consumers.get(reg, [])
-                    if instr_id in consumers:
-                        consumers.remove(instr_id)
+                    consumers = self.register_consumers.get(reg)
+                    if consumers:
+                        consumers.pop(instr_id, None)
 
                 # Release allocated resources
                 self._release_resources(instr_state.instruction, instr_id)
@@ -330,10 +368,10 @@ class HazardController:
             if dst_reg in self.register_consumers:
                 for consumer_id in self.register_consumers[dst_reg]:
                     consumer_state = self.instructions_in_flight.get(consumer_id)
-                    if consumer_state and consumer_state.current_stage in [
-                        PipelineStage.FETCH,
-                        PipelineStage.DECODE,
-                    ]:
+                    if (
+                        consumer_state
+                        and consumer_state.current_stage in _PRE_READ_STAGES
+                    ):
                         hazards.append((HazardType.WAR, consumer_id))
                         self.stats["hazards_detected"][HazardType.WAR] += 1  # type: ignore[index]
 
@@ -360,20 +398,13 @@ class HazardController:
             self.stats["hazards_detected"][HazardType.STRUCTURAL] += 1  # type: ignore[index]
 
         # Check for control hazards
-        if instruction.instruction_type in [
-            InstructionType.BRANCH,
-            InstructionType.JUMP,
-        ]:
+        if instruction.instruction_type in _CONTROL_FLOW_TYPES:
             # Check if there are unresolved branches
             for other_id, other_state in self.instructions_in_flight.items():
-                if other_state.instruction.instruction_type in [
-                    InstructionType.BRANCH,
-                    InstructionType.JUMP,
-                ] and other_state.current_stage in [
-                    PipelineStage.FETCH,
-                    PipelineStage.DECODE,
-                    PipelineStage.EXECUTE,
-                ]:
+                if (
+                    other_state.instruction.instruction_type in _CONTROL_FLOW_TYPES
+                    and other_state.current_stage in _UNRESOLVED_BRANCH_STAGES
+                ):
                     hazards.append((HazardType.CONTROL, other_id))
                     self.stats["hazards_detected"][HazardType.CONTROL] += 1  # type: ignore[index]
                     break
@@ -489,18 +520,9 @@ class HazardController:
             )
 
         # Advance to next stage
-        stage_order = [
-            PipelineStage.FETCH,
-            PipelineStage.DECODE,
-            PipelineStage.ISSUE,
-            PipelineStage.EXECUTE,
-            PipelineStage.MEMORY,
-            PipelineStage.WRITEBACK,
-        ]
-
-        current_index = stage_order.index(instr_state.current_stage)
-        if current_index < len(stage_order) - 1:
-            instr_state.current_stage = stage_order[current_index + 1]
+        next_stage = _NEXT_STAGE.get(instr_state.current_stage)
+        if next_stage is not None:
+            instr_state.current_stage = next_stage
             instr_state.stage_entry_cycle = self.current_cycle
 
             # Add to new stage (use instruction ID, not Python id())
@@ -543,9 +565,11 @@ class HazardController:
 
         # Update consumers for source registers
         for src_reg in src_regs:
-            if src_reg not in self.register_consumers:
-                self.register_consumers[src_reg] = []
-            self.register_consumers[src_reg].append(instruction_id)
+            consumers = self.register_consumers.get(src_reg)
+            if consumers is None:
+                self.register_consumers[src_reg] = {instruction_id: None}
+            else:
+                consumers[instruction_id] = None
 
         # Update producers for destination registers
         for dst_reg in dst_regs:
@@ -557,8 +581,7 @@ class HazardController:
 
         # Extract source registers from operands based on instruction type
         itype = instruction.instruction_type
-        opcode = instruction.opcode.upper()
-        is_store = opcode in ["SW", "SB", "SH"]
+        is_store = instruction.is_store()
         is_memory = itype == InstructionType.MEMORY or itype in [
             InstructionType.LOAD,
             InstructionType.STORE,
@@ -627,7 +650,7 @@ class HazardController:
                 InstructionType.MEMORY,
                 InstructionType.LOAD,
             ]
-            and instruction.opcode.upper() not in ["SW", "SB", "SH"]
+            and not instruction.is_store()
             and instruction.operands
         ):
             # For load: operands = [rt, "offset(rs)"] -> destination is rt
@@ -637,36 +660,12 @@ class HazardController:
 
     def _parse_register(self, reg_str: str) -> int:
         """Parse register string to register number. Delegates to canonical implementation."""
-        from utils.instruction_parser import parse_register
-
         return parse_register(reg_str)
 
     def _get_required_functional_unit(self, instruction: Instruction) -> str | None:
         """Get required functional unit type for instruction."""
-        if instruction.instruction_type == InstructionType.FLOATING_POINT:
-            return "FPU"
-        elif instruction.instruction_type in [
-            InstructionType.LOAD,
-            InstructionType.STORE,
-            InstructionType.MEMORY,
-        ]:
-            return "LSU"
-        elif instruction.instruction_type in [
-            InstructionType.BRANCH,
-            InstructionType.JUMP,
-        ]:
-            return "BRANCH"
-        elif instruction.instruction_type in [
-            InstructionType.ARITHMETIC,
-            InstructionType.LOGICAL,
-            InstructionType.COMPARISON,
-        ]:
-            # Check if it's a shift operation (could use dedicated shifter)
-            opcode = instruction.opcode.lower()
-            if opcode in ("sll", "srl", "sra"):
-                return "ALU"  # Shifts handled by ALU in this configuration
-            return "ALU"
-        return None
+        # Shifts share the ALU in this configuration
+        return _UNIT_FOR_TYPE.get(instruction.instruction_type)
 
     def get_statistics(self) -> dict[str, Any]:
         """Get hazard controller statistics."""
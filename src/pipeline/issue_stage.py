@@ -11,14 +11,27 @@ from typing import Any, List, Optional
 # Handle imports for both package and direct execution
 try:
     from ..utils.instruction import Instruction, InstructionType
-    from ..utils.reservation_station import ReservationStation
+    from ..utils.reservation_station import (
+        ReservationStation,
+        ReservationStationPool,
+    )
 except (ImportError, ValueError):
     import os
     import sys
 
     sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
     from utils.instruction import Instruction, InstructionType
-    from utils.reservation_station import ReservationStation
+    from utils.reservation_station import (
+        ReservationStation,
+        ReservationStationPool,
+    )
+
+# Execution unit for instruction types that don't run on an ALU
+_EXECUTION_UNIT_FOR_TYPE = {
+    InstructionType.LOAD: "LSU",
+    InstructionType.STORE: "LSU",
+    InstructionType.FLOATING_POINT: "FPU",
+}
 
 
 class IssueStage:
@@ -47,9 +60,10 @@ class IssueStage:
             data_forwarding_unit: Reference to data forwarding unit
             execution_units: dictionary of available execution units
         """
-        self.reservation_stations = [
-            ReservationStation(i) for i in range(num_reservation_stations)
-        ]
+        # The pool tracks free and busy stations incrementally, so finding a
+        # station and skipping an idle cycle don't scan every entry
+        self._rs_pool = ReservationStationPool(num_reservation_stations)
+        self.reservation_stations = self._rs_pool.stations
         self.register_file = register_file
         self.data_forwarding_unit = data_forwarding_unit
         self.execution_units = execution_units or {
@@ -119,26 +133,18 @@ class IssueStage:
 
     def find_free_reservation_station(self) -> ReservationStation | None:
         """Find a free reservation station."""
-        for reservation_station in self.reservation_stations:
-            if reservation_station.is_free():
-                return reservation_station
-        return None
+        return self._rs_pool.find_free_station()
 
     def update_reservation_stations(self, executed_instructions: list[tuple]) -> None:
         """Update reservation stations with executed instruction results."""
-        for reservation_station in self.reservation_stations:
-            reservation_station.update(executed_instructions)
+        # The pool pushes each result only to the stations waiting on it
+        self._rs_pool.update_all(executed_instructions)
 
     def get_ready_instructions(self) -> list[Instruction]:
         """Get instructions ready for execution."""
-        ready_instructions = []
-        for reservation_station in self.reservation_stations:
-            ready_instruction = reservation_station.get_ready_instruction(
-                self.register_file, self.data_forwarding_unit
-            )
-            if ready_instruction is not None:
-                ready_instructions.append(ready_instruction)
-        return ready_instructions
+        return self._rs_pool.get_ready_instructions(
+            self.register_file, self.data_forwarding_unit
+        )
 
     def is_instruction_ready(self, instruction: Instruction) -> bool:
         """
@@ -227,9 +233,8 @@ class IssueStage:
                 available_units = self.execution_units[unit_type].get("count", 1)
                 used_units = sum(
                     1
-                    for rs in self.reservation_stations
-                    if not rs.is_free()
-                    and rs.instruction
+                    for rs in self._rs_pool.busy_stations()
+                    if rs.instruction
                     and self._get_execution_unit_type(rs.instruction) == unit_type
                 )
 
@@ -244,15 +249,7 @@ class IssueStage:
 
     def _get_execution_unit_type(self, instruction: Instruction) -> str:
         """Get the execution unit type required for an instruction."""
-        if instruction.instruction_type in [
-            InstructionType.LOAD,
-            InstructionType.STORE,
-        ]:
-            return "LSU"
-        elif instruction.instruction_type == InstructionType.FLOATING_POINT:
-            return "FPU"
-        else:
-            return "ALU"
+        return _EXECUTION_UNIT_FOR_TYPE.get(instruction.instruction_type, "ALU")
 
     def _check_additional_hazards(self, instruction: Instruction) -> bool:
         """
@@ -269,10 +266,9 @@ class IssueStage:
             dest_reg = instruction.get_destination_register()
 
             # Check if any reservation station has an instruction writing to same register
-            for rs in self.reservation_stations:
+            for rs in self._rs_pool.busy_stations():
                 if (
-                    not rs.is_free()
-                    and rs.instruction
+                    rs.instruction
                     and rs.instruction.has_destination_register()
                     and rs.instruction.get_destination_register() == dest_reg
                 ):
@@ -301,13 +297,11 @@ class IssueStage:
         if not self.reservation_stations:
             return 0.0
 
-        occupied = sum(1 for rs in self.reservation_stations if not rs.is_free())
-        return (occupied / len(self.reservation_stations)) * 100
+        return self._rs_pool.get_utilization()
 
     def reset(self) -> None:
         """Reset issue stage state."""
-        for rs in self.reservation_stations:
-            rs.reset()
+        self._rs_pool.reset_all()
 
         self.issued_count = 0
         self.stall_count = 0
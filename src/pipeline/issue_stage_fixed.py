@@ -9,7 +9,7 @@ import logging
 from typing import List, Optional
 
 from ..utils.instruction import Instruction
-from ..utils.reservation_station import ReservationStation
+from ..utils.reservation_station import ReservationStation, collect_results
 
 
 class IssueStage:
@@ -108,8 +108,11 @@ class IssueStage:
         self, executed_instructions: List[Instruction]
     ) -> None:
         """Update reservation stations with executed instruction results."""
+        # Index the results by destination once for all stations
+        produced = collect_results(executed_instructions)  # type: ignore[arg-type]
         for reservation_station in self.reservation_stations:
-            reservation_station.update(executed_instructions)
+            if reservation_station.busy:
+                reservation_station.apply_results(produced)
 
     def get_ready_instructions(self) -> List[Instruction]:
         """Get instructions ready for execution."""
@@ -55,6 +55,9 @@ class MemoryAccessStage:
         # Store buffer for write buffering
         self.store_buffer: List[Tuple[int, Any]] = []
         self.store_buffer_size = 8
+        # Address -> data of its buffered stores, oldest first; lets loads
+        # forward from (and check against) the buffer with one dict lookup
+        self._store_index: dict[int, List[Any]] = {}
 
         logging.debug("Initialized Memory Access Stage")
 
@@ -123,10 +126,10 @@ class MemoryAccessStage:
         logging.debug(f"Load from address {address:#x}")
 
         # Check store buffer first (store-to-load forwarding)
-        for store_addr, store_data in reversed(self.store_buffer):
-            if store_addr == address:
-                logging.debug(f"Store-to-load forwarding for address {address:#x}")
-                return store_data
+        buffered = self._store_index.get(address)
+        if buffered:
+            logging.debug(f"Store-to-load forwarding for address {address:#x}")
+            return buffered[-1]
 
         # Check cache
         data = self.data_cache.get_data(address)
@@ -194,6 +197,7 @@ class MemoryAccessStage:
             self._flush_oldest_store()
 
         self.store_buffer.append((address, store_data))
+        self._store_index.setdefault(address, []).append(store_data)
 
         # Update cache (write-through policy)
         self.data_cache.add_data(address, store_data)
@@ -217,50 +221,36 @@ class MemoryAccessStage:
         if hasattr(instruction, "memory_address"):
             return instruction.memory_address
 
-        # Parse from operands
-        if len(instruction.operands) >= 2:
-            if instruction.is_load():
-                # Load: lw $rt, offset($rs)
-                # operands[1] contains offset(base)
-                offset = 0
-                base_addr = 0
-
-                # Simple parsing - improve based on actual format
-                if (
-                    isinstance(instruction.operands[1], str)
-                    and "(" in instruction.operands[1]
-                ):
-                    parts = instruction.operands[1].split("(")
-                    offset = int(parts[0]) if parts[0] else 0
-                    base_reg = parts[1].rstrip(")")
-
-                    if hasattr(instruction, "register_values"):
-                        base_addr = instruction.register_values.get(base_reg, 0)
-                elif isinstance(instruction.operands[1], int):
-                    offset = instruction.operands[1]
-
+        # Load: lw $rt, offset($rs); store: sw $rt, offset($rs)
+        if len(instruction.operands) >= 2 and (
+            instruction.is_load() or instruction.is_store()
+        ):
+            base_addr = 0
+
+            # offset(base) is parsed once when the instruction is decoded
+            offset, base_reg = instruction.get_memory_operand()
+            if offset is not None:
+                if hasattr(instruction, "register_values"):
+                    base_addr = instruction.register_values.get(base_reg, 0)
                 return base_addr + offset
 
-            elif instruction.is_store():
-                # Store: sw $rt, offset($rs)
-                # Same parsing as load
-                offset = 0
-                base_addr = 0
-
-                if (
-                    isinstance(instruction.operands[1], str)
-                    and "(" in instruction.operands[1]
-                ):
-                    parts = instruction.operands[1].split("(")
-                    offset = int(parts[0]) if parts[0] else 0
-                    base_reg = parts[1].rstrip(")")
-
-                    if hasattr(instruction, "register_values"):
-                        base_addr = instruction.register_values.get(base_reg, 0)
-                elif isinstance(instruction.operands[1], int):
-                    offset = instruction.operands[1]
+            # Not decoded as a memory operand (e.g. an explicit instruction
+            # type was given); parse the operand directly
+            offset = 0
+            if (
+                isinstance(instruction.operands[1], str)
+                and "(" in instruction.operands[1]
+            ):
+                parts = instruction.operands[1].split("(")
+                offset = int(parts[0]) if parts[0] else 0
+                base_reg = parts[1].rstrip(")")
 
-                return base_addr + offset
+                if hasattr(instruction, "register_values"):
+                    base_addr = instruction.register_values.get(base_reg, 0)
+            elif isinstance(instruction.operands[1], int):
+                offset = instruction.operands[1]
+
+            return base_addr + offset
 
         # Default address
         return 0
@@ -274,6 +264,7 @@ class MemoryAccessStage:
                 try:
                     self.memory.write(address, [data])
                     logging.debug(f"Flushed store: {data} to address {address:#x}")
+                    self._forget_store(address, data)
                     flushed += 1
                 except Exception as e:
                     logging.error(f"Store buffer flush error at {address:#x}: {e}")
@@ -286,12 +277,22 @@ class MemoryAccessStage:
         """Flush oldest entry from store buffer."""
         if self.store_buffer:
             address, data = self.store_buffer.pop(0)
+            self._forget_store(address, data)
             try:
                 self.memory.write(address, [data])
                 logging.debug(f"Flushed oldest store: {data} to address {address:#x}")
             except Exception as e:
                 logging.error(f"Store flush error at {address:#x}: {e}")
 
+    def _forget_store(self, address: int, data: Any) -> None:
+        """Drop a store that has left the buffer from the address index."""
+        buffered = self._store_index[address]
+        # Removing the first equal value leaves the same value sequence as
+        # removing the exact entry, even if an older store was skipped
+        buffered.remove(data)
+        if not buffered:
+            del self._store_index[address]
+
     def get_statistics(self) -> dict:
         """Get memory access stage statistics."""
         total_accesses = self.cache_hits + self.cache_misses
@@ -316,6 +317,7 @@ class MemoryAccessStage:
         self.cache_misses = 0
         self.memory_stalls = 0
         self.store_buffer.clear()
+        self._store_index.clear()
 
         logging.info("Memory access stage reset")
 
@@ -398,11 +400,7 @@ class AdvancedMemoryAccessStage(MemoryAccessStage):
     ) -> bool:
         """Check if load has dependencies on pending stores."""
         # Check store buffer for address conflicts
-        for store_addr, _ in self.store_buffer:
-            if store_addr == load_address:
-                return True  # Dependency exists
-
-        return False
+        return load_address in self._store_index
 
     def _check_load_queue(self) -> None:
         """Check if queued loads can now proceed."""
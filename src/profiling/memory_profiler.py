@@ -71,9 +71,18 @@ class MemoryProfiler:
         self._initial_snapshot = self._take_snapshot()
         self._snapshots = [self._initial_snapshot]
 
-    def take_snapshot(self) -> MemorySnapshot:
-        """Take a memory snapshot at current point."""
-        snapshot = self._take_snapshot()
+    def take_snapshot(self, top_allocations: bool = False) -> MemorySnapshot:
+        """
+        Take a memory snapshot at current point.
+
+        Intermediate snapshots record memory sizes and object counts only;
+        copying and grouping every tracemalloc trace is the expensive part,
+        and the analysis reads allocations from the final snapshot alone.
+
+        Args:
+            top_allocations: Also collect ``top_allocations`` for this snapshot
+        """
+        snapshot = self._take_snapshot(top_allocations)
         self._snapshots.append(snapshot)
         return snapshot
 
@@ -99,7 +108,7 @@ class MemoryProfiler:
 
         return result
 
-    def _take_snapshot(self) -> MemorySnapshot:
+    def _take_snapshot(self, top_allocations: bool = True) -> MemorySnapshot:
         """Take a detailed memory snapshot."""
         import time
 
@@ -112,14 +121,15 @@ class MemoryProfiler:
             current, peak = tracemalloc.get_traced_memory()
             python_memory = current / 1024 / 1024  # Convert to MB
 
-        # Get garbage collection stats
+        # Get garbage collection stats; every tracked object is in exactly
+        # one generation, so the total needs no extra heap walk
         gc_stats = {f"generation_{i}": len(gc.get_objects(i)) for i in range(3)}
-        gc_stats["total_objects"] = len(gc.get_objects())
+        gc_stats["total_objects"] = sum(gc_stats.values())
 
         # Get top allocations if tracking is enabled
-        top_allocations = []
-        if self._tracemalloc_started:
-            top_allocations = self._get_top_allocations()
+        allocations = []
+        if top_allocations and self._tracemalloc_started:
+            allocations = self._get_top_allocations(tracemalloc.take_snapshot())
 
         return MemorySnapshot(
             timestamp=time.time(),
@@ -127,15 +137,13 @@ class MemoryProfiler:
             vms_memory=memory_info.vms / 1024 / 1024,  # MB
             python_memory=python_memory,
             gc_stats=gc_stats,
-            top_allocations=top_allocations,
+            top_allocations=allocations,
         )
 
-    def _get_top_allocations(self, limit: int = 10) -> list[dict[str, Any]]:
-        """Get top memory allocations."""
-        if not self._tracemalloc_started:
-            return []
-
-        snapshot = tracemalloc.take_snapshot()
+    def _get_top_allocations(
+        self, snapshot: tracemalloc.Snapshot, limit: int = 10
+    ) -> list[dict[str, Any]]:
+        """Get top memory allocations from a tracemalloc snapshot."""
         top_stats = snapshot.statistics("lineno")
 
         allocations = []
@@ -87,7 +87,12 @@ class PerformanceProfiler:
     def start_profiling(self) -> None:
         """Start performance profiling."""
         if self.enable_detailed_profiling:
-            self._profiler = cProfile.Profile()
+            # Reuse the profiler across sessions; clear() drops the previous
+            # session's stats so each result covers one run only
+            if self._profiler is None:
+                self._profiler = cProfile.Profile()
+            else:
+                self._profiler.clear()
             self._profiler.enable()
 
         self._start_time = time.time()
@@ -14,12 +14,14 @@ from typing import Any, List, Optional
 
 try:
     from ..utils.instruction import Instruction, InstructionType
+    from ..utils.instruction_parser import parse_register
 except (ImportError, ValueError):
     import os
     import sys
 
     sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
     from utils.instruction import Instruction, InstructionType
+    from utils.instruction_parser import parse_register
 
 
 class ROBEntryState(Enum):
@@ -77,7 +79,8 @@ class EnhancedRegisterRenaming:
         # Physical register file
         self.physical_registers = config.get("physical_registers", 128)
         self.physical_reg_file = [0] * self.physical_registers
-        self.physical_reg_ready = [True] * self.physical_registers
+        # One byte per physical register, 1 = value ready
+        self.physical_reg_ready = bytearray(b"\x01") * self.physical_registers
 
         # Register mapping
         self.rat = {}  # Register Alias Table: arch_reg -> physical_reg
@@ -158,7 +161,7 @@ class EnhancedRegisterRenaming:
             physical_dest = self.free_list.pop(0)
             old_physical_dest = self.rat.get(dest_reg)
             self.rat[dest_reg] = physical_dest
-            self.physical_reg_ready[physical_dest] = False
+            self.physical_reg_ready[physical_dest] = 0
 
         # Create ROB entry
         rob_entry = ROBEntry(
@@ -246,7 +249,7 @@ class EnhancedRegisterRenaming:
 
         # Make destination register ready
         if rob_entry.physical_dest is not None:  # type: ignore[union-attr]
-            self.physical_reg_ready[rob_entry.physical_dest] = True  # type: ignore[union-attr]
+            self.physical_reg_ready[rob_entry.physical_dest] = 1  # type: ignore[union-attr]
             if result is not None:
                 self.physical_reg_file[rob_entry.physical_dest] = result  # type: ignore[union-attr]
 
@@ -450,8 +453,6 @@ class EnhancedRegisterRenaming:
 
     def _parse_register(self, reg_str: str) -> int:
         """Parse register string to register number. Delegates to canonical implementation."""
-        from utils.instruction_parser import parse_register
-
         return parse_register(reg_str)
 
     def _create_issue_queue_entry(
@@ -467,8 +468,9 @@ class EnhancedRegisterRenaming:
         src2_physical = self.rat.get(src_regs[1]) if len(src_regs) > 1 else None
 
         # Check if sources are ready
-        src1_ready = src1_physical is None or self.physical_reg_ready[src1_physical]
-        src2_ready = src2_physical is None or self.physical_reg_ready[src2_physical]
+        ready = self.physical_reg_ready
+        src1_ready = src1_physical is None or ready[src1_physical] == 1
+        src2_ready = src2_physical is None or ready[src2_physical] == 1
 
         # Determine functional unit type
         fu_type = self._get_functional_unit_type(instruction)
@@ -8,8 +8,11 @@ supporting MIPS-style register naming and access.
 from __future__ import annotations
 
 import logging
+import sys
 from typing import Any, List, Mapping, Optional, Union
 
+_logger = logging.getLogger(__name__)
+
 
 class RegisterFile:
     """
@@ -120,12 +123,26 @@ class RegisterFile:
         self.write_count = 0
         self.port_conflicts = 0
 
+        # Every accepted register name ("$t0", "r8", "8") -> number, built
+        # once so name resolution on the read/write path is a dict lookup
+        self._name_index: dict[str, int] = dict(self.REGISTER_NAMES)
+        for reg_num in range(num_registers):
+            self._name_index.setdefault(sys.intern(f"r{reg_num}"), reg_num)
+            self._name_index.setdefault(sys.intern(str(reg_num)), reg_num)
+        # Canonical name of each register, for the read/write debug logs
+        self._register_names = [
+            self._find_register_name(reg_num) for reg_num in range(num_registers)
+        ]
+
         # Initialize special registers
         self._initialize_special_registers()
 
-        logging.debug(
-            f"Initialized Register File with {num_registers} registers, "
-            f"{num_read_ports} read ports, {num_write_ports} write ports"
+        _logger.debug(
+            "Initialized Register File with %d registers, "
+            "%d read ports, %d write ports",
+            num_registers,
+            num_read_ports,
+            num_write_ports,
         )
 
     def _initialize_special_registers(self) -> None:
@@ -158,19 +175,15 @@ class RegisterFile:
                 raise ValueError(f"Invalid register number: {register}")
 
         elif isinstance(register, str):
-            # Try MIPS name mapping first
-            if register in self.REGISTER_NAMES:
-                return self.REGISTER_NAMES[register]
-
-            # Try r<N> format
-            if register.startswith("r") and register[1:].isdigit():
-                reg_num = int(register[1:])
-                if 0 <= reg_num < self.num_registers:
-                    return reg_num
-
-            # Try direct number string
-            if register.isdigit():
-                reg_num = int(register)
+            # MIPS names, r<N> and plain number strings
+            reg_num = self._name_index.get(register)
+            if reg_num is not None:
+                return reg_num
+
+            # Number strings with leading zeros ("r08", "008")
+            digits = register[1:] if register.startswith("r") else register
+            if digits.isdigit():
+                reg_num = int(digits)
                 if 0 <= reg_num < self.num_registers:
                     return reg_num
 
@@ -189,7 +202,10 @@ class RegisterFile:
         Returns:
             Register value
         """
-        reg_num = self._resolve_register(register)
+        # Exact names are the common case; anything else takes the full path
+        reg_num = self._name_index.get(register) if type(register) is str else None
+        if reg_num is None:
+            reg_num = self._resolve_register(register)
 
         # $zero always returns 0
         if reg_num == 0:
@@ -198,8 +214,8 @@ class RegisterFile:
         self.read_count += 1
         value = self.registers[reg_num]
 
-        logging.debug(
-            f"Read R{reg_num} ({self._get_register_name(reg_num)}) = {value:#x}"
+        _logger.debug(
+            "Read R%d (%s) = %#x", reg_num, self._register_names[reg_num], value
         )
 
         return value
@@ -212,11 +228,13 @@ class RegisterFile:
             register: Register identifier (name or number)
             value: Value to write
         """
-        reg_num = self._resolve_register(register)
+        reg_num = self._name_index.get(register) if type(register) is str else None
+        if reg_num is None:
+            reg_num = self._resolve_register(register)
 
         # $zero is read-only
         if reg_num == 0:
-            logging.debug("Attempted write to $zero ignored")
+            _logger.debug("Attempted write to $zero ignored")
             return
 
         # Convert value to integer if needed
@@ -225,11 +243,11 @@ class RegisterFile:
                 value = int(value)
             except (ValueError, TypeError):
                 value = 0
-                logging.warning("Invalid value for register write, using 0")
+                _logger.warning("Invalid value for register write, using 0")
 
         # Check if register is locked
         if self.register_locks[reg_num]:
-            logging.warning(f"Register R{reg_num} is locked, queueing write")
+            _logger.warning("Register R%d is locked, queueing write", reg_num)
             self.pending_writes.append((reg_num, value))
             return
 
@@ -237,9 +255,12 @@ class RegisterFile:
         old_value = self.registers[reg_num]
         self.registers[reg_num] = value & 0xFFFFFFFF  # 32-bit register
 
-        logging.debug(
-            f"Write R{reg_num} ({self._get_register_name(reg_num)}) = "
-            f"{value:#x} (was {old_value:#x})"
+        _logger.debug(
+            "Write R%d (%s) = %#x (was %#x)",
+            reg_num,
+            self._register_names[reg_num],
+            value,
+            old_value,
         )
 
     def read_multiple(self, registers: list[Union[str, int]]) -> list[int]:
@@ -260,7 +281,14 @@ class RegisterFile:
                 f"Too many simultaneous reads: {len(registers)} > {self.num_read_ports}"
             )
 
-        return [self.read_register(reg) for reg in registers]
+        # Resolve every port first, then gather in one pass; $zero reads
+        # return 0 and don't count as port reads
+        resolve = self._resolve_register
+        reg_nums = [resolve(reg) for reg in registers]
+        regs = self.registers
+        values = [regs[reg_num] if reg_num else 0 for reg_num in reg_nums]
+        self.read_count += len(reg_nums) - reg_nums.count(0)
+        return values
 
     def write_multiple(self, writes: list[tuple[Union[str, int], Any]]) -> None:
         """
@@ -276,8 +304,8 @@ class RegisterFile:
             self.port_conflicts += 1
             # Only process up to num_write_ports writes
             writes = writes[: self.num_write_ports]
-            logging.warning(
-                f"Write port conflict: only processing {self.num_write_ports} writes"
+            _logger.warning(
+                "Write port conflict: only processing %d writes", self.num_write_ports
             )
 
         for register, value in writes:
@@ -288,14 +316,14 @@ class RegisterFile:
         reg_num = self._resolve_register(register)
         if reg_num != 0:  # Can't lock $zero
             self.register_locks[reg_num] = True
-            logging.debug(f"Locked register R{reg_num}")
+            _logger.debug("Locked register R%d", reg_num)
 
     def unlock_register(self, register: Union[str, int]) -> None:
         """Unlock a register and process any pending writes."""
         reg_num = self._resolve_register(register)
         if reg_num != 0 and self.register_locks[reg_num]:
             self.register_locks[reg_num] = False
-            logging.debug(f"Unlocked register R{reg_num}")
+            _logger.debug("Unlocked register R%d", reg_num)
 
             # Process pending writes for this register
             remaining_writes = []
@@ -309,6 +337,12 @@ class RegisterFile:
 
     def _get_register_name(self, reg_num: int) -> str:
         """Get the canonical name for a register number."""
+        if 0 <= reg_num < len(self._register_names):
+            return self._register_names[reg_num]
+        return self._find_register_name(reg_num)
+
+    def _find_register_name(self, reg_num: int) -> str:
+        """Look up the canonical name for a register number."""
         # Reverse lookup in REGISTER_NAMES
         for name, num in self.REGISTER_NAMES.items():
             if num == reg_num and not name.startswith("$") and name[1:].isdigit():
@@ -388,7 +422,7 @@ class RegisterFile:
         # Re-initialize special registers
         self._initialize_special_registers()
 
-        logging.info("Register file reset")
+        _logger.info("Register file reset")
 
     def __str__(self) -> str:
         """String representation showing key registers."""
@@ -441,9 +475,10 @@ class PhysicalRegisterFile(RegisterFile):
         # Reverse mapping for debugging
         self.reverse_map: dict[int, int] = {i: i for i in range(num_architectural)}
 
-        logging.debug(
-            f"Initialized Physical Register File: "
-            f"{num_architectural} architectural, {num_physical} physical"
+        _logger.debug(
+            "Initialized Physical Register File: %d architectural, %d physical",
+            num_architectural,
+            num_physical,
         )
 
     def allocate_physical_register(self, arch_reg: int) -> int | None:
@@ -457,7 +492,7 @@ class PhysicalRegisterFile(RegisterFile):
             Physical register number or None if none available
         """
         if not self.free_list:
-            logging.warning("No free physical registers available")
+            _logger.warning("No free physical registers available")
             return None
 
         # Get a free physical register
@@ -472,7 +507,7 @@ class PhysicalRegisterFile(RegisterFile):
             del self.reverse_map[old_phys]
         self.reverse_map[phys_reg] = arch_reg
 
-        logging.debug(f"Mapped architectural R{arch_reg} to physical P{phys_reg}")
+        _logger.debug("Mapped architectural R%d to physical P%d", arch_reg, phys_reg)
 
         return phys_reg
 
@@ -489,7 +524,7 @@ class PhysicalRegisterFile(RegisterFile):
             if phys_reg in self.reverse_map:
                 del self.reverse_map[phys_reg]
 
-            logging.debug(f"Freed physical register P{phys_reg}")
+            _logger.debug("Freed physical register P%d", phys_reg)
 
     def read_architectural(self, arch_reg: int) -> int:
         """Read value of an architectural register."""
@@ -15,12 +15,14 @@ from typing import Any, List, Optional
 # Handle imports for both package and direct execution
 try:
     from .instruction import Instruction, InstructionType
+    from .instruction_parser import parse_register
 except (ImportError, ValueError):
     import os
     import sys
 
     sys.path.insert(0, os.path.dirname(__file__))
     from instruction import Instruction, InstructionType  # type: ignore[no-redef]
+    from instruction_parser import parse_register  # type: ignore[no-redef]
 
 # Import memory hierarchy for cache integration
 try:
@@ -768,8 +770,6 @@ class CycleAccurateExecutionEngine:
 
     def _parse_register(self, reg_str: str | int) -> int:
         """Parse register string to register number. Delegates to canonical implementation."""
-        from utils.instruction_parser import parse_register
-
         return parse_register(reg_str)
 
     def _get_register_value(self, reg_num: int) -> int:
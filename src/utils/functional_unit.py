@@ -11,7 +11,8 @@ Python Version: 3.10+
 
 from __future__ import annotations
 
-from typing import Any, List, Optional
+import operator
+from typing import Any, Callable, List, Optional
 
 # Handle imports for both package and direct execution
 try:
@@ -28,6 +29,24 @@ except (ImportError, ValueError):
 from .instruction import Instruction
 
 
+def _slt(a: int, b: int) -> int:
+    return 1 if a < b else 0
+
+
+# ALU opcode -> operation on (source1, source2/immediate). DIV is handled
+# separately so a zero divisor raises the simulator's error.
+_ALU_OPS: dict[str, Callable[[int, int], int]] = {
+    **dict.fromkeys(("ADD", "ADDI"), operator.add),
+    **dict.fromkeys(("SUB", "SUBI"), operator.sub),
+    "MUL": operator.mul,
+    "DIV": operator.floordiv,
+    **dict.fromkeys(("AND", "ANDI"), operator.and_),
+    **dict.fromkeys(("OR", "ORI"), operator.or_),
+    **dict.fromkeys(("XOR", "XORI"), operator.xor),
+    **dict.fromkeys(("SLT", "SLTI"), _slt),
+}
+
+
 class FunctionalUnit:
     """
     Base class for functional units in the processor pipeline.
@@ -38,8 +57,21 @@ class FunctionalUnit:
         busy: Whether the unit is currently executing an instruction
         remaining_cycles: Cycles left until current operation completes
         current_instruction: The instruction currently being executed
+
+    Units are polled every cycle by the execute stage, so they use
+    ``__slots__`` rather than a per-instance ``__dict__``.
     """
 
+    __slots__ = (
+        "_opcode_set",
+        "busy",
+        "current_instruction",
+        "id",
+        "remaining_cycles",
+        "result",
+        "supported_opcodes",
+    )
+
     def __init__(self, id: int, supported_opcodes: List[str]) -> None:
         """
         Initialize a functional unit.
@@ -50,6 +82,8 @@ class FunctionalUnit:
         """
         self.id = id
         self.supported_opcodes = supported_opcodes
+        # can_execute() runs for every unit probed during dispatch
+        self._opcode_set = frozenset(op.upper() for op in supported_opcodes)
         self.busy = False
         self.remaining_cycles = 0
         self.current_instruction: Instruction | None = None
@@ -69,7 +103,10 @@ class FunctionalUnit:
         Returns:
             True if the unit supports this opcode, False otherwise
         """
-        return opcode.upper() in [op.upper() for op in self.supported_opcodes]
+        opcode_set = self._opcode_set
+        # Decoded opcodes are already upper-case; only fall back to
+        # normalizing for raw strings
+        return opcode in opcode_set or opcode.upper() in opcode_set
 
     def execute(
         self, instruction: Instruction, register_file: RegisterFile
@@ -173,6 +210,8 @@ class ALU(FunctionalUnit):
     Supports: ADD, SUB, MUL, DIV, AND, OR, XOR, SLT
     """
 
+    __slots__ = ()
+
     def __init__(self, id: int) -> None:
         super().__init__(
             id,
@@ -207,7 +246,7 @@ class ALU(FunctionalUnit):
         Returns:
             The result of the ALU operation
         """
-        opcode = instruction.opcode.upper()
+        opcode = instruction.opcode
 
         # Get operands - MIPS format: destination, source1, source2/immediate
         if len(instruction.operands) >= 3:
@@ -230,26 +269,12 @@ class ALU(FunctionalUnit):
             raise ValueError(f"Insufficient operands for {opcode}")
 
         # Perform operation
-        if opcode in ["ADD", "ADDI"]:
-            result = rs1_val + rs2_val
-        elif opcode in ["SUB", "SUBI"]:
-            result = rs1_val - rs2_val
-        elif opcode == "MUL":
-            result = rs1_val * rs2_val
-        elif opcode == "DIV":
-            if rs2_val == 0:
-                raise ValueError("Division by zero")
-            result = rs1_val // rs2_val
-        elif opcode in ["AND", "ANDI"]:
-            result = rs1_val & rs2_val
-        elif opcode in ["OR", "ORI"]:
-            result = rs1_val | rs2_val
-        elif opcode in ["XOR", "XORI"]:
-            result = rs1_val ^ rs2_val
-        elif opcode in ["SLT", "SLTI"]:
-            result = 1 if rs1_val < rs2_val else 0
-        else:
+        operation = _ALU_OPS.get(opcode)
+        if operation is None:
             raise ValueError(f"Unsupported ALU operation: {opcode}")
+        if opcode == "DIV" and rs2_val == 0:
+            raise ValueError("Division by zero")
+        result = operation(rs1_val, rs2_val)
 
         self.result = result
         return result
@@ -262,6 +287,8 @@ class FPU(FunctionalUnit):
     Supports: FADD, FSUB, FMUL, FDIV
     """
 
+    __slots__ = ()
+
     def __init__(self, id: int) -> None:
         super().__init__(id, supported_opcodes=["FADD", "FSUB", "FMUL", "FDIV"])
 
@@ -278,7 +305,7 @@ class FPU(FunctionalUnit):
         Returns:
             The result of the FPU operation
         """
-        opcode = instruction.opcode.upper()
+        opcode = instruction.opcode
 
         # Get operands
         if len(instruction.operands) >= 2:
@@ -312,6 +339,8 @@ class LSU(FunctionalUnit):
     Supports: LW (load word), SW (store word)
     """
 
+    __slots__ = ("data_cache", "memory")
+
     def __init__(self, id: int, data_cache: DataCache, memory: Memory) -> None:
         """
         Initialize the LSU.
@@ -338,7 +367,7 @@ class LSU(FunctionalUnit):
         Returns:
             The loaded value for load operations, None for store operations
         """
-        opcode = instruction.opcode.upper()
+        opcode = instruction.opcode
 
         # Parse memory operand format: offset(base)
         # Example: 8($t0) means offset=8, base=register $t0
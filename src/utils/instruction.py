@@ -7,9 +7,13 @@ and manipulating processor instructions in the superscalar pipeline simulator.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from bisect import bisect_right
 from enum import Enum
-from typing import Any, List, Optional, Set, Type, Union
+from functools import lru_cache
+import operator
+import re
+import sys
+from typing import Any, Callable, List, Optional, Set, Type, Union
 
 
 class InstructionType(Enum):
@@ -41,7 +45,253 @@ class InstructionStatus(Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+# Opcode classification tables, built once at import
+_OPCODE_TYPES: dict[str, InstructionType] = {
+    **dict.fromkeys(
+        ("ADD", "SUB", "MUL", "DIV", "ADDI", "SUBI"), InstructionType.ARITHMETIC
+    ),
+    **dict.fromkeys(
+        (
+            "AND",
+            "OR",
+            "XOR",
+            "SLT",
+            "ANDI",
+            "ORI",
+            "XORI",
+            "SLTI",
+            "SLL",
+            "SRL",
+            "SRA",
+            "NOR",
+            "LUI",
+        ),
+        InstructionType.LOGICAL,
+    ),
+    **dict.fromkeys(("LW", "SW", "LB", "LH", "SB", "SH"), InstructionType.MEMORY),
+    **dict.fromkeys(
+        ("BEQ", "BNE", "BLT", "BGE", "BLTU", "BGEU"), InstructionType.BRANCH
+    ),
+    **dict.fromkeys(("J", "JAL", "JR", "JALR"), InstructionType.JUMP),
+    **dict.fromkeys(("FADD", "FSUB", "FMUL", "FDIV"), InstructionType.FLOAT),
+    "NOP": InstructionType.NOP,
+}
+
+_R_TYPE_OPCODES = frozenset(
+    {
+        "ADD",
+        "SUB",
+        "MUL",
+        "DIV",
+        "AND",
+        "OR",
+        "XOR",
+        "SLT",
+        "NOR",
+        "FADD",
+        "FSUB",
+        "FMUL",
+        "FDIV",
+    }
+)
+
+_I_TYPE_OPCODES = frozenset(
+    {
+        "ADDI",
+        "SUBI",
+        "ANDI",
+        "ORI",
+        "XORI",
+        "SLTI",
+        "LW",
+        "LB",
+        "LH",
+        "LUI",
+        "LI",
+        "LA",
+        "SLL",
+        "SRL",
+        "SRA",
+    }
+)
+
+_LOAD_OPCODES = frozenset({"LW", "LB", "LH"})
+_LINK_OPCODES = frozenset({"JAL", "JALR"})
+_STORE_OPCODES = frozenset({"SW", "SB", "SH"})
+
+# Expected execution latency (cycles) per opcode; unlisted opcodes take 1
+_LATENCY_MAP: dict[str, int] = {
+    "ADD": 1,
+    "SUB": 1,
+    "ADDI": 1,
+    "SUBI": 1,
+    "AND": 1,
+    "OR": 1,
+    "XOR": 1,
+    "SLT": 1,
+    "ANDI": 1,
+    "ORI": 1,
+    "XORI": 1,
+    "SLTI": 1,
+    "MUL": 3,
+    "DIV": 10,
+    "FADD": 3,
+    "FSUB": 3,
+    "FMUL": 5,
+    "FDIV": 15,
+    "LW": 2,
+    "SW": 2,
+    "LB": 2,
+    "LH": 2,
+    "SB": 2,
+    "SH": 2,
+    "BEQ": 1,
+    "BNE": 1,
+    "BLT": 1,
+    "BGE": 1,
+    "J": 1,
+    "JAL": 1,
+    "JR": 1,
+    "JALR": 1,
+    "NOP": 1,
+}
+
+
+# Condition evaluated on (rs1, rs2) for each conditional branch opcode
+_BRANCH_CMP: dict[str, Callable[[Any, Any], bool]] = {
+    "BEQ": operator.eq,
+    "BNE": operator.ne,
+    "BLT": operator.lt,
+    "BGE": operator.ge,
+}
+
+_ALWAYS_TAKEN = frozenset({"J", "JAL", "JR", "JALR"})
+
+# Load/store address operand: "offset(base)", offset may be empty
+_MEM_OPERAND_RE = re.compile(r"([^(]*)\(([^)]*)\)")
+
+# Integer literals accepted as branch offsets / jump targets
+_DEC_LITERAL_RE = re.compile(r"\s*[+-]?\d+\s*")
+_HEX_LITERAL_RE = re.compile(r"0x[0-9a-fA-F]+")
+
+_DIRECT_JUMP_OPCODES = frozenset({"J", "JAL"})
+
+
+def _int_literal(operand: Any) -> int | None:
+    """Convert an int or a decimal/``0x`` hex literal to int, else None."""
+    if isinstance(operand, int):
+        return operand
+    if isinstance(operand, str):
+        if _DEC_LITERAL_RE.fullmatch(operand):
+            return int(operand)
+        if _HEX_LITERAL_RE.fullmatch(operand):
+            return int(operand, 16)
+    return None
+
+
+def _intern(operand: Any) -> Any:
+    """Intern register-name strings so comparisons can short-circuit on identity."""
+    return sys.intern(operand) if isinstance(operand, str) else operand
+
+
+# Operand-derived fields of a decoded instruction: (implied destination,
+# memory offset, memory base, source registers, source registers as a set or
+# None if an operand is unhashable)
+_Decoded = tuple[
+    str | None,
+    int | None,
+    str | None,
+    tuple[str, ...],
+    frozenset[str] | None,
+]
+
+
+@lru_cache(maxsize=4096)
+def _decode(
+    opcode: str, instruction_type: InstructionType, operands: tuple[Any, ...]
+) -> _Decoded:
+    """
+    Decode the operand-derived fields of an instruction.
+
+    The result depends only on the arguments, so it is cached: a program's
+    instructions are decoded once per distinct (opcode, type, operands)
+    combination no matter how often they are re-fetched.
+
+    Args:
+        opcode: Upper-cased, interned opcode
+        instruction_type: Instruction type (given or derived from the opcode)
+        operands: Operands as a tuple
+
+    Returns:
+        (destination, memory offset, memory base, source registers, source
+        register set). The destination is None for instructions that don't
+        write a register.
+    """
+    is_store = opcode in _STORE_OPCODES
+    is_r_type = opcode in _R_TYPE_OPCODES
+    is_i_type = opcode in _I_TYPE_OPCODES
+
+    destination = None
+    if not (
+        is_store
+        or instruction_type is InstructionType.BRANCH
+        or instruction_type is InstructionType.JUMP
+    ):
+        if is_r_type and len(operands) >= 3:
+            # R-type: op rd, rs1, rs2
+            destination = _intern(operands[0])
+        elif is_i_type and len(operands) >= 2:
+            # I-type: op rd, rs1, imm
+            destination = _intern(operands[0])
+        elif opcode in _LINK_OPCODES and len(operands) >= 1:
+            # Jump and link saves return address
+            destination = "$ra"  # Return address register
+
+    # Load/store "offset(base)" address operand
+    mem_offset = mem_base = None
+    if (
+        instruction_type == InstructionType.MEMORY
+        and len(operands) >= 2
+        and isinstance(operands[1], str)
+    ):
+        match = _MEM_OPERAND_RE.match(operands[1])
+        if match is not None:
+            offset_str, base_reg = match.groups()
+            mem_base = sys.intern(base_reg)
+            try:
+                mem_offset = int(offset_str) if offset_str.strip() else 0
+            except ValueError:
+                # Symbolic offset (e.g. a label); left for the assembler
+                mem_offset = None
+
+    sources: list[Any] = []
+    if is_r_type:
+        # R-type: rd, rs1, rs2
+        if len(operands) >= 3:
+            sources.extend((operands[1], operands[2]))
+    elif is_i_type:
+        # I-type: rd, rs1, imm (loads: rd, offset(rs1))
+        if len(operands) >= 2:
+            sources.append(mem_base if mem_base is not None else operands[1])
+    elif is_store:
+        # S-type: rs2, offset(rs1)
+        if len(operands) >= 2:
+            sources.append(operands[0])  # Value to store
+            if mem_base is not None:
+                sources.append(mem_base)
+    elif instruction_type == InstructionType.BRANCH:
+        # Branch: rs1, rs2, target
+        if len(operands) >= 2:
+            sources.extend((operands[0], operands[1]))
+
+    src_regs = tuple(_intern(reg) for reg in sources)
+    try:
+        src_set: frozenset[str] | None = frozenset(src_regs)
+    except TypeError:
+        src_set = None  # Unhashable operand (only decoded uncached)
+    return destination, mem_offset, mem_base, src_regs, src_set
+
+
 class Instruction:
     """
     Represents a processor instruction with all necessary metadata.
@@ -57,121 +307,165 @@ class Instruction:
         completion_cycle: Cycle when instruction completed
         result: Result of instruction execution
         prediction_info: Branch prediction metadata
+        latency: Execution latency in cycles
+
+    Instructions are created for every fetched slot, so the class uses
+    ``__slots__`` instead of a per-instance ``__dict__``. Pipeline stages
+    attach a small, fixed set of bookkeeping attributes while an instruction
+    is in flight; those are declared as slots too and stay unset until a
+    stage assigns them (so ``hasattr`` checks keep working).
     """
 
-    address: int
-    opcode: str
-    operands: list[Union[str, int]] = field(default_factory=list)
-    destination: str | None = None
-    instruction_type: InstructionType | None = None
-    status: InstructionStatus = InstructionStatus.FETCHED
-    issue_cycle: int | None = None
-    completion_cycle: int | None = None
-    result: Any | None = None
-    prediction_info: dict[str, Any] = field(default_factory=dict)
-    latency: int = 1  # Default latency of 1 cycle
-
-    def __post_init__(self) -> None:
-        """Initialize instruction type based on opcode if not provided."""
+    # Grouped by lifecycle rather than sorted, to keep the comments meaningful
+    __slots__ = (  # noqa: RUF023
+        "address",
+        "opcode",
+        "operands",
+        "destination",
+        "instruction_type",
+        "status",
+        "issue_cycle",
+        "completion_cycle",
+        "result",
+        "prediction_info",
+        "latency",
+        # Attached by pipeline stages while the instruction is in flight
+        "assigned_unit",
+        "exception",
+        "forwarded_values",
+        "register_values",
+        "resolved_operands",
+        "rob_id",
+        # Derived at construction time
+        "_mem_offset",
+        "_mem_base",
+        "_src_regs",
+        "_src_set",
+        "_has_dest",
+        # Lazily cached text form (operands don't change after construction)
+        "_str",
+        # Source register numbers and their bitmask, cached on first use by
+        # source_register_numbers()
+        "_src_reg_nums",
+        "_src_reg_mask",
+    )
+
+    _src_regs: list[str | int]
+    _str: str
+    _src_reg_nums: tuple[int, ...]
+    _src_reg_mask: int
+
+    # Fields that take part in equality comparison (dataclass semantics)
+    _compare_fields: tuple[str, ...] = (
+        "address",
+        "opcode",
+        "operands",
+        "destination",
+        "instruction_type",
+        "status",
+        "issue_cycle",
+        "completion_cycle",
+        "result",
+        "prediction_info",
+        "latency",
+    )
+
+    # Positional order matches the dataclass constructor this class replaced
+    def __init__(  # noqa: PLR0917
+        self,
+        address: int,
+        opcode: str,
+        operands: list[Union[str, int]] | None = None,
+        destination: str | None = None,
+        instruction_type: InstructionType | None = None,
+        status: InstructionStatus = InstructionStatus.FETCHED,
+        issue_cycle: int | None = None,
+        completion_cycle: int | None = None,
+        result: Any | None = None,
+        prediction_info: dict[str, Any] | None = None,
+        latency: int = 1,
+    ) -> None:
+        self.address = address
+        # Normalize opcode to uppercase; every predicate below relies on it
+        self.opcode = sys.intern(opcode.upper())
+        self.operands: list[Union[str, int]] = operands if operands is not None else []
+        self.destination = _intern(destination)
+        self.instruction_type = instruction_type
+        self.status = status
+        self.issue_cycle = issue_cycle
+        self.completion_cycle = completion_cycle
+        self.result = result
+        self.prediction_info: dict[str, Any] = (
+            prediction_info if prediction_info is not None else {}
+        )
+        self.latency = latency
+
+        # Initialize instruction type based on opcode if not provided
         if self.instruction_type is None:
             self.instruction_type = self._determine_type()
 
-        # Normalize opcode to uppercase
-        self.opcode = self.opcode.upper()
-
-        # Parse destination from operands if not explicitly set
-        if self.destination is None and self.has_destination_register():
-            self._parse_destination()
+        # Register-name operands are swapped for interned copies in place
+        operands = tuple(self.operands)
+        if isinstance(self.operands, list):
+            for i, op in enumerate(operands):
+                if type(op) is str and op.startswith(("$", "r")):
+                    self.operands[i] = sys.intern(op)
+
+        # Operands never change after construction, so the destination,
+        # memory operand and source registers are decoded once. All-string
+        # operands are shared between instructions with identical text via
+        # the _decode cache; anything else is decoded uncached, as the cache
+        # key would treat 1, 1.0 and True as the same operand (and can't
+        # hold unhashable ones)
+        key = (self.opcode, self.instruction_type, operands)
+        if all(type(op) is str for op in operands):
+            decoded = _decode(*key)
+        else:
+            decoded = _decode.__wrapped__(*key)
+        (
+            destination,
+            self._mem_offset,
+            self._mem_base,
+            sources,
+            self._src_set,
+        ) = decoded
+        if self.destination is None:
+            self.destination = destination
+        self._src_regs = list(sources)
+        # Store and branch instructions don't have destinations
+        self._has_dest = not (
+            self.opcode in _STORE_OPCODES
+            or self.instruction_type is InstructionType.BRANCH
+            or self.instruction_type is InstructionType.JUMP
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare field-by-field, matching the former dataclass behaviour."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        for name in self._compare_fields:
+            if getattr(self, name) != getattr(other, name):
+                return False
+        return True
+
+    __hash__ = None  # type: ignore[assignment]
 
     def _determine_type(self) -> InstructionType:
         """Determine instruction type from opcode."""
-        opcode_upper = self.opcode.upper()
-
-        if opcode_upper in ["ADD", "SUB", "MUL", "DIV", "ADDI", "SUBI"]:
-            return InstructionType.ARITHMETIC
-        elif opcode_upper in [
-            "AND",
-            "OR",
-            "XOR",
-            "SLT",
-            "ANDI",
-            "ORI",
-            "XORI",
-            "SLTI",
-            "SLL",
-            "SRL",
-            "SRA",
-            "NOR",
-            "LUI",
-        ]:
-            return InstructionType.LOGICAL
-        elif opcode_upper in ["LW", "SW", "LB", "LH", "SB", "SH"]:
-            return InstructionType.MEMORY
-        elif opcode_upper in ["BEQ", "BNE", "BLT", "BGE", "BLTU", "BGEU"]:
-            return InstructionType.BRANCH
-        elif opcode_upper in ["J", "JAL", "JR", "JALR"]:
-            return InstructionType.JUMP
-        elif opcode_upper in ["FADD", "FSUB", "FMUL", "FDIV"]:
-            return InstructionType.FLOAT
-        elif opcode_upper == "NOP":
-            return InstructionType.NOP
-        else:
-            # Default to arithmetic for unknown opcodes
-            return InstructionType.ARITHMETIC
-
-    def _parse_destination(self) -> None:
-        """Parse destination register from operands based on instruction format."""
-        if self.is_r_type() and len(self.operands) >= 3:
-            # R-type: op rd, rs1, rs2
-            self.destination = self.operands[0]  # type: ignore[assignment]
-        elif self.is_i_type() and len(self.operands) >= 2:
-            # I-type: op rd, rs1, imm
-            self.destination = self.operands[0]  # type: ignore[assignment]
-        elif self.opcode.upper() in ["JAL", "JALR"] and len(self.operands) >= 1:
-            # Jump and link saves return address
-            self.destination = "$ra"  # Return address register
+        # Default to arithmetic for unknown opcodes
+        return _OPCODE_TYPES.get(self.opcode, InstructionType.ARITHMETIC)
 
     def is_r_type(self) -> bool:
         """Check if this is an R-type instruction (register-register)."""
-        return self.opcode.upper() in [
-            "ADD",
-            "SUB",
-            "MUL",
-            "DIV",
-            "AND",
-            "OR",
-            "XOR",
-            "SLT",
-            "NOR",
-            "FADD",
-            "FSUB",
-            "FMUL",
-            "FDIV",
-        ]
+        return self.opcode in _R_TYPE_OPCODES
 
     def is_i_type(self) -> bool:
         """Check if this is an I-type instruction (register-immediate)."""
-        return self.opcode.upper() in [
-            "ADDI",
-            "SUBI",
-            "ANDI",
-            "ORI",
-            "XORI",
-            "SLTI",
-            "LW",
-            "LB",
-            "LH",
-            "LUI",
-            "LI",
-            "LA",
-            "SLL",
-            "SRL",
-            "SRA",
-        ]
+        return self.opcode in _I_TYPE_OPCODES
 
     def is_s_type(self) -> bool:
         """Check if this is an S-type instruction (store)."""
-        return self.opcode.upper() in ["SW", "SB", "SH"]
+        return self.opcode in _STORE_OPCODES
 
     def is_memory_operation(self) -> bool:
         """Check if this instruction performs memory access."""
@@ -179,15 +473,18 @@ class Instruction:
 
     def is_load(self) -> bool:
         """Check if this is a load instruction."""
-        return self.opcode.upper() in ["LW", "LB", "LH"]
+        return self.opcode in _LOAD_OPCODES
 
     def is_store(self) -> bool:
         """Check if this is a store instruction."""
-        return self.opcode.upper() in ["SW", "SB", "SH"]
+        return self.opcode in _STORE_OPCODES
 
     def is_branch(self) -> bool:
         """Check if this is a branch instruction."""
-        return self.instruction_type in [InstructionType.BRANCH, InstructionType.JUMP]
+        return (
+            self.instruction_type is InstructionType.BRANCH
+            or self.instruction_type is InstructionType.JUMP
+        )
 
     def is_conditional_branch(self) -> bool:
         """Check if this is a conditional branch."""
@@ -211,40 +508,72 @@ class Instruction:
 
     def has_destination_register(self) -> bool:
         """Check if this instruction writes to a destination register."""
-        # Store and branch instructions don't have destinations
-        return not (self.is_store() or self.is_branch())
+        # Fixed by opcode and type, so decided once at construction
+        return self._has_dest
 
     def get_destination_register(self) -> str | None:
         """Get the destination register name."""
         return self.destination
 
     def get_source_registers(self) -> list[str]:
-        """Get list of source register names."""
-        sources = []
-
-        if self.is_r_type():
-            # R-type: rd, rs1, rs2
-            if len(self.operands) >= 3:
-                sources.extend([self.operands[1], self.operands[2]])
-        elif self.is_i_type():
-            # I-type: rd, rs1, imm
-            if len(self.operands) >= 2:
-                sources.append(self.operands[1])
-        elif self.is_s_type():
-            # S-type: rs2, offset(rs1)
-            if len(self.operands) >= 2:
-                # Parse both source registers
-                sources.append(self.operands[0])  # Value to store
-                # Parse base register from offset(base) format
-                if isinstance(self.operands[1], str) and "(" in self.operands[1]:
-                    base_reg = self.operands[1].split("(")[1].rstrip(")")
-                    sources.append(base_reg)
-        elif self.is_conditional_branch():
-            # Branch: rs1, rs2, target
-            if len(self.operands) >= 2:
-                sources.extend([self.operands[0], self.operands[1]])
-
-        return sources  # type: ignore[return-value]
+        """
+        Get list of source register names.
+
+        The list is computed once at construction and shared between calls;
+        callers must treat it as read-only.
+        """
+        # Malformed programs can leave an immediate in a source slot
+        return self._src_regs  # type: ignore[return-value]
+
+    def reads_register(self, register: str | None) -> bool:
+        """Check if register is one of this instruction's source registers."""
+        src_set = self._src_set
+        if src_set is None:
+            return register in self._src_regs
+        return register in src_set
+
+    def source_register_numbers(
+        self, resolve: Callable[[str], int]
+    ) -> tuple[tuple[int, ...], int]:
+        """
+        Resolve source registers to numbers and a bitmask (bit i = register i).
+
+        Immediate operands, and names that ``resolve`` rejects with
+        ``ValueError``, are skipped. Sources never change and register names
+        always map to the same numbers, so the result is cached.
+        """
+        try:
+            return self._src_reg_nums, self._src_reg_mask
+        except AttributeError:
+            pass
+
+        src_nums = []
+        src_mask = 0
+        for src_reg in self._src_regs:
+            if not isinstance(src_reg, str):
+                continue  # Immediate, not a register
+            try:
+                reg_num = resolve(src_reg)
+            except ValueError:
+                continue
+            if reg_num < 0:
+                continue
+            src_nums.append(reg_num)
+            src_mask |= 1 << reg_num
+        self._src_reg_nums = resolved = tuple(src_nums)
+        self._src_reg_mask = src_mask
+        return resolved, src_mask
+
+    def get_memory_operand(self) -> tuple[int | None, str | None]:
+        """
+        Get the parsed ``offset(base)`` address operand of a load/store.
+
+        Returns:
+            (offset, base register) tuple. Both are None when the
+            instruction has no ``offset(base)`` operand; the offset is None
+            when it is not an integer literal.
+        """
+        return self._mem_offset, self._mem_base
 
     def get_memory_address(self) -> int | None:
         """Get memory address for load/store instructions."""
@@ -269,84 +598,33 @@ class Instruction:
         Returns:
             True if branch is taken, False otherwise
         """
-        opcode = self.opcode.upper()
-
-        if opcode == "BEQ":
+        compare = _BRANCH_CMP.get(self.opcode)
+        if compare is not None:
             rs1 = register_file.read_register(self.operands[0])
             rs2 = register_file.read_register(self.operands[1])
-            return rs1 == rs2
-        elif opcode == "BNE":
-            rs1 = register_file.read_register(self.operands[0])
-            rs2 = register_file.read_register(self.operands[1])
-            return rs1 != rs2
-        elif opcode == "BLT":
-            rs1 = register_file.read_register(self.operands[0])
-            rs2 = register_file.read_register(self.operands[1])
-            return rs1 < rs2
-        elif opcode == "BGE":
-            rs1 = register_file.read_register(self.operands[0])
-            rs2 = register_file.read_register(self.operands[1])
-            return rs1 >= rs2
-        elif opcode in ["J", "JAL"]:
-            # Unconditional jumps are always taken
-            return True
-        elif opcode in ["JR", "JALR"]:
-            # Register jumps are always taken
-            return True
-        else:
-            return False
+            return compare(rs1, rs2)
+
+        # Unconditional and register jumps are always taken
+        return self.opcode in _ALWAYS_TAKEN
 
     def get_latency(self) -> int:
         """Get expected execution latency for this instruction."""
-        latency_map = {
-            "ADD": 1,
-            "SUB": 1,
-            "ADDI": 1,
-            "SUBI": 1,
-            "AND": 1,
-            "OR": 1,
-            "XOR": 1,
-            "SLT": 1,
-            "ANDI": 1,
-            "ORI": 1,
-            "XORI": 1,
-            "SLTI": 1,
-            "MUL": 3,
-            "DIV": 10,
-            "FADD": 3,
-            "FSUB": 3,
-            "FMUL": 5,
-            "FDIV": 15,
-            "LW": 2,
-            "SW": 2,
-            "LB": 2,
-            "LH": 2,
-            "SB": 2,
-            "SH": 2,
-            "BEQ": 1,
-            "BNE": 1,
-            "BLT": 1,
-            "BGE": 1,
-            "J": 1,
-            "JAL": 1,
-            "JR": 1,
-            "JALR": 1,
-            "NOP": 1,
-        }
-        return latency_map.get(self.opcode.upper(), 1)
+        return _LATENCY_MAP.get(self.opcode, 1)
 
     def __repr__(self) -> str:
         """String representation of the instruction."""
-        operands_str = ", ".join(str(op) for op in self.operands)
-        return f"Instruction(PC={self.address:#x}, {self.opcode} {operands_str})"
+        return f"Instruction(PC={self.address:#x}, {self})"
 
     def __str__(self) -> str:
         """Human-readable string representation."""
-        operands_str = ", ".join(str(op) for op in self.operands)
-        return f"{self.opcode} {operands_str}"
+        try:
+            return self._str
+        except AttributeError:
+            operands_str = ", ".join(str(op) for op in self.operands)
+            self._str = f"{self.opcode} {operands_str}"
+            return self._str
 
 
-@dataclass
 class BranchInstruction(Instruction):
     """
     Specialized instruction class for branch instructions.
@@ -354,40 +632,73 @@ class BranchInstruction(Instruction):
     Adds branch-specific attributes and methods.
     """
 
-    pc: int = 0  # Alias for address
-    condition: bool | None = None  # For conditional branches
-    target_address: int | None = None
-
-    def __post_init__(self) -> None:
+    __slots__ = ("condition", "pc", "target_address")
+
+    _compare_fields = (
+        *Instruction._compare_fields,
+        "pc",
+        "condition",
+        "target_address",
+    )
+
+    # Positional order matches the dataclass constructor this class replaced
+    def __init__(  # noqa: PLR0917
+        self,
+        address: int,
+        opcode: str,
+        operands: list[Union[str, int]] | None = None,
+        destination: str | None = None,
+        instruction_type: InstructionType | None = None,
+        status: InstructionStatus = InstructionStatus.FETCHED,
+        issue_cycle: int | None = None,
+        completion_cycle: int | None = None,
+        result: Any | None = None,
+        prediction_info: dict[str, Any] | None = None,
+        latency: int = 1,
+        pc: int = 0,  # Alias for address
+        condition: bool | None = None,  # For conditional branches
+        target_address: int | None = None,
+    ) -> None:
         """Initialize branch instruction."""
         # Set address from pc if not already set
-        if self.address == 0 and self.pc != 0:
-            self.address = self.pc
-        elif self.pc == 0 and self.address != 0:
-            self.pc = self.address
+        if address == 0 and pc != 0:
+            address = pc
+        elif pc == 0 and address != 0:
+            pc = address
 
-        # Ensure it's marked as a branch
-        if not self.opcode:
-            self.opcode = "BEQ"  # Default branch opcode
-
-        super().__post_init__()
+        self.pc = pc
+        self.condition = condition
+        self.target_address = target_address
 
-        # Calculate target address if not set
-        if self.target_address is None and len(self.operands) >= 1:
-            try:
-                if self.opcode.upper() in ["J", "JAL"]:
-                    # Jump instructions: operand is absolute address
-                    target_str = self.operands[0]
-                    if target_str.startswith("0x"):  # type: ignore[union-attr]
-                        self.target_address = int(target_str, 16)  # type: ignore[arg-type]
-                    else:
-                        self.target_address = int(target_str)
-                elif len(self.operands) >= 3:
-                    # Branch instructions: operand is offset
-                    offset = int(self.operands[2])
+        # Ensure it's marked as a branch
+        if not opcode:
+            opcode = "BEQ"  # Default branch opcode
+
+        super().__init__(
+            address,
+            opcode,
+            operands,
+            destination,
+            instruction_type,
+            status,
+            issue_cycle,
+            completion_cycle,
+            result,
+            prediction_info,
+            latency,
+        )
+
+        # Calculate target address if not set; operands that aren't integer
+        # literals (e.g. unresolved labels) leave it as None
+        if self.target_address is None and self.operands:
+            if self.opcode in _DIRECT_JUMP_OPCODES:
+                # Jump instructions: operand is absolute address
+                self.target_address = _int_literal(self.operands[0])
+            elif len(self.operands) >= 3:
+                # Branch instructions: operand is offset
+                offset = _int_literal(self.operands[2])
+                if offset is not None:
                     self.target_address = self.address + 4 + (offset * 4)
-            except (ValueError, IndexError):
-                pass
 
     def get_target_address(self) -> int | None:
         """Get the target address for this branch."""
@@ -411,39 +722,77 @@ class InstructionBundle:
         self.fetch_cycle = fetch_cycle
         self.size = len(instructions)
 
+        # Per-slot flags packed into bitmasks (bit i = instructions[i]),
+        # computed once so bundle-level queries don't revisit every slot
+        self._branch_mask = 0
+        self._memory_mask = 0
+        for i, inst in enumerate(instructions):
+            if inst.is_branch():
+                self._branch_mask |= 1 << i
+            if inst.is_memory_operation():
+                self._memory_mask |= 1 << i
+
+        # RAW dependency list, computed on first request
+        self._deps: list[tuple[int, int]] | None = None
+
     def has_branch(self) -> bool:
         """Check if bundle contains a branch instruction."""
-        return any(inst.is_branch() for inst in self.instructions)
+        return self._branch_mask != 0
 
     def get_branch_instruction(self) -> Instruction | None:
         """Get the first branch instruction in the bundle."""
-        for inst in self.instructions:
-            if inst.is_branch():
-                return inst
-        return None
+        mask = self._branch_mask
+        if not mask:
+            return None
+        # Index of the lowest set bit
+        return self.instructions[(mask & -mask).bit_length() - 1]
 
     def has_memory_operation(self) -> bool:
         """Check if bundle contains memory operations."""
-        return any(inst.is_memory_operation() for inst in self.instructions)
+        return self._memory_mask != 0
 
     def get_dependencies(self) -> list[tuple[int, int]]:
         """
         Get RAW dependencies within the bundle.
 
+        The result is computed once and shared between calls; callers must
+        treat it as read-only.
+
         Returns:
-            List of (producer_idx, consumer_idx) tuples
+            List of (producer_idx, consumer_idx) tuples, ordered by producer
+            and then by consumer
+        """
+        if self._deps is None:
+            self._deps = self._compute_dependencies()
+        return self._deps
+
+    def _compute_dependencies(self) -> list[tuple[int, int]]:
         """
-        dependencies = []
+        Scan the bundle for RAW dependencies.
 
-        for i in range(self.size):
-            if self.instructions[i].has_destination_register():
-                dest = self.instructions[i].get_destination_register()
+        Each instruction's source registers are extracted once and indexed
+        by register name, so every producer only looks at the later
+        instructions that actually read its destination.
 
-                # Check if any later instruction uses this destination
-                for j in range(i + 1, self.size):
-                    sources = self.instructions[j].get_source_registers()
-                    if dest in sources:
-                        dependencies.append((i, j))
+        Returns:
+            List of (producer_idx, consumer_idx) tuples, ordered by producer
+            and then by consumer
+        """
+        # Register name -> ascending indices of instructions reading it
+        readers: dict[str, list[int]] = {}
+        for j, inst in enumerate(self.instructions):
+            for reg in set(inst.get_source_registers()):
+                readers.setdefault(reg, []).append(j)
+
+        dependencies: list[tuple[int, int]] = []
+        for i, inst in enumerate(self.instructions):
+            if not inst.has_destination_register():
+                continue
+            dest = inst.get_destination_register()
+            consumers = readers.get(dest)  # type: ignore[arg-type]
+            if consumers:
+                start = bisect_right(consumers, i)
+                dependencies.extend((i, j) for j in consumers[start:])
 
         return dependencies
 
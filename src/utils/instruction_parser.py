@@ -66,6 +66,15 @@ MIPS_REGISTER_MAP = {
     "ra": 31,
 }
 
+# Every exact spelling parse_register accepts ("t0", "$t0", "8", "$8"),
+# so the common case is a single dict probe
+_REGISTER_LOOKUP: dict[str, int] = {}
+for _name, _num in MIPS_REGISTER_MAP.items():
+    _REGISTER_LOOKUP[_name] = _REGISTER_LOOKUP["$" + _name] = _num
+for _num in range(32):
+    _REGISTER_LOOKUP[str(_num)] = _REGISTER_LOOKUP[f"${_num}"] = _num
+del _name, _num
+
 
 def parse_register(reg_str: str | int) -> int:
     """
@@ -80,6 +89,10 @@ def parse_register(reg_str: str | int) -> int:
     # Guard against int operands (e.g. LUI immediate passed as operand)
     if isinstance(reg_str, int):
         return reg_str if 0 <= reg_str <= 31 else 0
+    if type(reg_str) is str:
+        reg_num = _REGISTER_LOOKUP.get(reg_str)
+        if reg_num is not None:
+            return reg_num
     s = str(reg_str).strip()
     if s.startswith("$"):
         s = s[1:]
@@ -7,14 +7,20 @@ in the superscalar pipeline simulator.
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 import logging
 from typing import Any, List, Optional
 
 from .instruction import Instruction
 
+_logger = logging.getLogger(__name__)
 
-@dataclass
+# Number of OperandInfo records preallocated per reservation station
+_MAX_SOURCE_OPERANDS = 3
+
+
+@dataclass(slots=True)
 class OperandInfo:
     """Information about an operand in a reservation station."""
 
@@ -24,6 +30,34 @@ class OperandInfo:
     register_name: str | None = None
 
 
+def collect_results(
+    executed_instructions: list[tuple],
+) -> dict[str, tuple[Any, str]]:
+    """
+    Index a cycle's executed instructions by destination register.
+
+    When several instructions write the same register, the first one in
+    ``executed_instructions`` wins.
+
+    Args:
+        executed_instructions: List of (instruction, result) tuples
+
+    Returns:
+        Register name -> (result, source tag) mapping
+    """
+    produced: dict[str, tuple[Any, str]] = {}
+    for executed_instruction, result in executed_instructions:
+        if (
+            not executed_instruction
+            or not executed_instruction.has_destination_register()
+        ):
+            continue
+        dest_reg = executed_instruction.get_destination_register()
+        if dest_reg not in produced:
+            produced[dest_reg] = (result, str(executed_instruction))
+    return produced
+
+
 class ReservationStation:
     """
     Reservation station for holding instructions waiting for operands.
@@ -31,16 +65,42 @@ class ReservationStation:
     Implements Tomasulo's algorithm for dynamic scheduling.
     """
 
-    def __init__(self, station_id: int) -> None:
+    __slots__ = (
+        "_expected_mask",
+        "_op_pool",
+        "_ready_mask",
+        "_waiting_by_reg",
+        "busy",
+        "id",
+        "instruction",
+        "issue_cycle",
+        "operands",
+        "pool",
+        "ready_cycle",
+        "ready_for_execution",
+    )
+
+    def __init__(
+        self, station_id: int, pool: ReservationStationPool | None = None
+    ) -> None:
         """
         Initialize reservation station.
 
         Args:
             station_id: Unique identifier for this station
+            pool: Owning pool, notified when the station is taken or freed
         """
         self.id = station_id
+        self.pool = pool
         self.instruction: Instruction | None = None
         self.operands: list[OperandInfo] = []
+        # Preallocated OperandInfo records reused across issues
+        self._op_pool = [OperandInfo() for _ in range(_MAX_SOURCE_OPERANDS)]
+        # Operand readiness packed into bitmasks (bit i = operands[i]), plus
+        # the bits still waiting on each producer register
+        self._ready_mask = 0
+        self._expected_mask = 0
+        self._waiting_by_reg: dict[str, int] = {}
         self.busy = False
         self.ready_for_execution = False
 
@@ -48,7 +108,7 @@ class ReservationStation:
         self.issue_cycle: int | None = None
         self.ready_cycle: int | None = None
 
-        logging.debug(f"Initialized Reservation Station {station_id}")
+        _logger.debug("Initialized Reservation Station %d", station_id)
 
     def is_free(self) -> bool:
         """Check if this reservation station is free."""
@@ -69,13 +129,25 @@ class ReservationStation:
         self.ready_for_execution = False
         self.issue_cycle = getattr(instruction, "issue_cycle", 0)
 
-        # Initialize operand information
-        self.operands = []
+        if self.pool is not None:
+            self.pool._station_issued(self)
+
+        # Initialize operand information, reusing this station's records
         source_registers = instruction.get_source_registers()
+        num_sources = len(source_registers)
+        op_pool = self._op_pool
+        while len(op_pool) < num_sources:
+            op_pool.append(OperandInfo())
+
+        self.operands = op_pool[:num_sources]
+        for operand_info, reg in zip(self.operands, source_registers, strict=True):
+            operand_info.value = None
+            operand_info.ready = False
+            operand_info.source_tag = None
+            operand_info.register_name = reg
 
-        for reg in source_registers:
-            operand_info = OperandInfo(register_name=reg, ready=False, source_tag=None)
-            self.operands.append(operand_info)
+        self._expected_mask = (1 << len(self.operands)) - 1
+        self._ready_mask = 0
 
         # Handle immediate operands (always ready)
         for i, operand in enumerate(instruction.operands):
@@ -84,8 +156,20 @@ class ReservationStation:
                 if i < len(self.operands):
                     self.operands[i].value = operand
                     self.operands[i].ready = True
+                    self._ready_mask |= 1 << i
+
+        # Index the operands still waiting on a producer
+        waiting = self._waiting_by_reg
+        for i, operand_info in enumerate(self.operands):
+            if not operand_info.ready:
+                reg = operand_info.register_name
+                if reg is None:
+                    continue
+                waiting[reg] = waiting.get(reg, 0) | (1 << i)
+        if waiting and self.pool is not None:
+            self.pool._register_waiting(self)
 
-        logging.debug(f"Issued {instruction} to RS {self.id}")
+        _logger.debug("Issued %s to RS %d", instruction, self.id)
 
     def update(self, executed_instructions: list[tuple]) -> None:
         """
@@ -94,33 +178,45 @@ class ReservationStation:
         Args:
             executed_instructions: List of (instruction, result) tuples
         """
+        self.apply_results(collect_results(executed_instructions))
+
+    def apply_results(self, produced: dict[str, tuple[Any, str]]) -> None:
+        """
+        Wake up waiting operands from a batch of produced register values.
+
+        Args:
+            produced: Register name -> (result, source tag), as built by
+                :func:`collect_results`
+        """
         if not self.busy or not self.instruction:
             return
 
-        # Update operands with results from executed instructions
-        for executed_instruction, result in executed_instructions:
-            if (
-                not executed_instruction
-                or not executed_instruction.has_destination_register()
-            ):
-                continue
-
-            dest_reg = executed_instruction.get_destination_register()
+        waiting = self._waiting_by_reg
+        if waiting and produced:
+            # Probe from whichever side is smaller
+            if len(produced) < len(waiting):
+                matched = [reg for reg in produced if reg in waiting]
+            else:
+                matched = [reg for reg in waiting if reg in produced]
 
-            # Check if any of our operands depend on this result
-            for operand_info in self.operands:
-                if not operand_info.ready and operand_info.register_name == dest_reg:
-                    operand_info.value = result
-                    operand_info.ready = True
-                    operand_info.source_tag = str(executed_instruction)
+            for reg in matched:
+                result, source_tag = produced[reg]
+                self._mark_ready(waiting.pop(reg), result, source_tag)
 
-                    logging.debug(
-                        f"RS {self.id}: Updated operand {dest_reg} = {result}"
-                    )
+                _logger.debug("RS %d: Updated operand %s = %s", self.id, reg, result)
 
         # Check if instruction is now ready for execution
         self._check_readiness()
 
+    def _wake(self, reg: str, result: Any, source_tag: str) -> None:
+        """Deliver one pushed result; a no-op if no operand waits on ``reg``."""
+        bits = self._waiting_by_reg.pop(reg, 0)
+        if not bits:
+            return
+        self._mark_ready(bits, result, source_tag)
+        _logger.debug("RS %d: Updated operand %s = %s", self.id, reg, result)
+        self._check_readiness()
+
     def get_ready_instruction(
         self, register_file, data_forwarding_unit
     ) -> Instruction | None:
@@ -137,8 +233,10 @@ class ReservationStation:
         if not self.busy or not self.instruction:
             return None
 
-        # Try to resolve any unready operands
-        self._resolve_operands(register_file, data_forwarding_unit)
+        # Try to resolve any unready operands; stations fully woken by
+        # broadcasts have nothing pending and skip the lookups entirely
+        if self._waiting_by_reg:
+            self._resolve_operands(register_file, data_forwarding_unit)
 
         # Check if all operands are ready
         if self._all_operands_ready():
@@ -154,8 +252,8 @@ class ReservationStation:
             # Clear the reservation station
             self._clear()
 
-            logging.debug(
-                f"RS {self.id}: Instruction ready for execution: {ready_instruction}"
+            _logger.debug(
+                "RS %d: Instruction ready for execution: %s", self.id, ready_instruction
             )
             return ready_instruction
 
@@ -169,36 +267,54 @@ class ReservationStation:
             register_file: Register file to read from
             data_forwarding_unit: Forwarding unit to check
         """
-        for operand_info in self.operands:
-            if operand_info.ready or not operand_info.register_name:
+        for register_name in list(self._waiting_by_reg):
+            if not register_name:
                 continue
 
+            value = None
+            source_tag = None
+
             # Try to get value from data forwarding unit first
             if data_forwarding_unit:
-                forwarded_value = data_forwarding_unit.get_operand_value(
-                    operand_info.register_name
-                )
-                if forwarded_value is not None:
-                    operand_info.value = forwarded_value
-                    operand_info.ready = True
-                    operand_info.source_tag = "forwarded"
-                    continue
+                value = data_forwarding_unit.get_operand_value(register_name)
+                if value is not None:
+                    source_tag = "forwarded"
 
             # Try to read from register file
-            try:
-                reg_value = register_file.read_register(operand_info.register_name)
-                if reg_value is not None:
-                    operand_info.value = reg_value
-                    operand_info.ready = True
-                    operand_info.source_tag = "register_file"
-            except Exception as e:
-                logging.debug(
-                    f"Could not read register {operand_info.register_name}: {e}"
-                )
+            if source_tag is None:
+                try:
+                    value = register_file.read_register(register_name)
+                    if value is not None:
+                        source_tag = "register_file"
+                except Exception as e:
+                    _logger.debug("Could not read register %s: %s", register_name, e)
+
+            if source_tag is not None:
+                bits = self._waiting_by_reg.pop(register_name)
+                self._mark_ready(bits, value, source_tag)
+
+    def _mark_ready(self, bits: int, value: Any, source_tag: str) -> None:
+        """
+        Mark the operands selected by ``bits`` as ready with ``value``.
+
+        Args:
+            bits: Bitmask of operand indices to update
+            value: Operand value
+            source_tag: Where the value came from
+        """
+        self._ready_mask |= bits
+        operands = self.operands
+        while bits:
+            lowest = bits & -bits
+            operand_info = operands[lowest.bit_length() - 1]
+            operand_info.value = value
+            operand_info.ready = True
+            operand_info.source_tag = source_tag
+            bits ^= lowest
 
     def _all_operands_ready(self) -> bool:
         """Check if all operands are ready."""
-        return all(operand.ready for operand in self.operands)
+        return self._ready_mask == self._expected_mask
 
     def _check_readiness(self) -> None:
         """Check and update readiness status."""
@@ -209,17 +325,24 @@ class ReservationStation:
 
     def _clear(self) -> None:
         """Clear the reservation station."""
+        was_busy = self.busy
         self.instruction = None
         self.operands.clear()
+        self._waiting_by_reg.clear()
+        self._ready_mask = 0
+        self._expected_mask = 0
         self.busy = False
         self.ready_for_execution = False
         self.issue_cycle = None
         self.ready_cycle = None
 
+        if was_busy and self.pool is not None:
+            self.pool._station_released(self)
+
     def reset(self) -> None:
         """Reset the reservation station to initial state."""
         self._clear()
-        logging.debug(f"Reset Reservation Station {self.id}")
+        _logger.debug("Reset Reservation Station %d", self.id)
 
     def get_status(self) -> dict[str, Any]:
         """Get current status of the reservation station."""
@@ -246,6 +369,9 @@ class ReservationStationPool:
     Pool of reservation stations with management utilities.
 
     Provides higher-level operations for managing multiple reservation stations.
+    Free stations are kept in a FIFO free list and busy ones in an ordered
+    set, both maintained incrementally, so finding a station and computing
+    utilization are O(1) and busy_stations() costs O(busy stations).
     """
 
     def __init__(self, num_stations: int) -> None:
@@ -255,23 +381,54 @@ class ReservationStationPool:
         Args:
             num_stations: Number of reservation stations to create
         """
-        self.stations = [ReservationStation(i) for i in range(num_stations)]
+        self.stations = [ReservationStation(i, self) for i in range(num_stations)]
         self.num_stations = num_stations
 
+        # Free list and busy set, maintained by the stations themselves
+        self._free: deque[ReservationStation] = deque(self.stations)
+        self._busy: dict[ReservationStation, None] = {}
+
+        # Register name -> stations waiting on it, registered at issue time
+        self._dependents: dict[str, set[ReservationStation]] = {}
+
         # Statistics
         self.total_issues = 0
         self.total_completions = 0
 
-        logging.info(
-            f"Initialized Reservation Station Pool with {num_stations} stations"
+        _logger.info(
+            "Initialized Reservation Station Pool with %d stations", num_stations
         )
 
     def find_free_station(self) -> ReservationStation | None:
         """Find and return a free reservation station."""
-        for station in self.stations:
-            if station.is_free():
-                return station
-        return None
+        return self._free[0] if self._free else None
+
+    def _station_issued(self, station: ReservationStation) -> None:
+        """Take a station off the free list once it becomes busy."""
+        if self._free and self._free[0] is station:
+            self._free.popleft()
+        else:
+            self._free.remove(station)
+        self._busy[station] = None
+
+    def _station_released(self, station: ReservationStation) -> None:
+        """Return a station to the free list once it is cleared."""
+        self._free.append(station)
+        del self._busy[station]
+
+    def busy_stations(self) -> list[ReservationStation]:
+        """Return the busy reservation stations in the order they were issued."""
+        return list(self._busy)
+
+    def _register_waiting(self, station: ReservationStation) -> None:
+        """Subscribe a newly issued station to the registers it waits on."""
+        dependents = self._dependents
+        for reg in station._waiting_by_reg:
+            subscribers = dependents.get(reg)
+            if subscribers is None:
+                dependents[reg] = {station}
+            else:
+                subscribers.add(station)
 
     def issue_instruction(self, instruction: Instruction) -> bool:
         """
@@ -292,35 +449,51 @@ class ReservationStationPool:
 
     def update_all(self, executed_instructions: list[tuple]) -> None:
         """Update all reservation stations with execution results."""
-        for station in self.stations:
-            station.update(executed_instructions)
+        if not self._busy:
+            return
+
+        # Push each result straight to its subscribers.  Entries left behind
+        # by operands resolved from the register file, or by stations since
+        # cleared, are dropped here: _wake ignores registers no longer awaited.
+        dependents = self._dependents
+        if not dependents:
+            return
+        produced = collect_results(executed_instructions)
+        for reg, (result, source_tag) in produced.items():
+            subscribers = dependents.pop(reg, None)
+            if subscribers:
+                for station in subscribers:
+                    station._wake(reg, result, source_tag)
 
     def get_ready_instructions(
         self, register_file, data_forwarding_unit
     ) -> list[Instruction]:
         """Get all instructions ready for execution."""
-        ready_instructions = []
+        ready_instructions: list[Instruction] = []
+        if not self._busy:
+            return ready_instructions
 
         for station in self.stations:
+            if not station.busy:
+                continue
             ready_inst = station.get_ready_instruction(
                 register_file, data_forwarding_unit
             )
             if ready_inst:
                 ready_instructions.append(ready_inst)
-                self.total_completions += 1
 
+        self.total_completions += len(ready_instructions)
         return ready_instructions
 
     def get_utilization(self) -> float:
         """Get utilization percentage of reservation stations."""
-        busy_count = sum(1 for station in self.stations if station.busy)
-        return (busy_count / self.num_stations) * 100
+        return (len(self._busy) / self.num_stations) * 100
 
     def get_statistics(self) -> dict[str, Any]:
         """Get pool statistics."""
         return {
             "total_stations": self.num_stations,
-            "busy_stations": sum(1 for s in self.stations if s.busy),
+            "busy_stations": len(self._busy),
             "utilization": self.get_utilization(),
             "total_issues": self.total_issues,
             "total_completions": self.total_completions,
@@ -329,17 +502,27 @@ class ReservationStationPool:
             ),
         }
 
+    def flush(self) -> None:
+        """
+        Squash every issued instruction, e.g. after a branch misprediction.
+
+        Only busy stations are touched (free ones are already clear) and
+        station objects are reused, so a flush costs O(busy stations).
+        Statistics are kept; use reset_all() to clear them as well.
+        """
+        for station in list(self._busy):
+            station._clear()
+        self._dependents.clear()
+
     def reset_all(self) -> None:
         """Reset all reservation stations."""
-        for station in self.stations:
-            station.reset()
+        self.flush()
 
         self.total_issues = 0
         self.total_completions = 0
 
-        logging.info("Reset all reservation stations")
+        _logger.info("Reset all reservation stations")
 
     def __repr__(self) -> str:
         """String representation of the pool."""
-        busy_count = sum(1 for s in self.stations if s.busy)
-        return f"RSPool({busy_count}/{self.num_stations} busy)"
+        return f"RSPool({len(self._busy)}/{self.num_stations} busy)"
@@ -7,7 +7,9 @@ unit status to detect and prevent hazards in the pipeline.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections import deque
+from collections.abc import Iterator, MutableMapping
+from dataclasses import dataclass
 from enum import Enum
 import logging
 from typing import Any, List, Optional, Set, Union
@@ -25,6 +27,11 @@ except (ImportError, ValueError):
     sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
     from register_file.register_file import RegisterFile
 
+_logger = logging.getLogger(__name__)
+
+# Functional unit types; a unit named e.g. "ALU0" is of type "ALU"
+_UNIT_TYPES = ("ALU", "FPU", "LSU")
+
 
 class HazardType(Enum):
     """Types of pipeline hazards."""
@@ -35,17 +42,50 @@ class HazardType(Enum):
     STRUCTURAL = "Structural"  # Resource conflict
 
 
-@dataclass
+# Fixed slots in Scoreboard._hazard_counts, in HazardType declaration order
+_RAW, _WAR, _WAW, _STRUCTURAL = range(4)
+_HAZARD_INDEX = {hazard_type: index for index, hazard_type in enumerate(HazardType)}
+
+
+class _HazardCounts(MutableMapping[HazardType, int]):
+    """Dict-like, write-through view of the scoreboard's hazard counters."""
+
+    __slots__ = ("_counts",)
+
+    def __init__(self, counts: list[int]) -> None:
+        self._counts = counts
+
+    def __getitem__(self, hazard_type: HazardType) -> int:
+        return self._counts[_HAZARD_INDEX[hazard_type]]
+
+    def __setitem__(self, hazard_type: HazardType, count: int) -> None:
+        self._counts[_HAZARD_INDEX[hazard_type]] = count
+
+    def __delitem__(self, hazard_type: HazardType) -> None:
+        raise TypeError("Hazard counters cannot be removed")
+
+    def __iter__(self) -> Iterator[HazardType]:
+        return iter(HazardType)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+@dataclass(slots=True)
 class RegisterStatus:
     """Status of a register in the scoreboard."""
 
     busy: bool = False
     writing_instruction: Instruction | None = None
-    reading_instructions: List[Instruction] = field(default_factory=list)
+    # Bit i set = the instruction in scoreboard reader slot i reads this register
+    reader_mask: int = 0
     last_write_cycle: int = -1
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionalUnitStatus:
     """Status of a functional unit."""
 
@@ -66,6 +106,12 @@ class Scoreboard:
     - Hazard detection
     """
 
+    # Functional unit type required per opcode; anything else uses an ALU
+    _OPCODE_UNIT: dict[str, str] = {
+        **dict.fromkeys(("FADD", "FSUB", "FMUL", "FDIV"), "FPU"),
+        **dict.fromkeys(("LW", "SW", "LB", "LH", "SB", "SH"), "LSU"),
+    }
+
     def __init__(self, num_registers: int = 32) -> None:
         """
         Initialize the scoreboard.
@@ -75,49 +121,80 @@ class Scoreboard:
         """
         self.num_registers = num_registers
 
+        # Register name -> number, preloaded with the MIPS register names;
+        # numeric forms ($N / rN) are added on first use
+        self._reg_cache: dict[str, int] = dict(
+            getattr(RegisterFile, "REGISTER_NAMES", {})
+        )
+
         # Register status tracking
         self.register_status: List[RegisterStatus] = [
             RegisterStatus() for _ in range(num_registers)
         ]
+        # Busy flags of all registers packed into one int (bit i = register
+        # i), kept in sync with register_status for whole-file queries
+        self._busy_mask = 0
 
         # Functional unit status
         self.function_unit_status: dict[str, FunctionalUnitStatus] = {}
-
-        # Instruction tracking
+        # Unit type -> names of free units of that type, and the type(s)
+        # each unit name belongs to (a unit's type is part of its name)
+        self._free_units: dict[str, Set[str]] = {t: set() for t in _UNIT_TYPES}
+        self._unit_types: dict[str, tuple[str, ...]] = {}
+        # Busy units still counting down, so update_cycle skips idle ones
+        self._counting_units: dict[str, FunctionalUnitStatus] = {}
+
+        # In-flight readers: each instruction reading a register gets a slot
+        # (bit index into RegisterStatus.reader_mask) until its last read is
+        # removed. Slots are keyed by identity.
+        self._reader_slot: dict[int, int] = {}  # id(instruction) -> slot
+        self._slot_readers: List[Instruction | None] = []
+        self._slot_refs: List[int] = []  # registers read per slot
+        self._free_slots: List[int] = []
+
+        # Instruction tracking. Instructions are tracked in dispatch order,
+        # which is a topological order of the dependency graph, so
+        # active_instructions doubles as the topo-sorted node list.
         self.active_instructions: dict[int, Instruction] = {}  # id -> instruction
         self.instruction_dependencies: dict[int, Set[int]] = {}  # id -> dependent ids
+        self._pending_producers: dict[int, int] = {}  # id -> unretired producers
+        self._ready_queue: deque[Instruction] = deque()
 
         # Statistics
-        self.hazard_counts = {
-            HazardType.RAW: 0,
-            HazardType.WAR: 0,
-            HazardType.WAW: 0,
-            HazardType.STRUCTURAL: 0,
-        }
+        self._hazard_counts = [0, 0, 0, 0]  # indexed by _RAW.._STRUCTURAL
 
         self.current_cycle = 0
 
-        logging.debug(f"Initialized Scoreboard for {num_registers} registers")
+        _logger.debug("Initialized Scoreboard for %d registers", num_registers)
+
+    @property
+    def hazard_counts(self) -> MutableMapping[HazardType, int]:
+        """Hazards detected so far, keyed by type; writes update the counters."""
+        return _HazardCounts(self._hazard_counts)
+
+    @hazard_counts.setter
+    def hazard_counts(self, counts: dict[HazardType, int]) -> None:
+        self._hazard_counts[:] = [
+            counts.get(hazard_type, 0) for hazard_type in HazardType
+        ]
 
     def _resolve_register(self, register: Union[str, int]) -> int:
         """Resolve register identifier to number."""
         if isinstance(register, int):
             return register
 
-        # Handle MIPS register names
-        if (
-            isinstance(register, str)
-            and hasattr(RegisterFile, "REGISTER_NAMES")
-            and register in RegisterFile.REGISTER_NAMES
-        ):
-            return RegisterFile.REGISTER_NAMES[register]
+        reg_num = self._reg_cache.get(register)
+        if reg_num is not None:
+            return reg_num
 
-        # Try to parse as number
+        # Try to parse as number ($N or rN); named registers are preloaded
         if isinstance(register, str):
             if (register.startswith("$") and register[1:].isdigit()) or (
                 register.startswith("r") and register[1:].isdigit()
             ):
-                return int(register[1:])
+                reg_num = int(register[1:])
+                self._reg_cache[register] = reg_num
+                return reg_num
 
         raise ValueError(f"Invalid register: {register}")
 
@@ -125,6 +202,11 @@ class Scoreboard:
         """
         Check for all hazards for an instruction.
 
+        Source and destination registers are resolved once and shared by
+        the RAW, WAR and WAW checks. Checks that cannot fire in the current
+        state (nothing busy, no reads tracked, a unit free) are skipped
+        before any per-instruction work, which is the common case.
+
         Args:
             instruction: Instruction to check
 
@@ -132,89 +214,107 @@ class Scoreboard:
             List of detected hazards
         """
         hazards = []
+        busy_mask = self._busy_mask
+        any_readers = bool(self._reader_slot)
 
         # Check RAW hazards
-        if self.check_raw_hazard(instruction):
+        if busy_mask and self._check_raw(
+            instruction, self._resolve_source_mask(instruction)
+        ):
             hazards.append(HazardType.RAW)
 
-        # Check WAR hazards
-        if self.check_war_hazard(instruction):
-            hazards.append(HazardType.WAR)
+        if busy_mask or any_readers:
+            dest_num = self._resolve_destination(instruction)
+            if dest_num is not None:
+                # Check WAR hazards
+                if any_readers and self._check_war(instruction, dest_num):
+                    hazards.append(HazardType.WAR)
 
-        # Check WAW hazards
-        if self.check_waw_hazard(instruction):
-            hazards.append(HazardType.WAW)
+                # Check WAW hazards
+                if busy_mask and self._check_waw(instruction, dest_num):
+                    hazards.append(HazardType.WAW)
 
         # Check structural hazards
-        if self.check_structural_hazard(instruction):
+        if not self._free_units.get(
+            self._get_required_unit_type(instruction)
+        ) and self.check_structural_hazard(instruction):
             hazards.append(HazardType.STRUCTURAL)
 
         return hazards
 
-    def check_raw_hazard(self, instruction: Instruction) -> bool:
+    def check_hazards_batch(
+        self, instructions: List[Instruction]
+    ) -> List[List[HazardType]]:
         """
-        Check for Read-After-Write hazards.
+        Check hazards for a group of instructions against the current state.
+
+        Gives the same results (and hazard counts) as calling check_hazards
+        on each instruction in turn, since checking does not change register
+        or unit state. Checks that cannot fire for the whole group, such as
+        RAW/WAW with no register busy or WAR with no reads tracked, are
+        skipped up front, and unit availability is looked up once per type.
 
         Args:
-            instruction: Instruction to check
+            instructions: Instructions considered for dispatch this cycle
 
         Returns:
-            True if RAW hazard exists
+            Detected hazards, one list per instruction in input order
         """
-        source_registers = instruction.get_source_registers()
+        any_busy = bool(self._busy_mask)
+        any_readers = bool(self._reader_slot)
+        unit_free: dict[str, bool] = {}
+        results: List[List[HazardType]] = []
+
+        for instruction in instructions:
+            hazards = []
+            if any_busy and self._check_raw(
+                instruction, self._resolve_source_mask(instruction)
+            ):
+                hazards.append(HazardType.RAW)
 
-        for src_reg in source_registers:
-            try:
-                reg_num = self._resolve_register(src_reg)
+            if any_busy or any_readers:
+                dest_num = self._resolve_destination(instruction)
+                if dest_num is not None:
+                    if any_readers and self._check_war(instruction, dest_num):
+                        hazards.append(HazardType.WAR)
+                    if any_busy and self._check_waw(instruction, dest_num):
+                        hazards.append(HazardType.WAW)
 
-                # Check if register is being written by another instruction
-                if self.register_status[reg_num].busy:
-                    writer = self.register_status[reg_num].writing_instruction
-                    if writer and writer != instruction:
-                        logging.debug(f"RAW hazard: {instruction} depends on {writer}")
-                        self.hazard_counts[HazardType.RAW] += 1
-                        return True
+            unit_type = self._get_required_unit_type(instruction)
+            free = unit_free.get(unit_type)
+            if free is None:
+                free = unit_free[unit_type] = bool(self._free_units.get(unit_type))
+            if not free and self.check_structural_hazard(instruction):
+                hazards.append(HazardType.STRUCTURAL)
 
-            except ValueError:
-                continue  # Skip invalid registers
+            results.append(hazards)
 
-        return False
+        return results
 
-    def check_war_hazard(self, instruction: Instruction) -> bool:
+    def check_raw_hazard(self, instruction: Instruction) -> bool:
         """
-        Check for Write-After-Read hazards.
+        Check for Read-After-Write hazards.
 
         Args:
             instruction: Instruction to check
 
         Returns:
-            True if WAR hazard exists
+            True if RAW hazard exists
         """
-        if not instruction.has_destination_register():
-            return False
-
-        dest_reg = instruction.get_destination_register()
-        if not dest_reg:
-            return False
+        return self._check_raw(instruction, self._resolve_source_mask(instruction))
 
-        try:
-            reg_num = self._resolve_register(dest_reg)
-
-            # Check if register is being read by other instructions
-            readers = self.register_status[reg_num].reading_instructions
-            if readers:
-                for reader in readers:
-                    if reader != instruction:
-                        logging.debug(
-                            f"WAR hazard: {instruction} writes after {reader} reads"
-                        )
-                        self.hazard_counts[HazardType.WAR] += 1
-                        return True
+    def check_war_hazard(self, instruction: Instruction) -> bool:
+        """
+        Check for Write-After-Read hazards.
 
-        except ValueError:
-            pass
+        Args:
+            instruction: Instruction to check
 
-        return False
+        Returns:
+            True if WAR hazard exists
+        """
+        dest_num = self._resolve_destination(instruction)
+        return dest_num is not None and self._check_war(instruction, dest_num)
 
     def check_waw_hazard(self, instruction: Instruction) -> bool:
         """
@@ -226,28 +326,80 @@ class Scoreboard:
         Returns:
             True if WAW hazard exists
         """
+        dest_num = self._resolve_destination(instruction)
+        return dest_num is not None and self._check_waw(instruction, dest_num)
+
+    def _resolve_sources(self, instruction: Instruction) -> tuple[int, ...]:
+        """Resolve an instruction's source registers, skipping invalid ones."""
+        return instruction.source_register_numbers(self._resolve_register)[0]
+
+    def _resolve_source_mask(self, instruction: Instruction) -> int:
+        """Resolve source registers to a bitmask (bit i = register i)."""
+        return instruction.source_register_numbers(self._resolve_register)[1]
+
+    def _resolve_destination(self, instruction: Instruction) -> int | None:
+        """Resolve an instruction's destination register, if it has a valid one."""
         if not instruction.has_destination_register():
-            return False
+            return None
 
         dest_reg = instruction.get_destination_register()
         if not dest_reg:
-            return False
+            return None
 
         try:
-            reg_num = self._resolve_register(dest_reg)
-
-            # Check if register is already being written
-            if self.register_status[reg_num].busy:
-                writer = self.register_status[reg_num].writing_instruction
-                if writer and writer != instruction:
-                    logging.debug(
-                        f"WAW hazard: both {instruction} and {writer} write to {dest_reg}"
-                    )
-                    self.hazard_counts[HazardType.WAW] += 1
-                    return True
-
+            return self._resolve_register(dest_reg)
         except ValueError:
-            pass
+            return None
+
+    def _check_raw(self, instruction: Instruction, src_mask: int) -> bool:
+        """RAW check against an already-resolved source register mask."""
+        # One AND finds every source register that is being written
+        pending = self._busy_mask & src_mask
+        while pending:
+            low_bit = pending & -pending
+            pending ^= low_bit
+            writer = self.register_status[low_bit.bit_length() - 1].writing_instruction
+            if writer and writer != instruction:
+                if _logger.isEnabledFor(logging.DEBUG):
+                    _logger.debug("RAW hazard: %s depends on %s", instruction, writer)
+                self._hazard_counts[_RAW] += 1
+                return True
+
+        return False
+
+    def _check_war(self, instruction: Instruction, dest_num: int) -> bool:
+        """WAR check against an already-resolved destination register."""
+        # Check if register is being read by other instructions
+        readers = self.register_status[dest_num].reader_mask
+        own_slot = self._reader_slot.get(id(instruction))
+        if own_slot is not None:
+            readers &= ~(1 << own_slot)
+        if readers:
+            reader = self._slot_readers[(readers & -readers).bit_length() - 1]
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    "WAR hazard: %s writes after %s reads", instruction, reader
+                )
+            self._hazard_counts[_WAR] += 1
+            return True
+
+        return False
+
+    def _check_waw(self, instruction: Instruction, dest_num: int) -> bool:
+        """WAW check against an already-resolved destination register."""
+        # Check if register is already being written
+        if (self._busy_mask >> dest_num) & 1:
+            writer = self.register_status[dest_num].writing_instruction
+            if writer and writer != instruction:
+                if _logger.isEnabledFor(logging.DEBUG):
+                    _logger.debug(
+                        "WAW hazard: both %s and %s write to %s",
+                        instruction,
+                        writer,
+                        instruction.get_destination_register(),
+                    )
+                self._hazard_counts[_WAW] += 1
+                return True
 
         return False
 
@@ -265,31 +417,20 @@ class Scoreboard:
         unit_type = self._get_required_unit_type(instruction)
 
         # Check if any unit of this type is available
-        available = False
-        for unit_name, status in self.function_unit_status.items():
-            if unit_type in unit_name and not status.busy:
-                available = True
-                break
-
-        if not available:
-            logging.debug(
-                f"Structural hazard: No {unit_type} available for {instruction}"
-            )
-            self.hazard_counts[HazardType.STRUCTURAL] += 1
+        if not self._free_units.get(unit_type):
+            if _logger.isEnabledFor(logging.DEBUG):
+                _logger.debug(
+                    "Structural hazard: No %s available for %s", unit_type, instruction
+                )
+            self._hazard_counts[_STRUCTURAL] += 1
             return True
 
         return False
 
     def _get_required_unit_type(self, instruction: Instruction) -> str:
         """Determine which functional unit type an instruction needs."""
-        opcode = instruction.opcode.upper()
-
-        if opcode in ["FADD", "FSUB", "FMUL", "FDIV"]:
-            return "FPU"
-        elif opcode in ["LW", "SW", "LB", "LH", "SB", "SH"]:
-            return "LSU"
-        else:
-            return "ALU"
+        # Instruction normalises opcodes to upper case on construction
+        return self._OPCODE_UNIT.get(instruction.opcode, "ALU")
 
     def is_register_available(self, register: Union[str, int]) -> bool:
         """Check if a register is available (not busy)."""
@@ -321,13 +462,16 @@ class Scoreboard:
             reg_num = self._resolve_register(register)
 
             self.register_status[reg_num].busy = True
+            self._busy_mask |= 1 << reg_num
             self.register_status[reg_num].writing_instruction = instruction
             self.register_status[reg_num].last_write_cycle = self.current_cycle
 
-            logging.debug(f"Allocated register {register} for write by {instruction}")
+            _logger.debug(
+                "Allocated register %s for write by %s", register, instruction
+            )
 
         except ValueError as e:
-            logging.warning(f"Cannot allocate register: {e}")
+            _logger.warning("Cannot allocate register: %s", e)
 
     def allocate_register_read(
         self, register: Union[str, int], instruction: Instruction
@@ -342,13 +486,20 @@ class Scoreboard:
         try:
             reg_num = self._resolve_register(register)
 
-            if instruction not in self.register_status[reg_num].reading_instructions:
-                self.register_status[reg_num].reading_instructions.append(instruction)
+            slot = self._reader_slot.get(id(instruction))
+            if slot is None:
+                slot = self._acquire_reader_slot(instruction)
+
+            status = self.register_status[reg_num]
+            bit = 1 << slot
+            if not status.reader_mask & bit:
+                status.reader_mask |= bit
+                self._slot_refs[slot] += 1
 
-            logging.debug(f"Tracked register {register} read by {instruction}")
+            _logger.debug("Tracked register %s read by %s", register, instruction)
 
         except ValueError as e:
-            logging.warning(f"Cannot track register read: {e}")
+            _logger.warning("Cannot track register read: %s", e)
 
     def deallocate_register(self, register: Union[str, int]) -> None:
         """
@@ -361,12 +512,13 @@ class Scoreboard:
             reg_num = self._resolve_register(register)
 
             self.register_status[reg_num].busy = False
+            self._busy_mask &= ~(1 << reg_num)
             self.register_status[reg_num].writing_instruction = None
 
-            logging.debug(f"Deallocated register {register}")
+            _logger.debug("Deallocated register %s", register)
 
         except ValueError as e:
-            logging.warning(f"Cannot deallocate register: {e}")
+            _logger.warning("Cannot deallocate register: %s", e)
 
     def remove_register_read(
         self, register: Union[str, int], instruction: Instruction
@@ -381,12 +533,59 @@ class Scoreboard:
         try:
             reg_num = self._resolve_register(register)
 
-            if instruction in self.register_status[reg_num].reading_instructions:
-                self.register_status[reg_num].reading_instructions.remove(instruction)
+            slot = self._reader_slot.get(id(instruction))
+            if slot is None:
+                return
+
+            status = self.register_status[reg_num]
+            bit = 1 << slot
+            if status.reader_mask & bit:
+                status.reader_mask &= ~bit
+                self._slot_refs[slot] -= 1
+                if not self._slot_refs[slot]:
+                    self._release_reader_slot(slot)
 
         except ValueError:
             pass
 
+    def get_register_readers(self, register: Union[str, int]) -> List[Instruction]:
+        """
+        Get the in-flight instructions tracked as reading a register.
+
+        Args:
+            register: Register to query
+
+        Returns:
+            Reading instructions, in reader-slot order
+        """
+        reg_num = self._resolve_register(register)
+        mask = self.register_status[reg_num].reader_mask
+        readers = []
+        while mask:
+            lowest = mask & -mask
+            readers.append(self._slot_readers[lowest.bit_length() - 1])
+            mask ^= lowest
+        return readers  # type: ignore[return-value]
+
+    def _acquire_reader_slot(self, instruction: Instruction) -> int:
+        """Assign a reader slot (bit index) to an instruction."""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._slot_readers[slot] = instruction
+        else:
+            slot = len(self._slot_readers)
+            self._slot_readers.append(instruction)
+            self._slot_refs.append(0)
+        self._reader_slot[id(instruction)] = slot
+        return slot
+
+    def _release_reader_slot(self, slot: int) -> None:
+        """Return a reader slot once its instruction reads no register."""
+        instruction = self._slot_readers[slot]
+        del self._reader_slot[id(instruction)]
+        self._slot_readers[slot] = None
+        self._free_slots.append(slot)
+
     def allocate_function_unit(
         self, unit_name: str, instruction: Instruction, cycles: int = 1
     ) -> None:
@@ -400,38 +599,181 @@ class Scoreboard:
         """
         if unit_name not in self.function_unit_status:
             self.function_unit_status[unit_name] = FunctionalUnitStatus()
+            self._unit_types[unit_name] = tuple(
+                t for t in _UNIT_TYPES if t in unit_name
+            )
 
-        self.function_unit_status[unit_name].busy = True
-        self.function_unit_status[unit_name].instruction = instruction
-        self.function_unit_status[unit_name].remaining_cycles = cycles
-        self.function_unit_status[unit_name].result_ready = False
+        for unit_type in self._unit_types[unit_name]:
+            self._free_units[unit_type].discard(unit_name)
+
+        status = self.function_unit_status[unit_name]
+        status.busy = True
+        status.instruction = instruction
+        status.remaining_cycles = cycles
+        status.result_ready = False
+        if cycles > 0:
+            self._counting_units[unit_name] = status
+        else:
+            self._counting_units.pop(unit_name, None)
 
-        logging.debug(f"Allocated {unit_name} to {instruction} for {cycles} cycles")
+        _logger.debug(
+            "Allocated %s to %s for %d cycles", unit_name, instruction, cycles
+        )
 
     def deallocate_function_unit(self, unit_name: str) -> None:
         """Deallocate a functional unit."""
         if unit_name in self.function_unit_status:
             self.function_unit_status[unit_name].busy = False
             self.function_unit_status[unit_name].instruction = None
+            for unit_type in self._unit_types[unit_name]:
+                self._free_units[unit_type].add(unit_name)
+            self._counting_units.pop(unit_name, None)
 
-            logging.debug(f"Deallocated {unit_name}")
+            _logger.debug("Deallocated %s", unit_name)
 
     def update_cycle(self) -> None:
         """Update scoreboard state for a new cycle."""
         self.current_cycle += 1
 
-        # Update functional unit cycles
-        for unit_name, status in self.function_unit_status.items():
-            if status.busy and status.remaining_cycles > 0:
-                status.remaining_cycles -= 1
+        # Update functional unit cycles; only units still counting down
+        counting = self._counting_units
+        if not counting:
+            return
+        for unit_name, status in list(counting.items()):
+            status.remaining_cycles -= 1
+
+            if status.remaining_cycles == 0:
+                status.result_ready = True
+                del counting[unit_name]
+                _logger.debug("%s result ready", unit_name)
+
+    def track_instruction(self, instruction: Instruction) -> bool:
+        """
+        Add a dispatched instruction to the dependency graph.
+
+        Call before allocating the instruction's own destination register.
+        Its producers are the tracked instructions currently writing its
+        source registers.
+
+        Args:
+            instruction: Instruction being dispatched
+
+        Returns:
+            True if the instruction has no unretired producers
+        """
+        key = id(instruction)
+        active = self.active_instructions
+        successors = self.instruction_dependencies
+        producers = 0
+
+        busy_mask = self._busy_mask
+        if busy_mask:
+            for reg_num in self._resolve_sources(instruction):
+                if not (busy_mask >> reg_num) & 1:
+                    continue
+                writer_key = id(self.register_status[reg_num].writing_instruction)
+                if writer_key != key and writer_key in active:
+                    dependents = successors[writer_key]
+                    if key not in dependents:
+                        dependents.add(key)
+                        producers += 1
+
+        active[key] = instruction
+        successors[key] = set()
+        self._pending_producers[key] = producers
+        if not producers:
+            self._ready_queue.append(instruction)
+        return not producers
+
+    def retire_instruction(self, instruction: Instruction) -> List[Instruction]:
+        """
+        Remove a completed instruction from the dependency graph.
+
+        Only the retired instruction's direct dependents are visited.
+
+        Args:
+            instruction: Instruction that finished executing
+
+        Returns:
+            Dependents that have no unretired producers left
+        """
+        key = id(instruction)
+        if self.active_instructions.pop(key, None) is None:
+            return []
+        del self._pending_producers[key]
+
+        pending = self._pending_producers
+        woken = []
+        for dependent in self.instruction_dependencies.pop(key):
+            remaining = pending.get(dependent)
+            if remaining is None:
+                continue  # Dependent already retired
+            pending[dependent] = remaining - 1
+            if remaining == 1:
+                ready = self.active_instructions[dependent]
+                woken.append(ready)
+                self._ready_queue.append(ready)
+        return woken
+
+    def pop_ready_instructions(self) -> List[Instruction]:
+        """
+        Drain tracked instructions whose producers have all retired.
+
+        Returns:
+            Ready instructions in the order they became ready
+        """
+        active = self.active_instructions
+        ready = [
+            instruction
+            for instruction in self._ready_queue
+            if active.get(id(instruction)) is instruction
+        ]
+        self._ready_queue.clear()
+        return ready
+
+    def critical_path(self) -> tuple[int, List[Instruction]]:
+        """
+        Find the longest latency-weighted chain among tracked instructions.
 
-                if status.remaining_cycles == 0:
-                    status.result_ready = True
-                    logging.debug(f"{unit_name} result ready")
+        Walks the dispatch-ordered instructions once in reverse, so each
+        node's weight is its latency plus the heaviest weight among its
+        dependents.
+
+        Returns:
+            Total latency of the path and its instructions, oldest first
+        """
+        active = self.active_instructions
+        successors = self.instruction_dependencies
+        weight: dict[int, int] = {}
+        next_on_path: dict[int, int | None] = {}
+
+        for key in reversed(active):
+            best = 0
+            best_successor = None
+            for successor in successors[key]:
+                successor_weight = weight.get(successor, 0)
+                if successor_weight > best:
+                    best = successor_weight
+                    best_successor = successor
+            weight[key] = best + active[key].get_latency()
+            next_on_path[key] = best_successor
+
+        if not weight:
+            return 0, []
+
+        # Earliest-dispatched instruction wins ties
+        start = max(active, key=weight.__getitem__)
+        total = weight[start]
+        node: int | None = start
+        path = []
+        while node is not None:
+            path.append(active[node])
+            node = next_on_path[node]
+        return total, path
 
     def get_statistics(self) -> dict[str, Any]:
         """Get scoreboard statistics."""
-        busy_registers = sum(1 for r in self.register_status if r.busy)
+        busy_registers = self._busy_mask.bit_count()
         busy_units = sum(1 for u in self.function_unit_status.values() if u.busy)
 
         return {
@@ -441,67 +783,84 @@ class Scoreboard:
             "busy_functional_units": busy_units,
             "total_functional_units": len(self.function_unit_status),
             "hazard_counts": dict(self.hazard_counts),
-            "total_hazards": sum(self.hazard_counts.values()),
+            "total_hazards": sum(self._hazard_counts),
         }
 
     def visualize_state(self) -> str:
         """
         Create a visual representation of scoreboard state.
 
+        Intended for end-of-run reports and debugging; nothing in the
+        simulation loop calls it. Only busy registers are visited.
+
         Returns:
             ASCII representation of the scoreboard
         """
-        lines = ["Scoreboard State:"]
-        lines.append("=" * 60)
-
-        # Register status
-        lines.append("Registers (busy):")
+        status = self.register_status
         busy_regs = []
-        for i, status in enumerate(self.register_status):
-            if status.busy:
-                writer = status.writing_instruction
-                busy_regs.append(f"R{i}({writer.opcode if writer else '?'})")
-
-        if busy_regs:
-            lines.append("  " + ", ".join(busy_regs))
-        else:
-            lines.append("  None busy")
-
-        # Functional unit status
-        lines.append("\nFunctional Units:")
-        for unit_name, status in self.function_unit_status.items():
-            if status.busy:
-                inst = status.instruction
-                lines.append(
-                    f"  {unit_name}: {inst.opcode if inst else 'Unknown'} "
-                    f"({status.remaining_cycles} cycles left)"
-                )
-            else:
-                lines.append(f"  {unit_name}: Available")
-
-        # Hazard summary
-        lines.append("\nHazard Summary:")
-        for hazard_type, count in self.hazard_counts.items():
-            if count > 0:
-                lines.append(f"  {hazard_type.value}: {count}")
+        mask = self._busy_mask
+        while mask:
+            lowest = mask & -mask
+            i = lowest.bit_length() - 1
+            writer = status[i].writing_instruction
+            busy_regs.append(f"R{i}({writer.opcode if writer else '?'})")
+            mask ^= lowest
+
+        unit_lines = [
+            (
+                f"  {unit_name}: "
+                f"{unit.instruction.opcode if unit.instruction else 'Unknown'} "
+                f"({unit.remaining_cycles} cycles left)"
+            )
+            if unit.busy
+            else f"  {unit_name}: Available"
+            for unit_name, unit in self.function_unit_status.items()
+        ]
+        hazard_lines = [
+            f"  {hazard_type.value}: {count}"
+            for hazard_type, count in zip(HazardType, self._hazard_counts, strict=True)
+            if count > 0
+        ]
 
-        return "\n".join(lines)
+        return "\n".join(
+            [
+                "Scoreboard State:",
+                "=" * 60,
+                "Registers (busy):",
+                "  " + ", ".join(busy_regs) if busy_regs else "  None busy",
+                "\nFunctional Units:",
+                *unit_lines,
+                "\nHazard Summary:",
+                *hazard_lines,
+            ]
+        )
 
     def reset(self) -> None:
         """Reset scoreboard to initial state."""
         for status in self.register_status:
             status.busy = False
             status.writing_instruction = None
-            status.reading_instructions.clear()
+            status.reader_mask = 0
             status.last_write_cycle = -1
+        self._busy_mask = 0
+
+        self._reader_slot.clear()
+        self._slot_readers.clear()
+        self._slot_refs.clear()
+        self._free_slots.clear()
 
         self.function_unit_status.clear()
+        self._unit_types.clear()
+        self._counting_units.clear()
+        for free in self._free_units.values():
+            free.clear()
         self.active_instructions.clear()
         self.instruction_dependencies.clear()
+        self._pending_producers.clear()
+        self._ready_queue.clear()
 
-        for hazard_type in self.hazard_counts:
-            self.hazard_counts[hazard_type] = 0
+        self._hazard_counts[:] = [0, 0, 0, 0]
 
         self.current_cycle = 0
 
-        logging.info("Scoreboard reset")
+        _logger.info("Scoreboard reset")
@@ -12,6 +12,7 @@ from .pipeline_visualizer import (
     PipelineSnapshot,
     PipelineVisualizer,
     create_performance_dashboard,
+    save_performance_dashboards,
 )
 
 __all__ = [
@@ -19,4 +20,5 @@ __all__ = [
     "PipelineSnapshot",
     "PipelineVisualizer",
     "create_performance_dashboard",
+    "save_performance_dashboards",
 ]
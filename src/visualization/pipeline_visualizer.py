@@ -11,33 +11,84 @@ Python Version: 3.10+
 
 from __future__ import annotations
 
-from collections import deque
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-import queue
-from typing import Any, Dict, List, Type
-
-from matplotlib import animation
-from matplotlib.patches import Rectangle
-import matplotlib.pyplot as plt
-
-
-@dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Sequence,
+    Type,
+    overload,
+)
+
+# matplotlib and numpy are imported where they are first needed, so
+# importing this module (e.g. via main.py) stays cheap until a
+# visualizer is actually created
+if TYPE_CHECKING:
+    from matplotlib.artist import Artist
+    from matplotlib.figure import Figure
+    from matplotlib.text import Text
+    import numpy as np
+
+# Instructions shown per stage box
+_STAGE_SLOTS = 4
+
+# Snapshots buffered between animation frames; older ones are dropped first
+_UPDATE_BUFFER_SIZE = 1024
+
+# Stage display names, in PipelineSnapshot.stages order
+_STAGE_NAMES = ("Fetch", "Decode", "Issue", "Execute", "Memory", "WriteBack")
+
+# Stats banner box, shared by every banner artist
+_STATS_BBOX = {"boxstyle": "round,pad=0.3", "facecolor": "wheat"}
+
+# Hazard types known up front; HazardVisualizer assigns codes to others
+_HAZARD_TYPES = ("RAW", "WAR", "WAW", "Control", "Structural")
+
+
+@dataclass(slots=True, frozen=True)
 class PipelineSnapshot:
-    """Represents the state of the pipeline at a specific cycle."""
+    """
+    Represents the state of the pipeline at a specific cycle.
+
+    Stage contents may be passed as any sequence of strings; they are
+    stored as tuples, so a snapshot cannot change after it is queued.
+    """
 
     cycle: int
-    fetch: List[str]
-    decode: List[str]
-    issue: List[str]
-    execute: List[str]
-    memory: List[str]
-    writeback: List[str]
+    fetch: Sequence[str]
+    decode: Sequence[str]
+    issue: Sequence[str]
+    execute: Sequence[str]
+    memory: Sequence[str]
+    writeback: Sequence[str]
     branch_prediction_accuracy: float
     ipc: float
     stalls: int
     cache_hits: int
     cache_misses: int
 
+    def __post_init__(self) -> None:
+        for field in ("fetch", "decode", "issue", "execute", "memory", "writeback"):
+            object.__setattr__(self, field, tuple(getattr(self, field)))
+
+    @property
+    def stages(self) -> tuple[Sequence[str], ...]:
+        """Stage contents, fetch through writeback."""
+        return (
+            self.fetch,
+            self.decode,
+            self.issue,
+            self.execute,
+            self.memory,
+            self.writeback,
+        )
+
 
 class PipelineVisualizer:
     """
@@ -58,10 +109,14 @@ class PipelineVisualizer:
             fetch_width: Number of instructions fetched per cycle
             issue_width: Number of instructions issued per cycle
         """
+        import matplotlib.pyplot as plt
+        import numpy as np
+
         self.fetch_width = fetch_width
         self.issue_width = issue_width
 
-        # Initialize plot
+        # Initialize plot; the metric lines are drawn without antialiasing,
+        # as sub-pixel fidelity is irrelevant for them
         self.fig, (self.ax_pipeline, self.ax_metrics) = plt.subplots(
             2, 1, figsize=(14, 10), gridspec_kw={"height_ratios": [3, 1]}
         )
@@ -72,12 +127,24 @@ class PipelineVisualizer:
         self.ax_pipeline.set_aspect("equal")
         self.ax_pipeline.axis("off")
 
-        # Metrics visualization setup
+        # Metrics visualization setup: persistent lines whose data is
+        # replaced each frame, so axes, legend and grid are built only once
         self.ax_metrics.set_xlim(0, 100)
-        self.ax_metrics.set_ylim(0, 100)
+        self.ax_metrics.set_ylim(0, 105)
         self.ax_metrics.set_xlabel("Cycle")
         self.ax_metrics.set_ylabel("Percentage")
-        self.ax_metrics.legend(["IPC*20", "Branch Acc", "Cache Hit"])
+        line_kw = dict(animated=True, antialiased=False)
+        (self._ipc_line,) = self.ax_metrics.plot(
+            [], [], "b-", label="IPC×20", **line_kw
+        )
+        (self._branch_line,) = self.ax_metrics.plot(
+            [], [], "g-", label="Branch Acc %", **line_kw
+        )
+        (self._cache_line,) = self.ax_metrics.plot(
+            [], [], "r-", label="Cache Hit %", **line_kw
+        )
+        self.ax_metrics.legend(loc="upper left")
+        self.ax_metrics.grid(True, alpha=0.3)
 
         # Stage positions
         self.stage_positions = {
@@ -89,15 +156,29 @@ class PipelineVisualizer:
             "WriteBack": (8, 5),
         }
 
+        # Persistent per-stage instruction text (one multi-line artist per
+        # stage) and the stats banner, created once and updated in place so
+        # frames can be blitted
+        self._stage_texts: dict[str, Text] = {}
+        self._stage_text_order: tuple[Text, ...] = ()
+        self._stats_text: Text | None = None
+        # Per-frame artists created by replay(), removed by the next replay
+        self._replay_artists: list[Artist] = []
+
         # Data storage
         self.history_length = 100
-        self.ipc_history = deque(maxlen=self.history_length)  # type: ignore[var-annotated]
-        self.branch_acc_history = deque(maxlen=self.history_length)  # type: ignore[var-annotated]
-        self.cache_hit_history = deque(maxlen=self.history_length)  # type: ignore[var-annotated]
-        self.cycle_history = deque(maxlen=self.history_length)  # type: ignore[var-annotated]
-
-        # Thread-safe queue for updates
-        self.update_queue: queue.Queue[PipelineSnapshot] = queue.Queue()
+        # Metric history ring: rows are cycle, IPCx20, branch accuracy and
+        # cache hit rate. Every sample is written twice, history_length
+        # columns apart, so the newest samples are always one contiguous
+        # slice that can be handed to the lines without copying.
+        self._history = np.zeros((4, 2 * self.history_length), dtype=np.float64)
+        self._history_head = 0
+        self._history_count = 0
+
+        # Single-producer/single-consumer snapshot buffer. deque.append and
+        # deque.popleft are atomic, so neither side takes a lock, and the
+        # bounded length drops the oldest snapshots if rendering falls behind.
+        self.update_queue: deque[PipelineSnapshot] = deque(maxlen=_UPDATE_BUFFER_SIZE)
 
         # Draw static elements
         self._draw_pipeline_structure()
@@ -107,6 +188,8 @@ class PipelineVisualizer:
 
     def _draw_pipeline_structure(self) -> None:
         """Draw the static pipeline structure."""
+        from matplotlib.patches import Rectangle
+
         # Draw stage boxes
         for stage_name, (x, y) in self.stage_positions.items():
             rect = Rectangle(
@@ -123,6 +206,13 @@ class PipelineVisualizer:
                 fontweight="bold",
             )
 
+        # Instruction slots, one line each, blank until a snapshot fills them
+        for stage_name in self.stage_positions:
+            self._stage_texts[stage_name] = self._make_stage_text(stage_name, "")
+        self._stats_text = self._make_stats_text("")
+        # Same texts in PipelineSnapshot.stages order, for the per-frame loop
+        self._stage_text_order = tuple(self._stage_texts[name] for name in _STAGE_NAMES)
+
         # Draw connections between stages
         positions = list(self.stage_positions.values())
         for i in range(len(positions) - 1):
@@ -142,8 +232,30 @@ class PipelineVisualizer:
         # Draw functional units
         self._draw_functional_units()
 
+    def _make_stage_text(self, stage_name: str, content: str) -> Text:
+        """Create the animated instruction text below a stage label."""
+        x, y = self.stage_positions[stage_name]
+        return self.ax_pipeline.text(
+            x, y - 0.125, content, ha="center", va="top", fontsize=7, animated=True
+        )
+
+    def _make_stats_text(self, content: str) -> Text:
+        """Create the animated cycle/IPC/stalls banner."""
+        return self.ax_pipeline.text(
+            5,
+            6.5,
+            content,
+            ha="center",
+            va="center",
+            fontsize=10,
+            bbox=_STATS_BBOX,
+            animated=True,
+        )
+
     def _draw_functional_units(self) -> None:
         """Draw functional units below the execute stage."""
+        from matplotlib.patches import Rectangle
+
         exec_x, exec_y = self.stage_positions["Execute"]
 
         # ALU units
@@ -201,101 +313,231 @@ class PipelineVisualizer:
         Args:
             snapshot: Current state of the pipeline
         """
-        self.update_queue.put(snapshot)
+        self.update_queue.append(snapshot)
 
-    def _animate(self, frame: int) -> None:
-        """Animation update function."""
-        # Process all pending updates
-        updates_processed = 0
-        while not self.update_queue.empty() and updates_processed < 5:
+    def _animate(self, frame: int) -> list[Artist]:
+        """
+        Animation update function.
+
+        Returns the artists that change between frames; with blitting only
+        these are redrawn over the cached static background.
+        """
+        # Drain everything pending. Every snapshot feeds the metric history,
+        # but only the newest is visible, so the stage display is updated
+        # once per frame.
+        snapshots: list[PipelineSnapshot] = []
+        pending = self.update_queue
+        while True:
             try:
-                snapshot = self.update_queue.get_nowait()
-                self._update_visualization(snapshot)
-                updates_processed += 1
-            except queue.Empty:
+                snapshots.append(pending.popleft())
+            except IndexError:
                 break
 
-    def _update_visualization(self, snapshot: PipelineSnapshot) -> None:
-        """Update the visualization with new data."""
-        # Clear previous instruction text
-        for text in self.ax_pipeline.texts[:]:
-            if text.get_position()[1] < 4.5:  # Only remove instruction text
-                text.remove()
+        if snapshots:
+            self._update_visualization(snapshots[-1])
+            self._update_metrics(snapshots)
+
+        return self._animated_artists()
 
+    def _animated_artists(self) -> list[Artist]:
+        """Collect the artists redrawn on every animation frame."""
+        artists: list[Artist] = list(self._stage_texts.values())
+        if self._stats_text is not None:
+            artists.append(self._stats_text)
+        artists.extend((self._ipc_line, self._branch_line, self._cache_line))
+        return artists
+
+    def _update_visualization(self, snapshot: PipelineSnapshot) -> None:
+        """Update the pipeline stages and stats banner from a snapshot."""
         # Update pipeline stages
-        self._draw_stage_contents("Fetch", snapshot.fetch)
-        self._draw_stage_contents("Decode", snapshot.decode)
-        self._draw_stage_contents("Issue", snapshot.issue)
-        self._draw_stage_contents("Execute", snapshot.execute)
-        self._draw_stage_contents("Memory", snapshot.memory)
-        self._draw_stage_contents("WriteBack", snapshot.writeback)
-
-        # Update metrics
-        self.cycle_history.append(snapshot.cycle)
-        self.ipc_history.append(snapshot.ipc * 20)  # Scale for visibility
-        self.branch_acc_history.append(snapshot.branch_prediction_accuracy)
-        cache_hit_rate = (
-            snapshot.cache_hits / (snapshot.cache_hits + snapshot.cache_misses + 1e-6)
-        ) * 100
-        self.cache_hit_history.append(cache_hit_rate)
-
-        # Redraw metrics plot
-        self.ax_metrics.clear()
-        if len(self.cycle_history) > 1:
-            cycles = list(self.cycle_history)
-            self.ax_metrics.plot(cycles, list(self.ipc_history), "b-", label="IPC×20")
-            self.ax_metrics.plot(
-                cycles, list(self.branch_acc_history), "g-", label="Branch Acc %"
-            )
-            self.ax_metrics.plot(
-                cycles, list(self.cache_hit_history), "r-", label="Cache Hit %"
-            )
-            self.ax_metrics.set_xlim(max(0, cycles[0]), cycles[-1] + 1)
-            self.ax_metrics.set_ylim(0, 105)
-            self.ax_metrics.set_xlabel("Cycle")
-            self.ax_metrics.set_ylabel("Percentage")
-            self.ax_metrics.legend()
-            self.ax_metrics.grid(True, alpha=0.3)
-
-        # Add current stats text
-        stats_text = (
+        for text, instructions in zip(
+            self._stage_text_order, snapshot.stages, strict=True
+        ):
+            self._draw_stage_contents(text, instructions)
+
+        # Update current stats text
+        stats_text = self._stats_text
+        if stats_text is not None:
+            content = self._format_stats(snapshot)
+            if stats_text.get_text() != content:
+                stats_text.set_text(content)
+
+    @staticmethod
+    def _format_stats(snapshot: PipelineSnapshot) -> str:
+        """Text for the stats banner."""
+        return (
             f"Cycle: {snapshot.cycle} | "
             f"IPC: {snapshot.ipc:.2f} | "
             f"Stalls: {snapshot.stalls}"
         )
-        self.ax_pipeline.text(
-            5,
-            6.5,
-            stats_text,
-            ha="center",
-            va="center",
-            fontsize=10,
-            bbox=dict(boxstyle="round,pad=0.3", facecolor="wheat"),
+
+    def _update_metrics(self, snapshots: list[PipelineSnapshot]) -> None:
+        """Append a batch of snapshots to the metric history and lines."""
+        history = self._record_metrics(self._metric_samples(snapshots))
+
+        # Update metrics lines in place
+        cycles = history[0]
+        self._ipc_line.set_data(cycles, history[1])
+        self._branch_line.set_data(cycles, history[2])
+        self._cache_line.set_data(cycles, history[3])
+
+        # Scroll the x window in half-window steps rather than every cycle;
+        # the tick labels live in the blitted background, so a shift needs
+        # one full redraw
+        cycle = snapshots[-1].cycle
+        left, right = self.ax_metrics.get_xlim()
+        if cycle >= right or cycle < left:
+            left = max(0, cycle - self.history_length // 2)
+            self.ax_metrics.set_xlim(left, left + self.history_length)
+            self.fig.canvas.draw_idle()
+
+    @staticmethod
+    def _metric_samples(snapshots: list[PipelineSnapshot]) -> np.ndarray:
+        """
+        Build metric columns for a batch of snapshots.
+
+        Returns:
+            (4, k) array of cycle, IPCx20, branch accuracy and cache hit rate
+        """
+        import numpy as np
+
+        count = len(snapshots)
+        samples = np.empty((4, count), dtype=np.float64)
+        samples[0] = np.fromiter((s.cycle for s in snapshots), np.float64, count)
+        samples[1] = np.fromiter((s.ipc for s in snapshots), np.float64, count)
+        samples[1] *= 20  # Scale for visibility
+        samples[2] = np.fromiter(
+            (s.branch_prediction_accuracy for s in snapshots), np.float64, count
+        )
+        hits = np.fromiter((s.cache_hits for s in snapshots), np.float64, count)
+        accesses = hits + np.fromiter(
+            (s.cache_misses for s in snapshots), np.float64, count
         )
+        np.divide(hits * 100.0, accesses, out=samples[3], where=accesses > 0)
+        samples[3][accesses == 0] = 0.0
+        return samples
 
-    def _draw_stage_contents(self, stage_name: str, instructions: List[str]) -> None:
-        """Draw instructions in a pipeline stage."""
-        x, y = self.stage_positions[stage_name]
+    def _record_metrics(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Append samples to the metric history ring.
 
-        # Draw instructions vertically
-        for i, inst in enumerate(instructions[:4]):  # Max 4 instructions shown
-            if inst and inst != "NOP":
-                self.ax_pipeline.text(
-                    x, y - 0.2 - i * 0.15, inst, ha="center", va="center", fontsize=7
-                )
+        Args:
+            samples: (4, k) array of cycle, IPCx20, branch accuracy and cache
+                hit rate columns, oldest first
+
+        Returns:
+            A (4, n) view of the last n <= history_length samples, oldest first
+        """
+        import numpy as np
+
+        length = self.history_length
+        samples = samples[:, -length:]
+        count = samples.shape[1]
+        columns = (self._history_head + np.arange(count)) % length
+        self._history[:, columns] = samples
+        self._history[:, columns + length] = samples
+
+        head = self._history_head + count
+        self._history_head = head % length
+        self._history_count = min(self._history_count + count, length)
+        end = self._history_head + length
+        return self._history[:, end - self._history_count : end]
+
+    @staticmethod
+    def _stage_content(instructions: Sequence[str]) -> str:
+        """Text for a stage, one slot per line; blank lines keep NOP slots."""
+        return "\n".join(
+            inst if inst and inst != "NOP" else ""
+            for inst in instructions[:_STAGE_SLOTS]
+        )
+
+    def _draw_stage_contents(self, text: Text, instructions: Sequence[str]) -> None:
+        """Show instructions in a pipeline stage's text, one slot per line."""
+        content = self._stage_content(instructions)
+        if text.get_text() != content:
+            text.set_text(content)
 
     def start(self) -> None:
         """Start the visualization animation."""
+        from matplotlib import animation
+        import matplotlib.pyplot as plt
+
+        # A finished replay leaves the live artists un-animated
+        for artist in self._animated_artists():
+            artist.set_animated(True)
+
         self.animation = animation.FuncAnimation(  # type: ignore[assignment]
             self.fig,
             self._animate,  # type: ignore[arg-type]
             interval=100,
-            blit=False,  # type: ignore[arg-type]
+            blit=True,
+        )
+        plt.show(block=False)
+
+    def replay(self, snapshots: list[PipelineSnapshot], interval: int = 100) -> None:
+        """
+        Play back a recorded run.
+
+        Every frame's artists are built up front and handed to
+        ArtistAnimation, so playback only toggles visibility and never
+        polls the live update buffer.
+
+        Args:
+            snapshots: Recorded snapshots, in cycle order
+            interval: Delay between frames in milliseconds
+        """
+        from matplotlib import animation
+        import matplotlib.pyplot as plt
+
+        if not snapshots:
+            return
+
+        # Drop the frames of any earlier replay
+        if self.animation:
+            self.animation.event_source.stop()  # type: ignore[unreachable]
+        for artist in self._replay_artists:
+            artist.remove()
+        self._replay_artists.clear()
+
+        samples = self._metric_samples(snapshots)
+        cycles, ipc, branch_acc, cache_hit = samples
+        self.ax_metrics.set_xlim(cycles[0], cycles[-1] + 1)
+
+        frames: list[list[Artist]] = []
+        for i, snapshot in enumerate(snapshots[:-1]):
+            window = slice(max(0, i + 1 - self.history_length), i + 1)
+            frame: list[Artist] = [
+                self._make_stage_text(stage_name, self._stage_content(instructions))
+                for stage_name, instructions in zip(
+                    _STAGE_NAMES, snapshot.stages, strict=True
+                )
+            ]
+            frame.append(self._make_stats_text(self._format_stats(snapshot)))
+            frame.extend(self.ax_metrics.plot(cycles[window], ipc[window], "b-"))
+            frame.extend(self.ax_metrics.plot(cycles[window], branch_acc[window], "g-"))
+            frame.extend(self.ax_metrics.plot(cycles[window], cache_hit[window], "r-"))
+            frames.append(frame)
+            self._replay_artists.extend(frame)
+
+        # ArtistAnimation hides the artists of every frame up front. The last
+        # frame is the live artists showing the final snapshot, so they are
+        # visible again once playback ends.
+        window = slice(max(0, len(snapshots) - self.history_length), None)
+        self._update_visualization(snapshots[-1])
+        self._ipc_line.set_data(cycles[window], ipc[window])
+        self._branch_line.set_data(cycles[window], branch_acc[window])
+        self._cache_line.set_data(cycles[window], cache_hit[window])
+        frames.append(self._animated_artists())
+
+        self.animation = animation.ArtistAnimation(  # type: ignore[assignment]
+            self.fig, frames, interval=interval, blit=True, repeat=False
         )
         plt.show(block=False)
 
     def stop(self) -> None:
         """Stop the visualization."""
+        import matplotlib.pyplot as plt
+
         if self.animation:
             self.animation.event_source.stop()  # type: ignore[unreachable]
         plt.close(self.fig)
@@ -314,8 +556,50 @@ class HazardVisualizer:
 
     def __init__(self) -> None:
         """Initialize the hazard visualizer."""
+        import matplotlib.pyplot as plt
+
         self.fig, self.ax = plt.subplots(figsize=(12, 8))
-        self.hazard_history: List[Dict] = []
+
+        # Hazard events, stored column-wise. Type and resolution names are
+        # interned as small integer codes into _type_names and
+        # _resolution_names.
+        self._cycles = array("q")
+        self._type_codes = array("q")
+        self._resolution_codes = array("q")
+        self._sources: List[str] = []
+        self._destinations: List[str] = []
+        self._type_names: List[str] = list(_HAZARD_TYPES)
+        self._type_index: Dict[str, int] = {
+            name: code for code, name in enumerate(_HAZARD_TYPES)
+        }
+        self._resolution_names: List[str] = []
+        self._resolution_index: Dict[str, int] = {}
+
+    @property
+    def hazard_history(self) -> _HazardHistory:
+        """
+        Recorded hazard events as one dict per event, oldest first.
+
+        The view is live: appending a dict (with the add_hazard fields as
+        keys) records a new event, and assigning a list replaces them all.
+        """
+        return _HazardHistory(self)
+
+    @hazard_history.setter
+    def hazard_history(self, events: Iterable[Dict[str, Any]]) -> None:
+        events = list(events)  # May be a view of this visualizer
+        self._clear_hazards()
+        history = self.hazard_history
+        for event in events:
+            history.append(event)
+
+    def _clear_hazards(self) -> None:
+        """Drop every recorded hazard event, keeping the name codes."""
+        del self._cycles[:]
+        del self._type_codes[:]
+        del self._resolution_codes[:]
+        self._sources.clear()
+        self._destinations.clear()
 
     def add_hazard(
         self,
@@ -335,33 +619,43 @@ class HazardVisualizer:
             destination: Affected instruction/stage
             resolution: How the hazard was resolved
         """
-        self.hazard_history.append(
-            {
-                "cycle": cycle,
-                "type": hazard_type,
-                "source": source,
-                "destination": destination,
-                "resolution": resolution,
-            }
-        )
+        code = self._type_index.get(hazard_type)
+        if code is None:
+            code = self._type_index[hazard_type] = len(self._type_names)
+            self._type_names.append(hazard_type)
+        resolution_code = self._resolution_index.get(resolution)
+        if resolution_code is None:
+            resolution_code = len(self._resolution_names)
+            self._resolution_index[resolution] = resolution_code
+            self._resolution_names.append(resolution)
+
+        self._cycles.append(cycle)
+        self._type_codes.append(code)
+        self._resolution_codes.append(resolution_code)
+        self._sources.append(source)
+        self._destinations.append(destination)
 
     def visualize_hazards(self, start_cycle: int = 0, end_cycle: int = 100) -> None:
         """Create a visualization of hazards over time."""
-        # Filter hazards in range
-        hazards = [
-            h for h in self.hazard_history if start_cycle <= h["cycle"] <= end_cycle
-        ]
+        import matplotlib.pyplot as plt
+        import numpy as np
+
+        # Filter hazards in range with one mask over the cycle column
+        all_cycles = np.frombuffer(self._cycles, dtype=np.int64)
+        mask = (all_cycles >= start_cycle) & (all_cycles <= end_cycle)
+        cycles_in_range = all_cycles[mask]
+        codes = np.frombuffer(self._type_codes, dtype=np.int64)[mask]
 
-        if not hazards:
+        if not cycles_in_range.size:
             print("No hazards to visualize in the specified range")
             return
 
-        # Group by type
-        hazard_types = {}  # type: ignore[var-annotated]
-        for h in hazards:
-            if h["type"] not in hazard_types:
-                hazard_types[h["type"]] = []
-            hazard_types[h["type"]].append(h["cycle"])
+        # Group cycles by type, in order of each type's first hazard
+        unique_codes, first_seen = np.unique(codes, return_index=True)
+        hazard_types = {
+            self._type_names[code]: cycles_in_range[codes == code]
+            for code in unique_codes[np.argsort(first_seen)]
+        }
 
         # Create timeline plot
         self.ax.clear()
@@ -377,7 +671,7 @@ class HazardVisualizer:
         for hazard_type, cycles in hazard_types.items():
             color = colors.get(hazard_type, "gray")
             self.ax.scatter(
-                cycles, [y_pos] * len(cycles), c=color, s=100, label=hazard_type
+                cycles, np.full(len(cycles), y_pos), c=color, s=100, label=hazard_type
             )
             y_pos += 1
 
@@ -395,38 +689,96 @@ class HazardVisualizer:
 
     def generate_hazard_report(self) -> dict[str, Any]:
         """Generate a comprehensive hazard analysis report."""
-        if not self.hazard_history:
+        if not self._cycles:
             return {"error": "No hazard data available"}
 
-        # Count hazards by type
-        hazard_counts = {}  # type: ignore[var-annotated]
-        resolution_counts = {}  # type: ignore[var-annotated]
-
-        for h in self.hazard_history:
-            # Count by type
-            hazard_counts[h["type"]] = hazard_counts.get(h["type"], 0) + 1
-
-            # Count by resolution method
-            res_key = f"{h['type']}_{h['resolution']}"
-            resolution_counts[res_key] = resolution_counts.get(res_key, 0) + 1
+        # Count by type and by (type, resolution) code pair; Counter, zip and
+        # min/max all walk the typed columns in C, so names are only looked
+        # up once per distinct key
+        names = self._type_names
+        resolutions = self._resolution_names
+        hazard_counts = {
+            names[code]: count for code, count in Counter(self._type_codes).items()
+        }
+        resolution_counts = {
+            f"{names[code]}_{resolutions[resolution_code]}": count
+            for (code, resolution_code), count in Counter(
+                zip(self._type_codes, self._resolution_codes, strict=True)
+            ).items()
+        }
+        first_cycle = min(self._cycles)
+        last_cycle = max(self._cycles)
 
         # Calculate statistics
-        total_hazards = len(self.hazard_history)
-        cycles = [h["cycle"] for h in self.hazard_history]
-        cycle_range = max(cycles) - min(cycles) + 1 if cycles else 1
+        total_hazards = len(self._cycles)
+        cycle_range = last_cycle - first_cycle + 1
 
         report = {
             "total_hazards": total_hazards,
             "hazards_per_cycle": total_hazards / cycle_range,
             "hazard_counts": hazard_counts,
             "resolution_methods": resolution_counts,
-            "most_common_hazard": max(hazard_counts, key=hazard_counts.get),  # type: ignore[arg-type]
-            "cycle_range": (min(cycles), max(cycles)) if cycles else (0, 0),
+            "most_common_hazard": max(hazard_counts, key=hazard_counts.__getitem__),
+            "cycle_range": (first_cycle, last_cycle),
         }
 
         return report
 
 
+class _HazardHistory(Sequence[Dict[str, Any]]):
+    """List-like, live view of a HazardVisualizer's column-wise events."""
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: HazardVisualizer) -> None:
+        self._owner = owner
+
+    def __len__(self) -> int:
+        return len(self._owner._cycles)
+
+    @overload
+    def __getitem__(self, index: int) -> Dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> Dict[str, Any] | List[Dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        owner = self._owner
+        return {
+            "cycle": owner._cycles[index],
+            "type": owner._type_names[owner._type_codes[index]],
+            "source": owner._sources[index],
+            "destination": owner._destinations[index],
+            "resolution": owner._resolution_names[owner._resolution_codes[index]],
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def append(self, event: Dict[str, Any]) -> None:
+        """Record an event given as a dict of add_hazard's arguments."""
+        self._owner.add_hazard(
+            event["cycle"],
+            event["type"],
+            event["source"],
+            event["destination"],
+            event["resolution"],
+        )
+
+    def clear(self) -> None:
+        """Drop every recorded event."""
+        self._owner._clear_hazards()
+
+
 def create_performance_dashboard(simulator_stats: dict[str, Any]) -> None:
     """
     Create a comprehensive performance dashboard.
@@ -434,11 +786,56 @@ def create_performance_dashboard(simulator_stats: dict[str, Any]) -> None:
     Args:
         simulator_stats: dictionary containing various performance statistics
     """
+    import matplotlib.pyplot as plt
+
     fig = plt.figure(figsize=(15, 10))
+    _draw_dashboard(fig, simulator_stats)
+    plt.show()
+
+
+def save_performance_dashboards(
+    stats_list: Sequence[dict[str, Any]],
+    output_files: Sequence[str],
+    max_workers: int | None = None,
+) -> None:
+    """
+    Render a batch of dashboards to image files in parallel.
+
+    Each dashboard is drawn on its own pyplot-free Figure in a worker
+    process, so a sweep of runs costs roughly one render per core rather
+    than the sum of all renders.
+
+    Args:
+        stats_list: Statistics dictionaries, one per dashboard
+        output_files: Destination image path for each dashboard
+        max_workers: Worker process count (defaults to the CPU count)
+    """
+    if len(stats_list) != len(output_files):
+        raise ValueError("stats_list and output_files must have the same length")
+    if len(stats_list) == 1:
+        _render_dashboard_file(stats_list[0], output_files[0])
+        return
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        # list() re-raises the first worker failure here
+        list(pool.map(_render_dashboard_file, stats_list, output_files))
+
+
+def _render_dashboard_file(simulator_stats: dict[str, Any], output_file: str) -> None:
+    """Draw one dashboard off-screen and save it."""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(15, 10))
+    _draw_dashboard(fig, simulator_stats)
+    fig.savefig(output_file)
+
+
+def _draw_dashboard(fig: Figure, simulator_stats: dict[str, Any]) -> None:
+    """Draw the six dashboard panels onto fig."""
     fig.suptitle("Superscalar Pipeline Performance Dashboard", fontsize=16)
 
     # IPC over time
-    ax1 = plt.subplot(2, 3, 1)
+    ax1 = fig.add_subplot(2, 3, 1)
     cycles = simulator_stats.get("cycles", [])
     ipc_values = simulator_stats.get("ipc_history", [])
     ax1.plot(cycles, ipc_values, "b-")
@@ -448,7 +845,7 @@ def create_performance_dashboard(simulator_stats: dict[str, Any]) -> None:
     ax1.grid(True, alpha=0.3)
 
     # Branch prediction accuracy
-    ax2 = plt.subplot(2, 3, 2)
+    ax2 = fig.add_subplot(2, 3, 2)
     branch_acc = simulator_stats.get("branch_accuracy_history", [])
     ax2.plot(cycles, branch_acc, "g-")
     ax2.set_title("Branch Prediction Accuracy")
@@ -458,17 +855,18 @@ def create_performance_dashboard(simulator_stats: dict[str, Any]) -> None:
     ax2.grid(True, alpha=0.3)
 
     # Cache performance
-    ax3 = plt.subplot(2, 3, 3)
+    ax3 = fig.add_subplot(2, 3, 3)
     cache_hits = simulator_stats.get("cache_hits", 0)
     cache_misses = simulator_stats.get("cache_misses", 0)
     labels = ["Hits", "Misses"]
-    sizes = [cache_hits, cache_misses]
     colors = ["green", "red"]
-    ax3.pie(sizes, labels=labels, colors=colors, autopct="%1.1f%%")
+    ax3.barh(labels, _percentages([cache_hits, cache_misses]), color=colors)
     ax3.set_title("Cache Performance")
+    ax3.set_xlabel("Share (%)")
+    ax3.set_xlim(0, 105)
 
     # Functional unit utilization
-    ax4 = plt.subplot(2, 3, 4)
+    ax4 = fig.add_subplot(2, 3, 4)
     fu_utilization = simulator_stats.get("fu_utilization", {})
     units = list(fu_utilization.keys())
     utilization = list(fu_utilization.values())
@@ -478,16 +876,17 @@ def create_performance_dashboard(simulator_stats: dict[str, Any]) -> None:
     ax4.set_ylim(0, 105)
 
     # Instruction mix
-    ax5 = plt.subplot(2, 3, 5)
+    ax5 = fig.add_subplot(2, 3, 5)
     inst_mix = simulator_stats.get("instruction_mix", {})
     if inst_mix:
         labels = list(inst_mix.keys())
-        sizes = list(inst_mix.values())
-        ax5.pie(sizes, labels=labels, autopct="%1.1f%%")
+        ax5.barh(labels, _percentages(list(inst_mix.values())))
         ax5.set_title("Instruction Mix")
+        ax5.set_xlabel("Share (%)")
+        ax5.set_xlim(0, 105)
 
     # Stall analysis
-    ax6 = plt.subplot(2, 3, 6)
+    ax6 = fig.add_subplot(2, 3, 6)
     stall_types = simulator_stats.get("stall_types", {})
     if stall_types:
         types = list(stall_types.keys())
@@ -497,5 +896,15 @@ def create_performance_dashboard(simulator_stats: dict[str, Any]) -> None:
         ax6.set_ylabel("Count")
         ax6.tick_params(axis="x", rotation=45)
 
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+
+
+def _percentages(counts: Sequence[float]) -> np.ndarray:
+    """Each count as a percentage of the total (all zeros if the total is 0)."""
+    import numpy as np
+
+    values = np.asarray(counts, dtype=np.float64)
+    total = values.sum()
+    if total <= 0:
+        return np.zeros_like(values)
+    return values * (100.0 / total)
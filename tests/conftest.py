@@ -2,13 +2,13 @@
 Pytest configuration for the Superscalar Pipeline Simulator test suite.
 
 Adds the ``src/`` directory to ``sys.path`` so that source modules which use
-``from utils.X import Y`` style imports (inside fallback ``except`` blocks or
-function bodies) resolve correctly under pytest.
+``from utils.X import Y`` style imports (inside fallback ``except`` blocks)
+resolve correctly under pytest.
 
-Without this, tests that import ``src.pipeline.hazard_controller`` or
-``src.register_file.enhanced_register_renaming`` trigger ``ModuleNotFoundError``
-when those modules call ``from utils.instruction_parser import parse_register``
-internally — because ``src/`` is not on ``sys.path`` when pytest collects tests.
+Source modules import their siblings relatively, so a test importing
+``src.pipeline.hazard_controller`` sees the same ``src.utils.instruction``
+module (and ``Instruction`` class) as the rest of the package; only the
+fallback paths rely on ``src/`` being importable.
 """
 
 from pathlib import Path
@@ -11,7 +11,7 @@ What's tested:
   - LRU, FIFO, and random replacement policies
   - Write-through and write-back policies
   - Cache flush and invalidate
-  - InstructionCache: add/fetch/has
+  - InstructionCache: add/fetch/has, bulk add
   - DataCache: load/store/store-buffer
   - Memory: read/write/load_program/bounds checking
   - MemoryHierarchy: L1I → L1D → L2 → memory flow
@@ -20,6 +20,8 @@ What's tested:
 
 from __future__ import annotations
 
+from array import array
+
 import pytest
 
 from src.cache.cache import (
@@ -121,10 +123,42 @@ class TestCache:
         # Read offset 5 within the loaded block
         assert cache.read(0x005) == 5
 
+    def test_evicted_tag_no_longer_hits(self) -> None:
+        cache = Cache(cache_size=8, block_size=4, associativity=1)
+        cache.write(0x00, 1)
+        cache.write(0x08, 2)  # same set, replaces 0x00
+        assert cache.read(0x08) == 2
+        assert cache.read(0x00) is None
+        assert cache.evictions == 1
+
+    def test_duplicate_block_found_after_invalidating_copy(self, cache: Cache) -> None:
+        cache.load_block(0x000, list(range(64)))
+        cache.load_block(0x000, [7] * 64)  # second copy in another way
+        assert cache.read(0x001) == 1  # lowest way wins, as with a scan
+        cache.invalidate(0x000)
+        assert cache.read(0x001) == 7
+
 
 class TestCacheReplacementPolicies:
     """Different eviction strategies."""
 
+    def test_write_many_matches_single_writes(self) -> None:
+        addresses = [0, 4, 8, 64, 68, 0, 256, 512, 768, 1024, 12]
+        values = list(range(len(addresses)))
+        single = Cache(256, 64, associativity=2, write_policy="write_back")
+        bulk = Cache(256, 64, associativity=2, write_policy="write_back")
+        for address, value in zip(addresses, values, strict=True):
+            single.write(address, value)
+        assert bulk.write_many(addresses, values) == len(addresses)
+        assert bulk.get_statistics() == single.get_statistics()
+        for address in addresses:
+            assert bulk.read(address) == single.read(address)
+
+    def test_write_many_rejects_length_mismatch(self) -> None:
+        cache = Cache(256, 64)
+        with pytest.raises(ValueError):
+            cache.write_many([0, 4], [1])
+
     def test_lru_evicts_least_recent(self) -> None:
         # Direct-mapped (1-way), 2 blocks of 4 bytes → 2 sets
         cache = Cache(
@@ -205,6 +239,20 @@ class TestInstructionCache:
         # Should be capped at fetch_bandwidth (4)
         assert len(fetched) == 4
 
+    def test_add_instructions_matches_single_adds(
+        self, icache: InstructionCache
+    ) -> None:
+        program = {i * 4: {"opcode": "ADD", "addr": i * 4} for i in range(40)}
+        single = InstructionCache(
+            cache_size=256, block_size=64, memory=Memory(size=4096)
+        )
+        for address, data in program.items():
+            single.add_instruction(address, data)
+        icache.add_instructions(program)
+        assert icache.instruction_storage == single.instruction_storage
+        assert icache.get_statistics() == single.get_statistics()
+        assert icache.read(0x40) == single.read(0x40)
+
     def test_invalidate_range(self, icache: InstructionCache) -> None:
         icache.add_instruction(0x100, {"opcode": "ADD"})
         icache.add_instruction(0x104, {"opcode": "SUB"})
@@ -239,6 +287,13 @@ class TestDataCache:
         # Value should come from store buffer on load
         assert dcache.load(0x300) == 99
 
+    def test_restore_keeps_address_in_store_buffer(self, dcache: DataCache) -> None:
+        dcache.store_buffer_size = 2
+        dcache.store(0x100, 1)
+        dcache.store(0x104, 2)
+        dcache.store(0x100, 3)  # refreshes 0x100 instead of evicting 0x104
+        assert list(dcache.store_buffer.items()) == [(0x104, 2), (0x100, 3)]
+
     def test_flush_write_buffer(self, dcache: DataCache) -> None:
         dcache.store(0x100, 1)
         dcache.flush_write_buffer()
@@ -317,6 +372,25 @@ class TestMemory:
         mem.write(0, [5, 6, 7])
         assert mem.dump_region(0, 3) == [5, 6, 7]
 
+    def test_cells_stored_compactly(self, mem: Memory) -> None:
+        mem.write(0, [-1, 2**31 - 1])
+        assert isinstance(mem.data, array)
+        assert mem.read(0, 2) == [-1, 2**31 - 1]
+
+    def test_unsigned_word_stays_compact(self, mem: Memory) -> None:
+        """Register values are masked to 32 bits, e.g. -1 as 0xFFFFFFFF."""
+        mem.write(0, 0xFFFFFFFF, size=1)
+        mem.write(1, [2**31, 2**40])
+        assert isinstance(mem.data, array)
+        assert mem.read(0, 3) == [0xFFFFFFFF, 2**31, 2**40]
+
+    def test_wide_value_widens_storage(self, mem: Memory) -> None:
+        mem.write(0, [1, 2, 3])
+        mem.write(1, 2**64, size=1)
+        mem.write(2, [1.5])
+        assert isinstance(mem.data, list)
+        assert mem.read(0, 4) == [1, 2**64, 1.5, 0]
+
 
 # ========================== MemoryHierarchy =================================
 
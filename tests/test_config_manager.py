@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test suite for ConfigManager.
+
+Covers SIMULATOR_* environment variable overrides and how their parsed
+form is reused between loads. Skipped when pydantic is not installed.
+"""
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from src.config.config_manager import ConfigManager
+
+# ============================== Fixtures ====================================
+
+
+@pytest.fixture
+def manager() -> ConfigManager:
+    """Fresh manager with no cached environment overrides."""
+    return ConfigManager()
+
+
+# ============================== Env overrides ===============================
+
+
+class TestEnvOverrides:
+    """SIMULATOR_* variables applied on top of the loaded configuration."""
+
+    def test_override_applied(
+        self, manager: ConfigManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("SIMULATOR_PIPELINE__FETCH_WIDTH", "8")
+        monkeypatch.setenv("SIMULATOR_DEBUG__ENABLED", "true")
+        config = manager.load_default()
+        assert config.pipeline.fetch_width == 8
+        assert config.debug.enabled is True
+
+    def test_override_follows_environment_changes(
+        self, manager: ConfigManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("SIMULATOR_PIPELINE__FETCH_WIDTH", "8")
+        assert manager.load_default().pipeline.fetch_width == 8
+        monkeypatch.setenv("SIMULATOR_PIPELINE__FETCH_WIDTH", "6")
+        assert manager.load_default().pipeline.fetch_width == 6
+        monkeypatch.setenv("SIMULATOR_SIMULATION__MAX_CYCLES", "500")
+        config = manager.load_default()
+        assert config.pipeline.fetch_width == 6
+        assert config.simulation.max_cycles == 500
+        monkeypatch.delenv("SIMULATOR_PIPELINE__FETCH_WIDTH")
+        monkeypatch.delenv("SIMULATOR_SIMULATION__MAX_CYCLES")
+        config = manager.load_default()
+        assert config.pipeline.fetch_width == 4
+        assert config.simulation.max_cycles != 500
+
+    def test_nested_unit_override(
+        self, manager: ConfigManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("SIMULATOR_MEMORY__DATA_CACHE__ASSOCIATIVITY", "8")
+        assert manager.load_default().memory.data_cache.associativity == 8
+
+    def test_unrelated_variables_reuse_parsed_overrides(
+        self, manager: ConfigManager, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("SIMULATOR_PIPELINE__FETCH_WIDTH", "8")
+        manager.load_default()
+        parsed = manager._env_overrides
+        monkeypatch.setenv("UNRELATED_TEST_VARIABLE", "1")
+        assert manager.load_default().pipeline.fetch_width == 8
+        assert manager._env_overrides is parsed
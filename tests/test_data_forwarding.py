@@ -16,8 +16,9 @@ from src.data_forwarding.data_forwarding_unit import (
     DataForwardingUnit,
     ForwardedData,
     ForwardingPath,
+    instruction_type_mask,
 )
-from src.utils.instruction import Instruction
+from src.utils.instruction import Instruction, InstructionType
 
 # ============================== Fixtures ====================================
 
@@ -83,6 +84,30 @@ class TestDataForwardingUnitBasics:
             or len(forwarding_unit.forwarding_data) > 0
         )
 
+    def test_forward_data_batch_matches_single_calls(
+        self, forwarding_unit: DataForwardingUnit
+    ) -> None:
+        """A batch leaves the same forwarding state as one call per producer."""
+        single = DataForwardingUnit()
+        producers = []
+        for i in range(12):
+            inst = Instruction(
+                address=4 * i, opcode="add", operands=[f"$t{i % 2}", "$t2", "$t3"]
+            )
+            inst.result = i
+            producers.append((inst, "execute" if i % 3 else "memory"))
+        store = Instruction(address=64, opcode="sw", operands=["$t0", "0($sp)"])
+        store.result = 99
+        producers.append((store, "memory"))
+
+        for inst, stage in producers:
+            single.forward_data(inst, stage)
+        assert forwarding_unit.forward_data_batch(producers) == 12
+        assert forwarding_unit.current_forwards == single.current_forwards
+        assert forwarding_unit.forwarding_data == single.forwarding_data
+        assert len(forwarding_unit.forwarding_data["$t1"]) == 5  # history cap
+        assert forwarding_unit.forwards_count == single.forwards_count == 12
+
     def test_check_dependency_detects_raw(
         self,
         forwarding_unit: DataForwardingUnit,
@@ -133,6 +158,55 @@ class TestDataForwardingApply:
         data = forwarding_unit.get_forwarded_data(add_instruction, "decode")
         assert data is None
 
+    def test_type_mask_selects_paths(
+        self,
+        forwarding_unit: DataForwardingUnit,
+        add_instruction: Instruction,
+        sub_instruction: Instruction,
+    ) -> None:
+        """Paths whose type mask excludes the consumer are skipped."""
+        forwarding_unit.add_forwarding_path(
+            "memory",
+            "execute",
+            type_mask=instruction_type_mask(InstructionType.MEMORY),
+            priority=2,
+        )
+        forwarding_unit.add_forwarding_path(
+            "execute",
+            "execute",
+            type_mask=instruction_type_mask(InstructionType.ARITHMETIC),
+        )
+        add_instruction.result = 7
+        forwarding_unit.forward_data(add_instruction, "execute")
+        forwarding_unit.current_forwards["memory"] = {"$t0": 99}
+        data = forwarding_unit.get_forwarded_data(sub_instruction, "execute")
+        assert data == {"$t0": 7}
+        assert forwarding_unit.forward_misses == 1  # $t4
+
+    def test_paths_kept_in_priority_order(
+        self, forwarding_unit: DataForwardingUnit
+    ) -> None:
+        """Paths are ordered by priority, equal priorities by insertion."""
+        forwarding_unit.add_forwarding_path("writeback", "execute", priority=0)
+        forwarding_unit.add_forwarding_path("execute", "execute", priority=2)
+        forwarding_unit.add_forwarding_path("memory", "execute", priority=0)
+        forwarding_unit.add_forwarding_path("memory", "decode", priority=1)
+        order = [p.from_stage for p in forwarding_unit._paths_by_stage["execute"]]
+        assert order == ["execute", "writeback", "memory"]
+        assert [p.priority for p in forwarding_unit.forwarding_paths] == [2, 1, 0, 0]
+
+    def test_highest_priority_source_wins(
+        self, forwarding_unit: DataForwardingUnit, sub_instruction: Instruction
+    ) -> None:
+        """A register found on a higher-priority path is not overridden."""
+        forwarding_unit.add_forwarding_path("memory", "execute", priority=0)
+        forwarding_unit.add_forwarding_path("execute", "execute", priority=1)
+        forwarding_unit.current_forwards["memory"] = {"$t0": 1, "$t4": 2}
+        forwarding_unit.current_forwards["execute"] = {"$t0": 3}
+        data = forwarding_unit.get_forwarded_data(sub_instruction, "execute")
+        assert data == {"$t0": 3, "$t4": 2}
+        assert forwarding_unit.forward_hits == 2
+
 
 # =================== AdvancedDataForwardingUnit ============================
 
@@ -176,6 +250,25 @@ class TestAdvancedDataForwardingUnit:
         assert isinstance(resolved, ForwardedData)
         # Higher cycle + higher stage priority wins -> src2 (memory, cycle=6)
         assert resolved.value == 200
+        assert not hasattr(resolved, "__dict__")
+        with pytest.raises(AttributeError):
+            resolved.value = 0  # type: ignore[misc]
+
+    def test_resolve_forwarding_conflict_keeps_source_order(
+        self,
+        advanced_forwarding_unit: AdvancedDataForwardingUnit,
+        add_instruction: Instruction,
+    ) -> None:
+        """The caller's list is left as is and ties go to the first source."""
+        sources = [
+            ForwardedData(add_instruction, "$t0", value, "execute", cycle)
+            for value, cycle in ((1, 4), (2, 7), (3, 7))
+        ]
+        original = list(sources)
+        resolved = advanced_forwarding_unit.resolve_forwarding_conflict("$t0", sources)
+        assert resolved.value == 2
+        assert sources == original
+        assert advanced_forwarding_unit.conflicts == 1
 
     def test_resolve_forwarding_conflict_empty(
         self, advanced_forwarding_unit: AdvancedDataForwardingUnit
@@ -31,6 +31,11 @@ from src.utils.scoreboard import (
 # ============================== Fixtures ====================================
 
 
+def _fail_resolve(register: str) -> int:
+    """Resolver for checks that must hit the instruction's cached sources."""
+    raise AssertionError(f"{register} resolved again")
+
+
 @pytest.fixture
 def scoreboard() -> Scoreboard:
     """Create a fresh Scoreboard instance."""
@@ -72,6 +77,14 @@ class TestScoreboardBasics:
         assert scoreboard is not None
         assert len(scoreboard.register_status) == 32
 
+    def test_status_records_use_slots(
+        self, scoreboard: Scoreboard, add_instruction: Instruction
+    ) -> None:
+        """Per-register and per-unit status records carry no __dict__."""
+        scoreboard.allocate_function_unit("ALU0", add_instruction)
+        assert not hasattr(scoreboard.register_status[0], "__dict__")
+        assert not hasattr(scoreboard.function_unit_status["ALU0"], "__dict__")
+
     def test_allocate_register_write(
         self, scoreboard: Scoreboard, add_instruction: Instruction
     ) -> None:
@@ -152,6 +165,20 @@ class TestScoreboardHazards:
         has_structural = scoreboard.check_structural_hazard(inst2)
         assert isinstance(has_structural, bool)
 
+    def test_structural_hazard_tracks_free_units(
+        self, scoreboard: Scoreboard, add_instruction: Instruction
+    ) -> None:
+        """A unit type is available while at least one of its units is free."""
+        lw = Instruction(address=0x1008, opcode="lw", operands=["$t0", "0($sp)"])
+        assert scoreboard.check_structural_hazard(add_instruction) is True
+        scoreboard.allocate_function_unit("ALU0", add_instruction)
+        scoreboard.allocate_function_unit("ALU1", add_instruction)
+        scoreboard.deallocate_function_unit("ALU1")
+        assert scoreboard.check_structural_hazard(add_instruction) is False
+        assert scoreboard.check_structural_hazard(lw) is True
+        scoreboard.allocate_function_unit("ALU1", add_instruction)
+        assert scoreboard.check_structural_hazard(add_instruction) is True
+
     def test_check_hazards_comprehensive(
         self,
         scoreboard: Scoreboard,
@@ -164,12 +191,246 @@ class TestScoreboardHazards:
         hazards = scoreboard.check_hazards(sub_instruction)
         assert isinstance(hazards, list)
 
+    def test_check_war_hazard(
+        self,
+        scoreboard: Scoreboard,
+        add_instruction: Instruction,
+        sub_instruction: Instruction,
+    ) -> None:
+        """Detect WAR hazard when add writes $t0 while sub still reads it."""
+        scoreboard.allocate_register_read("$t0", sub_instruction)
+        assert scoreboard.check_war_hazard(add_instruction) is True
+        assert scoreboard.hazard_counts[ScoreboardHazardType.WAR] == 1
+
+    def test_war_ignores_own_read(
+        self, scoreboard: Scoreboard, add_instruction: Instruction
+    ) -> None:
+        """An instruction reading its own destination is not a WAR hazard."""
+        scoreboard.allocate_register_read("$t0", add_instruction)
+        assert scoreboard.check_war_hazard(add_instruction) is False
+
+    def test_war_cleared_after_read_removed(
+        self,
+        scoreboard: Scoreboard,
+        add_instruction: Instruction,
+        sub_instruction: Instruction,
+    ) -> None:
+        """Removing the last read releases the reader."""
+        scoreboard.allocate_register_read("$t0", sub_instruction)
+        scoreboard.allocate_register_read("$t4", sub_instruction)
+        scoreboard.remove_register_read("$t0", sub_instruction)
+        assert scoreboard.check_war_hazard(add_instruction) is False
+        assert scoreboard.get_register_readers("$t4") == [sub_instruction]
+        scoreboard.remove_register_read("$t4", sub_instruction)
+        assert scoreboard.get_register_readers("$t4") == []
+
+    def test_check_hazards_reports_each_type_once(
+        self, scoreboard: Scoreboard, add_instruction: Instruction
+    ) -> None:
+        """Fused check reports RAW, WAR and WAW together."""
+        scoreboard.allocate_function_unit("ALU0", add_instruction, cycles=1)
+        scoreboard.deallocate_function_unit("ALU0")
+        writer = Instruction(
+            address=0x0FFC, opcode="add", operands=["$t1", "$t5", "$t6"]
+        )
+        reader = Instruction(
+            address=0x0FF8, opcode="sub", operands=["$t7", "$t0", "$t6"]
+        )
+        other = Instruction(
+            address=0x0FF4, opcode="add", operands=["$t0", "$t5", "$t6"]
+        )
+        scoreboard.allocate_register_write("$t1", writer)
+        scoreboard.allocate_register_read("$t0", reader)
+        scoreboard.allocate_register_write("$t0", other)
+        hazards = scoreboard.check_hazards(add_instruction)
+        assert hazards == [
+            ScoreboardHazardType.RAW,
+            ScoreboardHazardType.WAR,
+            ScoreboardHazardType.WAW,
+        ]
+
+    def test_check_hazards_batch_matches_single_checks(
+        self, add_instruction: Instruction, sub_instruction: Instruction
+    ) -> None:
+        """Batched check agrees with per-instruction checks, counts included."""
+        load = Instruction(address=0x1008, opcode="lw", operands=["$t4", "0($t3)"])
+        group = [add_instruction, sub_instruction, load]
+        boards = []
+        for _ in range(2):
+            board = Scoreboard(num_registers=32)
+            writer = Instruction(
+                address=0x0FFC, opcode="add", operands=["$t0", "$t5", "$t6"]
+            )
+            board.allocate_register_write("$t0", writer)
+            board.allocate_register_read("$t4", writer)
+            boards.append(board)
+
+        single = [boards[0].check_hazards(inst) for inst in group]
+        assert boards[1].check_hazards_batch(group) == single
+        assert ScoreboardHazardType.RAW in single[1]
+        assert boards[1].hazard_counts == boards[0].hazard_counts
+
+    def test_source_numbers_cached_on_instruction(
+        self,
+        scoreboard: Scoreboard,
+        add_instruction: Instruction,
+        sub_instruction: Instruction,
+    ) -> None:
+        """Resolved source numbers are computed once and reused."""
+        scoreboard.allocate_register_write("$t0", add_instruction)
+        assert scoreboard.check_raw_hazard(sub_instruction)
+        assert sub_instruction.source_register_numbers(_fail_resolve) == (
+            (8, 12),
+            (1 << 8) | (1 << 12),
+        )
+        other = Scoreboard(num_registers=32)
+        other.allocate_register_write("$t0", add_instruction)
+        assert other.check_raw_hazard(sub_instruction)
+
+    def test_raw_ignores_own_write(
+        self, scoreboard: Scoreboard, add_instruction: Instruction
+    ) -> None:
+        """A busy source written by the instruction itself is not a RAW hazard."""
+        own = Instruction(address=0, opcode="ADD", operands=["$t0", "$t0", "$t4"])
+        scoreboard.allocate_register_write("$t0", own)
+        assert not scoreboard.check_raw_hazard(own)
+        scoreboard.allocate_register_write("$t4", add_instruction)
+        assert scoreboard.check_raw_hazard(own)
+
+    def test_check_hazards_batch_idle_scoreboard(
+        self, scoreboard: Scoreboard, add_instruction: Instruction
+    ) -> None:
+        """Nothing in flight means no hazards for any instruction."""
+        scoreboard.allocate_function_unit("ALU0", add_instruction)
+        scoreboard.deallocate_function_unit("ALU0")
+        assert scoreboard.check_hazards_batch([add_instruction] * 3) == [[], [], []]
+        assert scoreboard.check_hazards_batch([]) == []
+
+    def test_statistics_count_busy_registers(
+        self, scoreboard: Scoreboard, add_instruction: Instruction
+    ) -> None:
+        """busy_registers tracks allocations and deallocations."""
+        scoreboard.allocate_register_write("$t0", add_instruction)
+        scoreboard.allocate_register_write("$t1", add_instruction)
+        scoreboard.deallocate_register("$t0")
+        stats = scoreboard.get_statistics()
+        assert stats["busy_registers"] == 1
+        assert "R9(ADD)" in scoreboard.visualize_state()
+
+    def test_visualize_state_sections(
+        self, scoreboard: Scoreboard, add_instruction: Instruction
+    ) -> None:
+        """visualize_state lists busy units, free units and nonzero hazards."""
+        scoreboard.allocate_function_unit("ALU0", add_instruction, cycles=3)
+        scoreboard.allocate_function_unit("FPU0", add_instruction)
+        scoreboard.deallocate_function_unit("FPU0")
+        text = scoreboard.visualize_state()
+        assert "None busy" in text
+        assert "ALU0: ADD (3 cycles left)" in text
+        assert "FPU0: Available" in text
+        assert text.endswith("Hazard Summary:")
+
+    def test_hazard_counts_by_type(
+        self,
+        scoreboard: Scoreboard,
+        add_instruction: Instruction,
+        sub_instruction: Instruction,
+    ) -> None:
+        """Counts are reported per HazardType and cleared by reset."""
+        scoreboard.allocate_register_read("$t0", sub_instruction)
+        scoreboard.check_war_hazard(add_instruction)
+        scoreboard.check_war_hazard(add_instruction)
+        counts = scoreboard.hazard_counts
+        assert list(counts) == list(ScoreboardHazardType)
+        assert counts[ScoreboardHazardType.WAR] == 2
+        assert scoreboard.get_statistics()["total_hazards"] == 2
+        scoreboard.reset()
+        assert sum(scoreboard.hazard_counts.values()) == 0
+
+    def test_hazard_counts_are_writable(self, scoreboard: Scoreboard) -> None:
+        """Item updates and whole-dict assignment reach the scoreboard."""
+        scoreboard.hazard_counts[ScoreboardHazardType.RAW] += 1
+        assert scoreboard.hazard_counts[ScoreboardHazardType.RAW] == 1
+        assert scoreboard.get_statistics()["total_hazards"] == 1
+        scoreboard.hazard_counts = {ScoreboardHazardType.WAW: 3}
+        assert scoreboard.hazard_counts == {
+            ScoreboardHazardType.RAW: 0,
+            ScoreboardHazardType.WAR: 0,
+            ScoreboardHazardType.WAW: 3,
+            ScoreboardHazardType.STRUCTURAL: 0,
+        }
+
+    def test_immediate_operands_are_not_sources(
+        self, scoreboard: Scoreboard, add_instruction: Instruction
+    ) -> None:
+        """Negative and positive immediates never enter the source mask."""
+        scoreboard.allocate_register_write("$t0", add_instruction)
+        scoreboard.track_instruction(add_instruction)
+        for imm in (-3, 5):
+            inst = Instruction(
+                address=0x1008, opcode="ADD", operands=["$t3", "$t0", imm]
+            )
+            assert scoreboard.check_raw_hazard(inst)
+            assert not scoreboard.track_instruction(inst)
+            assert inst.source_register_numbers(_fail_resolve) == ((8,), 1 << 8)
+
+    def test_dependency_graph_wakes_dependents_on_retire(
+        self,
+        scoreboard: Scoreboard,
+        add_instruction: Instruction,
+        sub_instruction: Instruction,
+    ) -> None:
+        """A consumer becomes ready only once its producer retires."""
+        assert scoreboard.track_instruction(add_instruction)
+        scoreboard.allocate_register_write("$t0", add_instruction)
+        assert not scoreboard.track_instruction(sub_instruction)
+        assert scoreboard.pop_ready_instructions() == [add_instruction]
+
+        assert scoreboard.retire_instruction(add_instruction) == [sub_instruction]
+        assert scoreboard.pop_ready_instructions() == [sub_instruction]
+        assert scoreboard.retire_instruction(add_instruction) == []
+
+    def test_critical_path_follows_heaviest_chain(
+        self, scoreboard: Scoreboard, add_instruction: Instruction
+    ) -> None:
+        """The critical path sums latencies along the longest chain."""
+        mul = Instruction(address=0x1004, opcode="mul", operands=["$t3", "$t0", "$t0"])
+        lw = Instruction(address=0x1008, opcode="lw", operands=["$t4", "0($t3)"])
+        side = Instruction(address=0x100C, opcode="sub", operands=["$t5", "$t0", "$t1"])
+        for inst in (add_instruction, mul, lw, side):
+            scoreboard.track_instruction(inst)
+            scoreboard.allocate_register_write(inst.destination, inst)
+
+        total, path = scoreboard.critical_path()
+        expected = [add_instruction, mul, lw]
+        assert path == expected
+        assert total == sum(inst.get_latency() for inst in expected)
+        assert scoreboard.critical_path() == (total, path)
+
+        scoreboard.reset()
+        assert scoreboard.critical_path() == (0, [])
+
     def test_update_cycle(self, scoreboard: Scoreboard) -> None:
         """update_cycle should advance the cycle counter."""
         initial_cycle = scoreboard.current_cycle
         scoreboard.update_cycle()
         assert scoreboard.current_cycle == initial_cycle + 1
 
+    def test_update_cycle_counts_down_busy_units(
+        self, scoreboard: Scoreboard, add_instruction: Instruction
+    ) -> None:
+        """Busy units count down to result_ready; freed units stop counting."""
+        scoreboard.allocate_function_unit("ALU0", add_instruction, cycles=2)
+        scoreboard.allocate_function_unit("ALU1", add_instruction, cycles=2)
+        scoreboard.deallocate_function_unit("ALU1")
+        scoreboard.update_cycle()
+        alu0 = scoreboard.function_unit_status["ALU0"]
+        assert alu0.remaining_cycles == 1 and not alu0.result_ready
+        scoreboard.update_cycle()
+        scoreboard.update_cycle()
+        assert alu0.remaining_cycles == 0 and alu0.result_ready
+        assert scoreboard.function_unit_status["ALU1"].remaining_cycles == 2
+
     def test_reset(self, scoreboard: Scoreboard, add_instruction: Instruction) -> None:
         """Reset should clear all state."""
         scoreboard.allocate_register_write("$t0", add_instruction)
@@ -209,6 +470,17 @@ class TestHazardController:
             if completed:
                 break
 
+    def test_consumers_dropped_on_flush(
+        self, hazard_controller: HazardController
+    ) -> None:
+        """Repeated source registers are tracked once and removed on flush."""
+        inst = Instruction(address=0x1000, opcode="add", operands=["$t0", "$t1", "$t1"])
+        assert hazard_controller.issue_instruction(inst, instruction_id=7)
+        consumers = hazard_controller.register_consumers
+        assert [list(ids) for ids in consumers.values()] == [[7]]
+        hazard_controller.flush_instructions([7])
+        assert not any(consumers.values())
+
     def test_get_statistics(self, hazard_controller: HazardController) -> None:
         """Get hazard controller statistics."""
         stats = hazard_controller.get_statistics()
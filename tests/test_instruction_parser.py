@@ -62,6 +62,12 @@ class TestParseRegister:
     def test_out_of_range_numeric_defaults_to_zero(self) -> None:
         assert parse_register("99") == 0
 
+    def test_leading_zero_numeric(self) -> None:
+        assert parse_register("$08") == 8
+
+    def test_non_string_operand_defaults_to_zero(self) -> None:
+        assert parse_register(["$t0"]) == 0  # type: ignore[arg-type]
+
 
 class TestRegisterMap:
     """MIPS_REGISTER_MAP completeness checks."""
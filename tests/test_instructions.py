@@ -9,15 +9,18 @@ defined in ``src/utils/instruction.py``.
 What's tested:
   - InstructionType auto-detection from opcodes
   - R/I/S-type classification
-  - Source and destination register extraction
+  - Source and destination register extraction (cached per distinct decode)
   - Branch condition evaluation (BEQ, BNE, BLT, BGE, jumps)
   - Latency lookup for every supported opcode
   - BranchInstruction target-address calculation
   - InstructionBundle dependency detection and branch scanning
+  - Slotted layout: field equality and pipeline bookkeeping attributes
 """
 
 from __future__ import annotations
 
+import sys
+
 import pytest
 
 from src.utils.instruction import (
@@ -26,6 +29,7 @@ from src.utils.instruction import (
     InstructionBundle,
     InstructionStatus,
     InstructionType,
+    _decode,
 )
 
 # ---------------------------------------------------------------------------
@@ -154,6 +158,22 @@ class TestRegisterExtraction:
         assert "$3" in sources
         assert "$2" in sources
 
+    def test_load_source_is_base_register(self) -> None:
+        inst = Instruction(address=0, opcode="LW", operands=["$2", "12($29)"])
+        assert inst.get_source_registers() == ["$29"]
+
+    def test_memory_operand_parsed(self) -> None:
+        inst = Instruction(address=0, opcode="SW", operands=["$3", "-8($2)"])
+        assert inst.get_memory_operand() == (-8, "$2")
+
+    def test_memory_operand_empty_offset(self) -> None:
+        inst = Instruction(address=0, opcode="LW", operands=["$3", "($sp)"])
+        assert inst.get_memory_operand() == (0, "$sp")
+
+    def test_memory_operand_absent_for_alu(self) -> None:
+        inst = Instruction(address=0, opcode="ADD", operands=["$8", "$9", "$10"])
+        assert inst.get_memory_operand() == (None, None)
+
     def test_branch_sources(self) -> None:
         inst = Instruction(address=0, opcode="BEQ", operands=["$4", "$5", -3])
         sources = inst.get_source_registers()
@@ -168,6 +188,58 @@ class TestRegisterExtraction:
         inst = Instruction(address=0, opcode="J", operands=[0x1000])
         assert not inst.has_destination_register()
 
+    def test_explicit_type_decides_destination(self) -> None:
+        inst = Instruction(
+            address=0,
+            opcode="ADD",
+            operands=["$4", "$5", "$6"],
+            instruction_type=InstructionType.JUMP,
+        )
+        assert not inst.has_destination_register()
+
+    def test_reads_register(self) -> None:
+        store = Instruction(address=0, opcode="SW", operands=["$4", "8($5)"])
+        assert store.reads_register("$4")
+        assert store.reads_register("$5")
+        assert not store.reads_register("8($5)")
+        assert not store.reads_register(None)
+
+    def test_identical_instructions_decoded_once(self) -> None:
+        _decode.cache_clear()
+        first = Instruction(address=0, opcode="LW", operands=["$2", "12($29)"])
+        second = Instruction(address=8, opcode="LW", operands=["$2", "12($29)"])
+        assert _decode.cache_info().hits == 1
+        assert second.get_source_registers() == ["$29"]
+        assert first.get_source_registers() is not second.get_source_registers()
+
+    def test_unhashable_operand_decoded_without_cache(self) -> None:
+        inst = Instruction(address=0, opcode="ADD", operands=["$8", "$9", ["$10"]])
+        assert inst.get_destination_register() == "$8"
+        assert inst.get_source_registers() == ["$9", ["$10"]]
+        assert inst.reads_register("$9")
+        assert not inst.reads_register("$8")
+
+    def test_register_operands_interned(self) -> None:
+        operands = ["".join(["$", "8"]), "".join(["$", "9"]), "#4"]
+        inst = Instruction(address=0, opcode="ADDI", operands=operands)
+        assert inst.operands is operands
+        assert inst.operands[0] is sys.intern("$8")
+        assert inst.operands[1] is sys.intern("$9")
+
+    def test_numeric_operands_keep_their_type(self) -> None:
+        """1, 1.0 and True are equal as cache keys but must not be swapped."""
+        for value in (1, 1.0, True):
+            inst = Instruction(address=0, opcode="ADD", operands=["$8", "$9", value])
+            assert type(inst.operands[2]) is type(value)
+            assert type(inst.get_source_registers()[1]) is type(value)
+
+    def test_tuple_operands_accepted(self) -> None:
+        operands = ("$8", "$9", "$10")
+        inst = Instruction(address=0, opcode="ADD", operands=operands)  # type: ignore[arg-type]
+        assert inst.operands is operands
+        assert inst.get_destination_register() == "$8"
+        assert inst.get_source_registers() == ["$9", "$10"]
+
 
 # ========================== Type Queries ===================================
 
@@ -364,6 +436,58 @@ class TestInstructionRepr:
         assert "$2" in text
 
 
+# ========================== Slotted Layout ==================================
+
+
+class TestInstructionSlots:
+    """Instructions use __slots__ but keep dataclass-style equality."""
+
+    def test_no_instance_dict(self) -> None:
+        inst = Instruction(address=0, opcode="ADD", operands=["$1", "$2", "$3"])
+        assert not hasattr(inst, "__dict__")
+
+    def test_unknown_attribute_rejected(self) -> None:
+        inst = Instruction(address=0, opcode="ADD", operands=["$1", "$2", "$3"])
+        with pytest.raises(AttributeError):
+            inst.not_a_field = 1  # type: ignore[attr-defined]
+
+    def test_bookkeeping_attributes_unset_by_default(self) -> None:
+        inst = Instruction(address=0, opcode="ADD", operands=["$1", "$2", "$3"])
+        assert not hasattr(inst, "forwarded_values")
+        inst.forwarded_values = {"$2": 7}
+        assert inst.forwarded_values == {"$2": 7}
+
+    def test_field_equality(self) -> None:
+        a = Instruction(address=4, opcode="add", operands=["$1", "$2", "$3"])
+        b = Instruction(address=4, opcode="ADD", operands=["$1", "$2", "$3"])
+        c = Instruction(address=8, opcode="ADD", operands=["$1", "$2", "$3"])
+        assert a == b
+        assert a != c
+
+    def test_source_registers_parsed_once(self) -> None:
+        inst = Instruction(address=0, opcode="SW", operands=["$8", "4($29)"])
+        assert inst.get_source_registers() is inst.get_source_registers()
+
+    def test_register_names_interned(self) -> None:
+        base = "".join(["$", "29"])
+        inst = Instruction(address=0, opcode="ADD", operands=["$8", base, "$10"])
+        assert inst.get_source_registers()[0] is sys.intern("$29")
+
+    def test_str_cached_after_first_use(self) -> None:
+        inst = Instruction(address=0, opcode="ADD", operands=["$1", "$2", "$3"])
+        twin = Instruction(address=0, opcode="ADD", operands=["$1", "$2", "$3"])
+        first = str(inst)
+        assert first == str(twin)
+        assert str(inst) is first
+        assert repr(inst) == "Instruction(PC=0x0, ADD $1, $2, $3)"
+
+    def test_default_containers_not_shared(self) -> None:
+        a = Instruction(address=0, opcode="NOP")
+        b = Instruction(address=4, opcode="NOP")
+        assert a.operands is not b.operands
+        assert a.prediction_info is not b.prediction_info
+
+
 # ========================== BranchInstruction ===============================
 
 
@@ -396,6 +520,18 @@ class TestBranchInstruction:
         )
         assert bi.get_target_address() == 0x2000
 
+    def test_jump_target_integer_operand(self) -> None:
+        bi = BranchInstruction(address=0x1000, opcode="JAL", operands=[0x40])
+        assert bi.get_target_address() == 0x40
+
+    def test_unresolved_label_leaves_target_unset(self) -> None:
+        jump = BranchInstruction(address=0x1000, opcode="J", operands=["loop"])
+        branch = BranchInstruction(
+            address=0x1000, opcode="BNE", operands=["$1", "$2", "loop"]
+        )
+        assert jump.get_target_address() is None
+        assert branch.get_target_address() is None
+
     def test_explicit_target_overrides_calculation(self) -> None:
         bi = BranchInstruction(
             address=0x1000,
@@ -496,6 +632,33 @@ class TestInstructionBundle:
         deps = bundle.get_dependencies()
         assert len(deps) == 0
 
+    def test_get_dependencies_ordered_by_producer_then_consumer(self) -> None:
+        bundle = self._make_bundle(
+            [
+                ("ADD", ["$8", "$9", "$10"]),
+                ("ADD", ["$8", "$8", "$8"]),
+                ("SUB", ["$11", "$8", "$12"]),
+                ("SW", ["$8", "0($11)"]),
+            ]
+        )
+        assert bundle.get_dependencies() == [
+            (0, 1),
+            (0, 2),
+            (0, 3),
+            (1, 2),
+            (1, 3),
+            (2, 3),
+        ]
+
+    def test_get_dependencies_cached(self) -> None:
+        bundle = self._make_bundle(
+            [
+                ("ADD", ["$8", "$9", "$10"]),
+                ("SUB", ["$11", "$8", "$12"]),
+            ]
+        )
+        assert bundle.get_dependencies() is bundle.get_dependencies()
+
     def test_repr_includes_size_and_cycle(self) -> None:
         bundle = self._make_bundle([("ADD", ["$1", "$2", "$3"])])
         text = repr(bundle)
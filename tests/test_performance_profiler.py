@@ -14,6 +14,7 @@ import tempfile
 import pytest
 
 from src.performance.profiler import (
+    _LATENCY_WINDOW,
     CycleSnapshot,
     PerformanceMetrics,
     PerformanceOptimizer,
@@ -131,7 +132,16 @@ class TestInstructionTracking:
     def test_latency_recorded(self, profiler: PerformanceProfiler) -> None:
         profiler.record_instruction_complete("LW $4, 0($5)", 2, 10)
         latencies = profiler.instruction_latencies["LW $4, 0($5)"]
-        assert latencies == [8]
+        assert list(latencies) == [8]
+
+    def test_latency_samples_bounded(self, profiler: PerformanceProfiler) -> None:
+        for cycle in range(5000):
+            profiler.record_instruction_complete("ADD $1, $2, $3", 0, cycle)
+        latencies = profiler.instruction_latencies["ADD $1, $2, $3"]
+        assert len(latencies) == _LATENCY_WINDOW
+        assert latencies[0] == 5000 - _LATENCY_WINDOW
+        assert latencies[-1] == 4999
+        assert profiler.instruction_counts["ADD $1, $2, $3"] == 5000
 
     def test_arithmetic_classification(self, profiler: PerformanceProfiler) -> None:
         profiler.record_instruction_complete("ADD $1, $2, $3", 1, 2)
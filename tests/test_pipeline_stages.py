@@ -11,6 +11,8 @@ import pytest
 from src.cache.cache import DataCache, InstructionCache, Memory
 from src.pipeline.decode_stage import DecodeStage
 from src.pipeline.execute_stage import ExecuteStage, OutOfOrderExecuteStage
+from src.pipeline.fetch_stage import FetchStage
+from src.pipeline.issue_stage import IssueStage
 from src.pipeline.memory_access_stage import (
     AdvancedMemoryAccessStage,
     MemoryAccessStage,
@@ -21,7 +23,8 @@ from src.pipeline.write_back_stage import (
     WriteBackStage,
 )
 from src.register_file.register_file import RegisterFile
-from src.utils.instruction import Instruction
+from src.utils.functional_unit import ALU
+from src.utils.instruction import Instruction, InstructionType
 
 # ============================== Fixtures ====================================
 
@@ -46,6 +49,64 @@ def add_instruction() -> Instruction:
     return Instruction(address=0x1000, opcode="add", operands=["$t0", "$t1", "$t2"])
 
 
+# ============================ FetchStage ====================================
+
+
+class _FallThroughPredictor:
+    """Predictor that never redirects fetch."""
+
+    def predict(self, instruction: Instruction) -> None:
+        return None
+
+
+def _fetch_stage(memory: Memory, program: list[str]) -> FetchStage:
+    icache = InstructionCache(
+        cache_size=1024, block_size=64, memory=memory, fetch_bandwidth=4
+    )
+    fetch = FetchStage(icache, _FallThroughPredictor(), memory)
+    for i, line in enumerate(program):
+        icache.add_instruction(i * 4, fetch.parse_instruction_data(line))
+    return fetch
+
+
+class TestFetchStage:
+    """Fetch stage: bandwidth-limited fetch and PC advance."""
+
+    def test_fetch_limited_by_bandwidth(self, memory: Memory) -> None:
+        program = ["ADD $1 $2 $3" for _ in range(6)]
+        fetch = _fetch_stage(memory, program)
+        group = fetch.fetch()
+        assert [inst.address for inst in group] == [0, 4, 8, 12]
+        assert fetch.get_pc() == 16
+        assert [inst.address for inst in fetch.fetch()] == [16, 20]
+
+    def test_fetch_builds_instructions_from_cache(self, memory: Memory) -> None:
+        fetch = _fetch_stage(memory, ["ADD $1 $2 $3", "LW $4 0($5)"])
+        first, second = fetch.fetch()
+        assert (first.opcode, first.operands) == ("ADD", ["$1", "$2", "$3"])
+        assert (second.opcode, second.address) == ("LW", 4)
+
+    def test_misses_advance_pc(self, memory: Memory) -> None:
+        fetch = _fetch_stage(memory, [])
+        assert fetch.fetch() == []
+        assert fetch.get_pc() == 16
+
+    def test_invalid_entries_skipped(self, memory: Memory) -> None:
+        fetch = _fetch_stage(memory, ["ADD $1 $2 $3"])
+        fetch.instruction_cache.add_instruction(4, {"operands": ["$1"]})
+        fetch.instruction_cache.add_instruction(8, "ADD $1 $2 $3")
+        group = fetch.fetch()
+        assert [inst.address for inst in group] == [0]
+        assert fetch.get_pc() == 16
+
+    def test_parse_instruction_uses_given_pc(self, memory: Memory) -> None:
+        fetch = _fetch_stage(memory, [])
+        inst = fetch.parse_instruction({"opcode": "ADD", "operands": []}, 12)
+        assert inst.address == 12
+        assert fetch.parse_instruction({"opcode": "ADD"}).address == fetch.get_pc()
+        assert fetch.parse_instruction({"operands": []}) is None
+
+
 # ============================ DecodeStage ===================================
 
 
@@ -104,6 +165,69 @@ class TestDecodeStage:
         with pytest.raises(TypeError):
             DecodeStage("not a register file")  # type: ignore[arg-type]
 
+    @pytest.mark.parametrize(
+        ("operand", "expected"),
+        [
+            ("$t0", True),
+            ("$ra", True),
+            ("$zero", True),
+            ("$31", True),
+            ("r8", True),
+            ("$32", False),
+            ("$t10", False),
+            ("label", False),
+            (4, False),
+        ],
+    )
+    def test_is_register(
+        self, reg_file: RegisterFile, operand: str | int, expected: bool
+    ) -> None:
+        assert DecodeStage(reg_file).is_register(operand) is expected
+
+
+# ============================ IssueStage ====================================
+
+
+class TestIssueStage:
+    """Issue stage: dispatch into reservation stations and wake-up."""
+
+    def test_idle_stage_has_nothing_ready(self, reg_file: RegisterFile) -> None:
+        issue = IssueStage(4, reg_file, None)
+        assert issue.get_ready_instructions() == []
+        assert issue.get_statistics()["reservation_station_utilization"] == 0.0
+
+    def test_issued_instruction_dispatches_and_frees_station(
+        self, reg_file: RegisterFile, add_instruction: Instruction
+    ) -> None:
+        issue = IssueStage(4, reg_file, None)
+        assert issue.issue([add_instruction]) == [add_instruction]
+        assert issue.get_statistics()["reservation_station_utilization"] == 25.0
+        assert issue.get_ready_instructions() == [add_instruction]
+        assert issue.find_free_reservation_station() is not None
+        assert issue.get_statistics()["reservation_station_utilization"] == 0.0
+
+    def test_results_broadcast_drains_dependents(
+        self, reg_file: RegisterFile, add_instruction: Instruction
+    ) -> None:
+        issue = IssueStage(4, reg_file, None)
+        issue.issue([add_instruction])
+        producers = [
+            (Instruction(address=0x2000, opcode="sub", operands=[reg, "$s0", "$s1"]), 5)
+            for reg in ("$t1", "$t2")
+        ]
+        issue.update_reservation_stations(producers)
+        assert not issue._rs_pool._dependents
+        assert [op.value for op in issue.reservation_stations[0].operands] == [5, 5]
+
+    def test_reset_frees_all_stations(
+        self, reg_file: RegisterFile, add_instruction: Instruction
+    ) -> None:
+        issue = IssueStage(4, reg_file, None)
+        issue.issue([add_instruction])
+        issue.reset()
+        assert all(rs.is_free() for rs in issue.reservation_stations)
+        assert issue.get_ready_instructions() == []
+
 
 # ============================ ExecuteStage ==================================
 
@@ -153,6 +277,55 @@ class TestExecuteStage:
         stats = execute.get_statistics()
         assert "executed_instructions" in stats
 
+    def test_functional_units_use_slots(
+        self, reg_file: RegisterFile, data_cache: DataCache, memory: Memory
+    ) -> None:
+        execute = ExecuteStage(
+            num_alu_units=1,
+            num_fpu_units=1,
+            num_lsu_units=1,
+            register_file=reg_file,
+            data_cache=data_cache,
+            memory=memory,
+        )
+        for unit in execute.functional_units:
+            assert not hasattr(unit, "__dict__")
+
+    @pytest.mark.parametrize(
+        ("opcode", "expected"),
+        [
+            ("ADD", 17),
+            ("SUB", 11),
+            ("MUL", 42),
+            ("DIV", 4),
+            ("AND", 2),
+            ("OR", 15),
+            ("XOR", 13),
+            ("SLT", 0),
+            ("ADDI", 17),
+            ("SLTI", 0),
+        ],
+    )
+    def test_alu_operations(
+        self, reg_file: RegisterFile, opcode: str, expected: int
+    ) -> None:
+        reg_file.write_register("$t1", 14)
+        reg_file.write_register("$t2", 3)
+        operands = ["$t0", "$t1", "3" if opcode.endswith("I") else "$t2"]
+        inst = Instruction(address=0, opcode=opcode, operands=operands)
+        assert ALU(0)._perform_operation(inst, reg_file) == expected
+
+    def test_alu_divide_by_zero_raises(self, reg_file: RegisterFile) -> None:
+        inst = Instruction(address=0, opcode="DIV", operands=["$t0", "$t1", "$t2"])
+        with pytest.raises(ValueError, match="Division by zero"):
+            ALU(0)._perform_operation(inst, reg_file)
+
+    def test_can_execute_ignores_case(self) -> None:
+        alu = ALU(0)
+        assert alu.can_execute("ADD")
+        assert alu.can_execute("addi")
+        assert not alu.can_execute("LW")
+
 
 class TestOutOfOrderExecuteStage:
     """Out-of-order execute stage with instruction window."""
@@ -210,6 +383,40 @@ class TestMemoryAccessStage:
         mem_stage.reset()
         assert mem_stage.load_count == 0
 
+    def test_load_forwards_newest_buffered_store(
+        self, data_cache: DataCache, memory: Memory
+    ) -> None:
+        mem_stage = MemoryAccessStage(data_cache, memory)
+        store = Instruction(address=0, opcode="SW", operands=["$3", "16($0)"])
+        load = Instruction(address=4, opcode="LW", operands=["$4", "16($0)"])
+        mem_stage._handle_store(store, 5)
+        mem_stage._handle_store(store, 6)
+        assert mem_stage._handle_load(load, 16) == 6
+        mem_stage._flush_store_buffer(max_entries=8)
+        assert not mem_stage.store_buffer
+        assert not mem_stage._store_index
+
+    @pytest.mark.parametrize(
+        ("instruction_type", "expected"),
+        [(None, 0x1008), (InstructionType.LOAD, 0x1008)],
+    )
+    def test_calculate_address_from_offset_base(
+        self,
+        data_cache: DataCache,
+        memory: Memory,
+        instruction_type: InstructionType | None,
+        expected: int,
+    ) -> None:
+        mem_stage = MemoryAccessStage(data_cache, memory)
+        load = Instruction(
+            address=0,
+            opcode="LW",
+            operands=["$t0", "8($sp)"],
+            instruction_type=instruction_type,
+        )
+        load.register_values = {"$sp": 0x1000}
+        assert mem_stage._calculate_address(load) == expected
+
 
 class TestAdvancedMemoryAccessStage:
     """Enhanced memory access with disambiguation and prefetching."""
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Test suite for the pipeline, hazard and dashboard visualizers.
+
+Rendering runs on matplotlib's off-screen Agg backend; the suite is skipped
+when matplotlib is not installed.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from src.visualization.pipeline_visualizer import (  # noqa: E402
+    HazardVisualizer,
+    PipelineSnapshot,
+    PipelineVisualizer,
+    save_performance_dashboards,
+)
+
+# ============================== Fixtures ====================================
+
+
+def _snapshot(cycle: int) -> PipelineSnapshot:
+    """Snapshot with one instruction per stage, tagged with the cycle."""
+    return PipelineSnapshot(
+        cycle=cycle,
+        fetch=[f"PC={cycle}"],
+        decode=["ADD $1, $2, $3"],
+        issue=["NOP"],
+        execute=[],
+        memory=[],
+        writeback=[],
+        branch_prediction_accuracy=90.0,
+        ipc=1.5,
+        stalls=cycle // 2,
+        cache_hits=3,
+        cache_misses=1,
+    )
+
+
+@pytest.fixture
+def pipeline_visualizer() -> Iterator[PipelineVisualizer]:
+    """Pipeline visualizer whose figure is closed after the test."""
+    viz = PipelineVisualizer()
+    yield viz
+    plt.close(viz.fig)
+
+
+@pytest.fixture
+def hazard_visualizer() -> Iterator[HazardVisualizer]:
+    """Hazard visualizer whose figure is closed after the test."""
+    viz = HazardVisualizer()
+    yield viz
+    plt.close(viz.fig)
+
+
+# ============================== Hazard history ==============================
+
+
+class TestHazardHistory:
+    """Tests for HazardVisualizer's recorded hazard events."""
+
+    def test_add_hazard_shows_in_history(
+        self, hazard_visualizer: HazardVisualizer
+    ) -> None:
+        hazard_visualizer.add_hazard(3, "RAW", "ADD", "SUB", "Forwarding")
+        assert list(hazard_visualizer.hazard_history) == [
+            {
+                "cycle": 3,
+                "type": "RAW",
+                "source": "ADD",
+                "destination": "SUB",
+                "resolution": "Forwarding",
+            }
+        ]
+
+    def test_append_records_event(self, hazard_visualizer: HazardVisualizer) -> None:
+        event = {
+            "cycle": 7,
+            "type": "Custom",
+            "source": "LW",
+            "destination": "ADD",
+            "resolution": "Stall",
+        }
+        hazard_visualizer.hazard_history.append(event)
+        assert hazard_visualizer.hazard_history[-1] == event
+        report = hazard_visualizer.generate_hazard_report()
+        assert report["hazard_counts"] == {"Custom": 1}
+
+    def test_assignment_replaces_events(
+        self, hazard_visualizer: HazardVisualizer
+    ) -> None:
+        hazard_visualizer.add_hazard(1, "WAW", "A", "B", "Rename")
+        hazard_visualizer.add_hazard(2, "WAR", "C", "D", "Rename")
+        hazard_visualizer.hazard_history = hazard_visualizer.hazard_history[1:]
+        assert [e["cycle"] for e in hazard_visualizer.hazard_history] == [2]
+        hazard_visualizer.hazard_history.clear()
+        assert len(hazard_visualizer.hazard_history) == 0
+
+    def test_events_stored_column_wise(
+        self, hazard_visualizer: HazardVisualizer
+    ) -> None:
+        hazard_visualizer.add_hazard(1, "RAW", "A", "B", "Stall")
+        hazard_visualizer.add_hazard(2, "RAW", "C", "D", "Stall")
+        assert list(hazard_visualizer._cycles) == [1, 2]
+        assert list(hazard_visualizer._type_codes) == [0, 0]
+        assert list(hazard_visualizer._resolution_codes) == [0, 0]
+        assert hazard_visualizer._resolution_names == ["Stall"]
+
+    def test_many_distinct_resolutions(
+        self, hazard_visualizer: HazardVisualizer
+    ) -> None:
+        """Resolution codes are not limited to 16 bits."""
+        count = 70_000
+        for i in range(count):
+            hazard_visualizer.add_hazard(i, "WAR", "A", "B", f"Fix{i}")
+        assert hazard_visualizer.hazard_history[-1]["resolution"] == f"Fix{count - 1}"
+        report = hazard_visualizer.generate_hazard_report()
+        assert len(report["resolution_methods"]) == count
+
+
+# ============================== Hazard report ===============================
+
+
+class TestHazardReport:
+    """Tests for HazardVisualizer.generate_hazard_report."""
+
+    def test_empty_report(self, hazard_visualizer: HazardVisualizer) -> None:
+        assert hazard_visualizer.generate_hazard_report() == {
+            "error": "No hazard data available"
+        }
+
+    def test_counts_by_type_and_resolution(
+        self, hazard_visualizer: HazardVisualizer
+    ) -> None:
+        hazard_visualizer.add_hazard(10, "RAW", "A", "B", "Forwarding")
+        hazard_visualizer.add_hazard(12, "RAW", "C", "D", "Stall")
+        hazard_visualizer.add_hazard(13, "RAW", "E", "F", "Forwarding")
+        hazard_visualizer.add_hazard(19, "Control", "BEQ", "IF", "Flush")
+        report = hazard_visualizer.generate_hazard_report()
+        assert report["total_hazards"] == 4
+        assert report["hazards_per_cycle"] == pytest.approx(0.4)
+        assert report["hazard_counts"] == {"RAW": 3, "Control": 1}
+        assert report["resolution_methods"] == {
+            "RAW_Forwarding": 2,
+            "RAW_Stall": 1,
+            "Control_Flush": 1,
+        }
+        assert report["most_common_hazard"] == "RAW"
+        assert report["cycle_range"] == (10, 19)
+
+
+# ============================== Pipeline visualizer =========================
+
+
+class TestPipelineVisualizer:
+    """Tests for the live view and replay of PipelineVisualizer."""
+
+    def test_metric_history_keeps_newest_window(
+        self, pipeline_visualizer: PipelineVisualizer
+    ) -> None:
+        length = pipeline_visualizer.history_length
+        total = length * 2 + 7
+        for cycle in range(total):
+            pipeline_visualizer.update(_snapshot(cycle))
+            if cycle % 37 == 0:
+                pipeline_visualizer._animate(cycle)
+        pipeline_visualizer._animate(total)
+        cycles = list(pipeline_visualizer._ipc_line.get_xdata())
+        assert cycles == list(range(total - length, total))
+        assert set(pipeline_visualizer._cache_line.get_ydata()) == {75.0}
+        assert not pipeline_visualizer.update_queue
+
+    def test_live_view_shows_newest_snapshot(
+        self, pipeline_visualizer: PipelineVisualizer
+    ) -> None:
+        pipeline_visualizer.update(_snapshot(1))
+        pipeline_visualizer.update(_snapshot(2))
+        pipeline_visualizer._animate(0)
+        assert pipeline_visualizer._stage_texts["Fetch"].get_text() == "PC=2"
+        assert pipeline_visualizer._stage_texts["Issue"].get_text() == ""
+        assert pipeline_visualizer._stats_text.get_text().startswith("Cycle: 2 |")
+
+    def test_replay_restores_live_artists(
+        self, pipeline_visualizer: PipelineVisualizer, tmp_path: Path
+    ) -> None:
+        snapshots = [_snapshot(cycle) for cycle in range(5)]
+        pipeline_visualizer.replay(snapshots, interval=10)
+        pipeline_visualizer.animation.save(tmp_path / "replay.gif", writer="pillow")
+
+        live = pipeline_visualizer._animated_artists()
+        assert all(artist.get_visible() for artist in live)
+        assert pipeline_visualizer._stage_texts["Fetch"].get_text() == "PC=4"
+        assert list(pipeline_visualizer._ipc_line.get_xdata()) == list(range(5))
+        replayed = pipeline_visualizer._replay_artists
+        assert replayed
+        assert not any(artist.get_visible() for artist in replayed)
+
+    def test_replay_drops_earlier_frames(
+        self, pipeline_visualizer: PipelineVisualizer
+    ) -> None:
+        pipeline_visualizer.replay([_snapshot(cycle) for cycle in range(4)])
+        first = list(pipeline_visualizer._replay_artists)
+        pipeline_visualizer.replay([_snapshot(cycle) for cycle in range(3)])
+        assert all(artist.axes is None for artist in first)
+        assert len(pipeline_visualizer._replay_artists) == 2 * len(first) // 3
+
+    def test_snapshot_stages_are_tuples(self) -> None:
+        snapshot = _snapshot(3)
+        assert snapshot.fetch == ("PC=3",)
+        assert snapshot.stages[1] == ("ADD $1, $2, $3",)
+
+
+# ============================== Dashboards ==================================
+
+
+class TestDashboards:
+    """Tests for saving performance dashboards."""
+
+    _STATS = {
+        "cycles": [0, 1, 2],
+        "ipc_history": [0.5, 1.0, 1.5],
+        "branch_accuracy_history": [80.0, 85.0, 90.0],
+        "cache_hits": 9,
+        "cache_misses": 1,
+        "fu_utilization": {"ALU": 60.0, "FPU": 10.0},
+        "instruction_mix": {"ALU": 6, "LOAD": 3, "BRANCH": 1},
+        "stall_types": {"data": 4, "control": 2},
+    }
+
+    def test_parallel_dashboards_written(self, tmp_path: Path) -> None:
+        outputs = [str(tmp_path / f"dashboard{i}.png") for i in range(2)]
+        save_performance_dashboards([self._STATS, {}], outputs, max_workers=2)
+        for output in outputs:
+            assert Path(output).stat().st_size > 0
+
+    def test_single_dashboard_rendered_inline(self, tmp_path: Path) -> None:
+        output = tmp_path / "dashboard.png"
+        save_performance_dashboards([self._STATS], [str(output)])
+        assert output.stat().st_size > 0
+
+    def test_mismatched_lengths_rejected(self) -> None:
+        with pytest.raises(ValueError, match="same length"):
+            save_performance_dashboards([self._STATS], [])
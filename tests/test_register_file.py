@@ -83,6 +83,16 @@ class TestRegisterFileBasics:
         with pytest.raises(ValueError):
             reg_file.read_register(99)
 
+    def test_register_spellings_share_storage(self, reg_file: RegisterFile) -> None:
+        """Names, r<N>, numeric strings, padded numbers and ints all agree."""
+        reg_file.write_register("r08", 5)
+        for spelling in ("$t0", "$8", "r8", "8", 8):
+            assert reg_file.read_register(spelling) == 5
+
+    def test_invalid_register_type_raises(self, reg_file: RegisterFile) -> None:
+        with pytest.raises(TypeError):
+            reg_file.write_register(["$t0"], 1)  # type: ignore[arg-type]
+
 
 class TestRegisterFileMultiPort:
     """Multi-port read and write operations."""
@@ -104,6 +114,13 @@ class TestRegisterFileMultiPort:
         # Third write may be dropped due to write port conflict
         # (depends on implementation — checking it doesn't crash)
 
+    def test_read_multiple_mixed_names(self, reg_file: RegisterFile) -> None:
+        """Ports accept any register spelling; $zero reads are not counted."""
+        reg_file.write_register("$t0", 5)
+        reads = reg_file.read_count
+        assert reg_file.read_multiple(["$t0", "r8", "$zero", "08"]) == [5, 5, 0, 5]
+        assert reg_file.read_count == reads + 3
+
     def test_read_multiple_empty_list(self, reg_file: RegisterFile) -> None:
         """Reading an empty list should return an empty list."""
         assert reg_file.read_multiple([]) == []
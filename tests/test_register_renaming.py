@@ -242,6 +242,19 @@ class TestEnhancedRegisterRenaming:
         # One physical register should have been allocated
         assert len(enhanced_renaming.free_list) == initial_free - 1
 
+    def test_physical_ready_bits_track_pending_results(
+        self, enhanced_renaming: EnhancedRegisterRenaming
+    ) -> None:
+        """A renamed destination is not ready until its result completes."""
+        inst = Instruction(address=0x1000, opcode="add", operands=["$t0", "$t1", "$t2"])
+        rob_id = enhanced_renaming.rename_instruction(inst)
+        physical = enhanced_renaming.rob[rob_id].physical_dest
+        ready = enhanced_renaming.physical_reg_ready
+        assert ready.count(0) == 1 and ready[physical] == 0
+
+        enhanced_renaming.complete_instruction(rob_id, result=1, exception=None)
+        assert ready[physical] == 1
+
     def test_branch_misprediction_squashes_younger(
         self, enhanced_renaming: EnhancedRegisterRenaming
     ) -> None:
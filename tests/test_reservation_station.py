@@ -0,0 +1,232 @@
+"""
+tests/test_reservation_station.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Unit tests for the Tomasulo reservation stations defined in
+``src/utils/reservation_station.py``.
+
+What's tested:
+  - Issuing an instruction builds one OperandInfo per source register
+  - Broadcast results wake up waiting operands
+  - Operands resolved from the register file on dispatch
+  - Pool free-list bookkeeping: find/issue/release and utilization
+  - Pool flush squashes in-flight stations without reallocating
+  - Result push to subscribed stations across the pool
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from src.utils.instruction import Instruction
+from src.utils.reservation_station import ReservationStation, ReservationStationPool
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _FakeRegisterFile:
+    """Stand-in for RegisterFile that returns pre-set values."""
+
+    def __init__(self, values: dict[str, int]) -> None:
+        self._values = values
+        self.reads = 0
+
+    def read_register(self, reg: str) -> int:
+        self.reads += 1
+        return self._values.get(reg, 0)
+
+
+def _add(dest: str = "$1", src1: str = "$2", src2: str = "$3") -> Instruction:
+    return Instruction(address=0, opcode="ADD", operands=[dest, src1, src2])
+
+
+# ============================== Fixtures ===================================
+
+
+@pytest.fixture
+def pool() -> ReservationStationPool:
+    return ReservationStationPool(num_stations=4)
+
+
+# ========================== ReservationStation =============================
+
+
+class TestReservationStation:
+    """Single station issue / wake-up / dispatch cycle."""
+
+    def test_issue_creates_operand_per_source(self) -> None:
+        rs = ReservationStation(0)
+        rs.issue(_add())
+        assert rs.busy
+        assert [op.register_name for op in rs.operands] == ["$2", "$3"]
+
+    def test_operand_records_reused_across_issues(self) -> None:
+        rs = ReservationStation(0)
+        rs.issue(_add())
+        first = list(rs.operands)
+        rs.get_ready_instruction(_FakeRegisterFile({}), None)
+        rs.issue(_add(src1="$4", src2="$5"))
+        assert all(a is b for a, b in zip(first, rs.operands, strict=True))
+        assert [op.register_name for op in rs.operands] == ["$4", "$5"]
+        assert not any(op.ready for op in rs.operands)
+
+    def test_station_uses_slots(self) -> None:
+        rs = ReservationStation(0)
+        assert not hasattr(rs, "__dict__")
+        with pytest.raises(AttributeError):
+            rs.unknown = 1  # type: ignore[attr-defined]
+
+    def test_issue_when_busy_raises(self) -> None:
+        rs = ReservationStation(0)
+        rs.issue(_add())
+        with pytest.raises(RuntimeError):
+            rs.issue(_add())
+
+    def test_update_marks_matching_operand_ready(self) -> None:
+        rs = ReservationStation(0)
+        rs.issue(_add())
+        producer = Instruction(address=4, opcode="SUB", operands=["$2", "$4", "$5"])
+        rs.update([(producer, 42)])
+        assert rs.operands[0].ready
+        assert rs.operands[0].value == 42
+        assert not rs.operands[1].ready
+
+    def test_update_wakes_all_operands_on_same_register(self) -> None:
+        rs = ReservationStation(0)
+        rs.issue(_add(src1="$2", src2="$2"))
+        producer = Instruction(address=4, opcode="SUB", operands=["$2", "$4", "$5"])
+        rs.update([(producer, 7)])
+        assert [op.value for op in rs.operands] == [7, 7]
+        assert rs.ready_for_execution
+
+    def test_update_ignores_unrelated_results(self) -> None:
+        rs = ReservationStation(0)
+        rs.issue(_add())
+        producer = Instruction(address=4, opcode="SUB", operands=["$9", "$4", "$5"])
+        store = Instruction(address=8, opcode="SW", operands=["$2", "0($3)"])
+        rs.update([(producer, 1), (store, 2), (None, 3)])
+        assert not any(op.ready for op in rs.operands)
+        assert not rs.ready_for_execution
+
+    def test_get_ready_instruction_resolves_and_clears(self) -> None:
+        rs = ReservationStation(0)
+        inst = _add()
+        rs.issue(inst)
+        ready = rs.get_ready_instruction(_FakeRegisterFile({"$2": 5, "$3": 6}), None)
+        assert ready is inst
+        assert inst.resolved_operands == {"$2": 5, "$3": 6}
+        assert rs.is_free()
+
+    def test_woken_station_dispatches_without_lookups(self) -> None:
+        rs = ReservationStation(0)
+        inst = _add(src1="$2", src2="$2")
+        rs.issue(inst)
+        producer = Instruction(address=4, opcode="SUB", operands=["$2", "$4", "$5"])
+        rs.update([(producer, 8)])
+        regfile = _FakeRegisterFile({})
+        assert rs.get_ready_instruction(regfile, None) is inst
+        assert regfile.reads == 0
+
+
+# ========================== ReservationStationPool =========================
+
+
+class TestReservationStationPool:
+    """Free-list management and utilization tracking."""
+
+    def test_all_stations_free_initially(self, pool: ReservationStationPool) -> None:
+        assert pool.find_free_station() is pool.stations[0]
+        assert pool.get_utilization() == 0.0
+
+    def test_issue_consumes_free_station(self, pool: ReservationStationPool) -> None:
+        assert pool.issue_instruction(_add())
+        assert pool.stations[0].busy
+        assert pool.find_free_station() is pool.stations[1]
+        assert pool.get_utilization() == 25.0
+
+    def test_issue_fails_when_full(self, pool: ReservationStationPool) -> None:
+        for _ in range(4):
+            assert pool.issue_instruction(_add())
+        assert pool.find_free_station() is None
+        assert not pool.issue_instruction(_add())
+        assert pool.get_statistics()["busy_stations"] == 4
+
+    def test_dispatch_returns_station_to_free_list(
+        self, pool: ReservationStationPool
+    ) -> None:
+        for _ in range(4):
+            pool.issue_instruction(_add())
+        ready = pool.get_ready_instructions(_FakeRegisterFile({}), None)
+        assert len(ready) == 4
+        assert pool.get_utilization() == 0.0
+        assert pool.issue_instruction(_add())
+
+    def test_update_all_wakes_busy_stations(self, pool: ReservationStationPool) -> None:
+        pool.issue_instruction(_add(src1="$2", src2="$3"))
+        pool.issue_instruction(_add(src1="$3", src2="$4"))
+        first = Instruction(address=4, opcode="SUB", operands=["$3", "$6", "$7"])
+        second = Instruction(address=8, opcode="ADD", operands=["$3", "$6", "$7"])
+        pool.update_all([(first, 11), (second, 22)])
+        assert pool.stations[0].operands[1].value == 11
+        assert pool.stations[1].operands[0].value == 11
+        assert not pool.stations[0].ready_for_execution
+
+    def test_direct_station_issue_is_tracked(
+        self, pool: ReservationStationPool
+    ) -> None:
+        pool.stations[2].issue(_add())
+        assert pool.get_statistics()["busy_stations"] == 1
+        pool.stations[2].reset()
+        assert pool.get_utilization() == 0.0
+
+    def test_busy_stations_in_issue_order(self, pool: ReservationStationPool) -> None:
+        pool.stations[2].issue(_add())
+        pool.issue_instruction(_add())
+        assert pool.busy_stations() == [pool.stations[2], pool.stations[0]]
+        pool.stations[2].reset()
+        assert pool.busy_stations() == [pool.stations[0]]
+
+    def test_reset_all_frees_every_station(self, pool: ReservationStationPool) -> None:
+        pool.issue_instruction(_add())
+        pool.issue_instruction(_add())
+        pool.reset_all()
+        assert pool.get_utilization() == 0.0
+        assert repr(pool) == "RSPool(0/4 busy)"
+
+    def test_flush_frees_busy_stations_keeping_stats(
+        self, pool: ReservationStationPool
+    ) -> None:
+        stations = list(pool.stations)
+        pool.issue_instruction(_add())
+        pool.issue_instruction(_add())
+        pool.flush()
+        assert pool.stations == stations
+        assert pool.get_utilization() == 0.0
+        assert not pool._dependents
+        assert pool.total_issues == 2
+        assert pool.issue_instruction(_add())
+
+    def test_update_all_skips_unsubscribed_stations(
+        self, pool: ReservationStationPool
+    ) -> None:
+        pool.issue_instruction(_add(src1="$2", src2="$3"))
+        pool.issue_instruction(_add(src1="$4", src2="$5"))
+        assert set(pool._dependents) == {"$2", "$3", "$4", "$5"}
+        producer = Instruction(address=4, opcode="SUB", operands=["$2", "$6", "$7"])
+        pool.update_all([(producer, 3)])
+        assert "$2" not in pool._dependents
+        assert pool.stations[0].operands[0].value == 3
+        assert not any(op.ready for op in pool.stations[1].operands)
+
+    def test_stale_subscription_does_not_wake_new_instruction(
+        self, pool: ReservationStationPool
+    ) -> None:
+        pool.issue_instruction(_add(src1="$2", src2="$3"))
+        pool.get_ready_instructions(_FakeRegisterFile({}), None)
+        pool.issue_instruction(_add(src1="$4", src2="$5"))
+        producer = Instruction(address=4, opcode="SUB", operands=["$2", "$6", "$7"])
+        pool.update_all([(producer, 3)])
+        assert not any(op.ready for op in pool.stations[1].operands)
+        assert not any(op.ready for op in pool.stations[0].operands)
@@ -9,37 +9,31 @@ hazard controller, power model) cooperate correctly.
 """
 
 from pathlib import Path
-import sys
 from typing import Any
 
 import pytest
 
-# main.py inserts src/ into sys.path; replicate that here so component imports work.
-_PROJECT_ROOT = Path(__file__).resolve().parent.parent
-_SRC_DIR = str(_PROJECT_ROOT / "src")
-if _SRC_DIR not in sys.path:
-    sys.path.insert(0, _SRC_DIR)
-
-from branch_prediction.bimodal_predictor import BimodalPredictor  # noqa: E402
-from branch_prediction.gshare_predictor import GsharePredictor  # noqa: E402
-from cache.cache import DataCache, InstructionCache, Memory  # noqa: E402
-from cache.enhanced_cache import MemoryHierarchy  # noqa: E402
-from data_forwarding.data_forwarding_unit import DataForwardingUnit  # noqa: E402
-from pipeline.decode_stage import DecodeStage  # noqa: E402
-from pipeline.execute_stage import ExecuteStage  # noqa: E402
-from pipeline.fetch_stage import FetchStage  # noqa: E402
-from pipeline.hazard_controller import HazardController  # noqa: E402
-from pipeline.issue_stage import IssueStage  # noqa: E402
-from pipeline.memory_access_stage import MemoryAccessStage  # noqa: E402
-from pipeline.write_back_stage import WriteBackStage  # noqa: E402
-from register_file.register_file import RegisterFile  # noqa: E402
-from register_file.register_renaming import AdvancedRegisterRenaming  # noqa: E402
-from utils.execution_engine import CycleAccurateExecutionEngine  # noqa: E402
-from utils.instruction import Instruction, InstructionType  # noqa: E402
-from utils.scoreboard import Scoreboard  # noqa: E402
+from src.branch_prediction.bimodal_predictor import BimodalPredictor
+from src.branch_prediction.gshare_predictor import GsharePredictor
+from src.cache.cache import DataCache, InstructionCache, Memory
+from src.cache.enhanced_cache import MemoryHierarchy
+from src.data_forwarding.data_forwarding_unit import DataForwardingUnit
+from src.pipeline.decode_stage import DecodeStage
+from src.pipeline.execute_stage import ExecuteStage
+from src.pipeline.fetch_stage import FetchStage
+from src.pipeline.hazard_controller import HazardController
+from src.pipeline.issue_stage import IssueStage
+from src.pipeline.memory_access_stage import MemoryAccessStage
+from src.pipeline.write_back_stage import WriteBackStage
+from src.register_file.register_file import RegisterFile
+from src.register_file.register_renaming import AdvancedRegisterRenaming
+from src.utils.execution_engine import CycleAccurateExecutionEngine
+from src.utils.instruction import Instruction, InstructionType
+from src.utils.scoreboard import Scoreboard
 
 # ============================== Helpers =====================================
 
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
 _SIMPLE_BENCHMARK = _PROJECT_ROOT / "benchmarks" / "simple_test.asm"
 _FIBONACCI_BENCHMARK = _PROJECT_ROOT / "benchmarks" / "simple_fibonacci.asm"
 _BASIC_OPS_BENCHMARK = _PROJECT_ROOT / "benchmarks" / "basic_operations.asm"
@@ -292,13 +286,11 @@ class TestDataForwardingIntegration:
         fwd.add_forwarding_path(
             from_stage="EXECUTE",
             to_stage="EXECUTE",
-            forwarding_condition=lambda instr: True,
             priority=1,
         )
         fwd.add_forwarding_path(
             from_stage="MEMORY",
             to_stage="EXECUTE",
-            forwarding_condition=lambda instr: True,
             priority=2,
         )
         # Paths were added without error
@@ -384,27 +376,20 @@ class TestFullPipelineSmoke:
     drains without exceptions.
     """
 
-    def test_pipeline_drain(self, pipeline_config: dict[str, Any]) -> None:
-        # --- Assemble components ---
-        mem = Memory(size=65536)
-        reg_file = RegisterFile(32)
-        d_cache = DataCache(cache_size=4096, block_size=64)
-        InstructionCache(cache_size=4096, block_size=64, memory=mem, fetch_bandwidth=4)
-        mem_hierarchy = MemoryHierarchy(
-            {
-                "cache_size": 4096,
-                "block_size": 64,
-                "associativity": 2,
-                "hit_latency": 1,
-                "miss_penalty": 10,
-            },
-            memory_latency=100,
-        )
-        BimodalPredictor(num_entries=512)
+    @pytest.mark.usefixtures("instruction_cache", "branch_predictor")
+    def test_pipeline_drain(
+        self,
+        pipeline_config: dict[str, Any],
+        memory: Memory,
+        register_file: RegisterFile,
+        data_cache: DataCache,
+        memory_hierarchy: MemoryHierarchy,
+    ) -> None:
+        # --- Assemble components (shared fixtures) ---
         DataForwardingUnit()
         hc = HazardController(pipeline_config["pipeline"])
         engine = CycleAccurateExecutionEngine(
-            reg_file, mem, d_cache, memory_hierarchy=mem_hierarchy
+            register_file, memory, data_cache, memory_hierarchy=memory_hierarchy
         )
 
         # --- Build a tiny program: ADD, ADD, NOP, SYSCALL ---